@@ -6,6 +6,8 @@ from easycv.errors.transforms import (
     UnsupportedArgumentError,
     MissingArgumentError,
     ValidatorError,
+    UnsupportedExportError,
+    UnsupportedSaveError,
 )
 from easycv.errors.io import (
     InvalidPathError,
@@ -41,4 +43,6 @@ __all__ = [
     "InvalidPipelineInputSource",
     "MissingArgumentError",
     "ValidatorError",
+    "UnsupportedExportError",
+    "UnsupportedSaveError",
 ]
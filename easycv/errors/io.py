@@ -7,7 +7,9 @@ class InvalidPathError(Exception):
 class ImageDownloadError(Exception):
     """Raised when downloading the image fails"""
 
-    pass
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
 
 
 class ImageDecodeError(Exception):
@@ -63,3 +63,25 @@ class InvalidSelectionError(Exception):
 
     def __init__(self, msg):
         super().__init__("Invalid selection. {}".format(msg))
+
+
+class UnsupportedExportError(Exception):
+    """Raised when a pipeline with a step that can't be exported is exported"""
+
+    def __init__(self, step, index=None):
+        if index is None:
+            msg = "Step "
+        else:
+            msg = "Step at index {} ".format(index)
+        super().__init__(msg + "can't be exported to a function: {}".format(step))
+
+
+class UnsupportedSaveError(Exception):
+    """Raised when a pipeline with a step that can't be saved is saved"""
+
+    def __init__(self, step, index=None):
+        if index is None:
+            msg = "Step "
+        else:
+            msg = "Step at index {} ".format(index)
+        super().__init__(msg + "can't be saved: {}".format(step))
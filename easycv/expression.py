@@ -0,0 +1,225 @@
+from numbers import Real
+
+import numpy as np
+
+import easycv.image
+
+# Number of values evaluated at once (per temporary array)
+CHUNK_SIZE = 1 << 18
+
+SYMBOLS = {
+    "add": "+",
+    "sub": "-",
+    "mul": "*",
+    "div": "/",
+    "lt": "<",
+    "le": "<=",
+    "gt": ">",
+    "ge": ">=",
+}
+
+COMPARISONS = {
+    "lt": np.less,
+    "le": np.less_equal,
+    "gt": np.greater,
+    "ge": np.greater_equal,
+}
+
+
+def _valid_operand(operand):
+    return isinstance(operand, (Operators, np.ndarray, Real))
+
+
+def _divide(a, b):
+    # Like OpenCV, dividing by zero gives zero
+    return np.divide(
+        a, b, out=np.zeros(np.broadcast(a, b).shape, dtype="float32"), where=b != 0
+    )
+
+
+OPERATIONS = {
+    "add": np.add,
+    "sub": np.subtract,
+    "mul": np.multiply,
+    "div": _divide,
+    "neg": np.negative,
+    "abs": np.abs,
+}
+
+
+class Operators:
+    """
+    Arithmetic (`+`, `-`, `*`, `/`, `abs` and unary `-`) and comparison (`<`, `<=`, `>` and \
+    `>=`) operators that build :class:`Expression` objects instead of computing the result. \
+    Operands can be images, expressions, arrays and numbers.
+    """
+
+    # Makes NumPy arrays and scalars defer to the reflected operators
+    __array_priority__ = 1000
+
+    def _binary(self, operation, other, reflected=False):
+        if not _valid_operand(other):
+            return NotImplemented
+        if reflected:
+            return Expression(operation, other, self)
+        return Expression(operation, self, other)
+
+    def __add__(self, other):
+        return self._binary("add", other)
+
+    def __radd__(self, other):
+        return self._binary("add", other, reflected=True)
+
+    def __sub__(self, other):
+        return self._binary("sub", other)
+
+    def __rsub__(self, other):
+        return self._binary("sub", other, reflected=True)
+
+    def __mul__(self, other):
+        return self._binary("mul", other)
+
+    def __rmul__(self, other):
+        return self._binary("mul", other, reflected=True)
+
+    def __truediv__(self, other):
+        return self._binary("div", other)
+
+    def __rtruediv__(self, other):
+        return self._binary("div", other, reflected=True)
+
+    def __lt__(self, other):
+        return self._binary("lt", other)
+
+    def __le__(self, other):
+        return self._binary("le", other)
+
+    def __gt__(self, other):
+        return self._binary("gt", other)
+
+    def __ge__(self, other):
+        return self._binary("ge", other)
+
+    def __neg__(self):
+        return Expression("neg", self)
+
+    def __abs__(self):
+        return Expression("abs", self)
+
+
+class Expression(Operators):
+    """
+    This class represents a lazy elementwise expression over images (e.g. \
+    `a * 0.7 + b * 0.3` or `abs(a - b) > 30`), built with the operators of \
+    :class:`~easycv.image.Image`. Nothing is computed until :meth:`compute` is called, then \
+    the whole expression is evaluated in a single pass over blocks of rows, so temporaries \
+    only take the size of a block and the result is written into a preallocated array.
+
+    Operations follow OpenCV semantics: if all the images of an operation are `uint8` the \
+    result is `uint8`, rounded and saturated to [0, 255] (like :func:`cv2.add`, \
+    :func:`cv2.multiply`...), otherwise it is `float32`. The absolute value of a difference \
+    is computed without saturating the difference (like :func:`cv2.absdiff`), dividing by zero \
+    gives zero and comparisons give masks where true is 255 (like :func:`cv2.compare`).
+
+    :param operation: Name of the operation
+    :type operation: :class:`str`
+    :param operands: Operands (images, expressions, arrays or numbers)
+    :type operands: :class:`list`
+    """
+
+    def __init__(self, operation, *operands):
+        self._operation = operation
+        self._operands = operands
+
+    def _arrays(self, arrays):
+        """
+        Collects the arrays of all the images/arrays of the expression, by id.
+        """
+        for operand in self._operands:
+            if isinstance(operand, Expression):
+                operand._arrays(arrays)
+            elif isinstance(operand, easycv.image.Image):
+                arrays[id(operand)] = operand.array
+            elif isinstance(operand, np.ndarray):
+                arrays[id(operand)] = operand
+        return arrays
+
+    def _saturates(self, arrays):
+        """
+        Returns `True` if the result of the operation is `uint8`.
+        """
+        if self._operation in COMPARISONS:
+            return True
+        for operand in self._operands:
+            if isinstance(operand, Expression):
+                if not operand._saturates(arrays):
+                    return False
+            elif (
+                not isinstance(operand, Real) and arrays[id(operand)].dtype != np.uint8
+            ):
+                return False
+        return True
+
+    def _evaluate(self, arrays, rows, saturate=True):
+        values = []
+        for operand in self._operands:
+            if isinstance(operand, Expression):
+                # The absolute difference isn't saturated before the absolute value
+                raw = self._operation == "abs" and operand._operation == "sub"
+                values.append(operand._evaluate(arrays, rows, saturate=not raw))
+            elif isinstance(operand, Real):
+                values.append(np.float32(operand))
+            else:
+                values.append(arrays[id(operand)][rows].astype("float32"))
+
+        if self._operation in COMPARISONS:
+            return COMPARISONS[self._operation](*values).astype("float32") * 255
+
+        result = np.asarray(OPERATIONS[self._operation](*values), dtype="float32")
+        if saturate and self._saturates(arrays):
+            result = np.clip(np.rint(result), 0, 255)
+        return result
+
+    def compute(self):
+        """
+        Evaluates the expression.
+
+        :return: Image with the result
+        :rtype: :class:`~easycv.image.Image`
+        """
+        arrays = self._arrays({})
+        shapes = {array.shape for array in arrays.values()}
+        if len(shapes) != 1:
+            raise ValueError("Images of an expression must have the same shape.")
+        shape = shapes.pop()
+
+        dtype = "uint8" if self._saturates(arrays) else "float32"
+        output = np.empty(shape, dtype=dtype)
+        step = max(1, CHUNK_SIZE // max(1, int(np.prod(shape[1:]))))
+        for start in range(0, shape[0], step):
+            rows = slice(start, start + step)
+            output[rows] = np.broadcast_to(
+                self._evaluate(arrays, rows), output[rows].shape
+            )
+        return easycv.image.Image._from_array(output)
+
+    @property
+    def array(self):
+        """
+        Evaluates the expression and returns the result as an array.
+
+        :return: Result as NumPy array
+        :rtype: :class:`~numpy:numpy.ndarray`
+        """
+        return self.compute().array
+
+    def __repr__(self):
+        operands = [
+            repr(operand) if isinstance(operand, (Expression, Real)) else "image"
+            for operand in self._operands
+        ]
+        if self._operation == "neg":
+            return "-{}".format(operands[0])
+        if self._operation == "abs":
+            return "abs({})".format(operands[0])
+        return "({} {} {})".format(operands[0], SYMBOLS[self._operation], operands[1])
@@ -0,0 +1,395 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import combinations
+
+import cv2
+import numpy as np
+
+from easycv.errors.transforms import InvalidMethodError
+
+
+def _grayscale(image_array):
+    if len(image_array.shape) == 3:
+        return cv2.cvtColor(image_array, cv2.COLOR_BGR2GRAY)
+    return image_array
+
+
+def dhash(image_array, hash_size=8):
+    """
+    Difference hash. Compares each pixel of a grayscale thumbnail with the one to its right.
+
+    :param image_array: Image as an array
+    :type image_array: :class:`~numpy:numpy.ndarray`
+    :param hash_size: Square root of the number of bits of the hash, defaults to 8
+    :type hash_size: :class:`int`, optional
+    :return: Hash bits
+    :rtype: :class:`~numpy:numpy.ndarray`
+    """
+    resized = cv2.resize(
+        _grayscale(image_array),
+        (hash_size + 1, hash_size),
+        interpolation=cv2.INTER_AREA,
+    )
+    return resized[:, 1:] > resized[:, :-1]
+
+
+def ahash(image_array, hash_size=8):
+    """
+    Average hash. Compares each pixel of a grayscale thumbnail with the mean of the thumbnail.
+
+    :param image_array: Image as an array
+    :type image_array: :class:`~numpy:numpy.ndarray`
+    :param hash_size: Square root of the number of bits of the hash, defaults to 8
+    :type hash_size: :class:`int`, optional
+    :return: Hash bits
+    :rtype: :class:`~numpy:numpy.ndarray`
+    """
+    resized = cv2.resize(
+        _grayscale(image_array), (hash_size, hash_size), interpolation=cv2.INTER_AREA
+    )
+    return resized > resized.mean()
+
+
+def phash(image_array, hash_size=8):
+    """
+    Perceptual hash. Compares the lowest frequencies of the discrete cosine transform of a \
+    grayscale thumbnail with their median.
+
+    :param image_array: Image as an array
+    :type image_array: :class:`~numpy:numpy.ndarray`
+    :param hash_size: Square root of the number of bits of the hash, defaults to 8
+    :type hash_size: :class:`int`, optional
+    :return: Hash bits
+    :rtype: :class:`~numpy:numpy.ndarray`
+    """
+    size = hash_size * 4
+    resized = cv2.resize(
+        _grayscale(image_array), (size, size), interpolation=cv2.INTER_AREA
+    )
+    low = cv2.dct(resized.astype("float32"))[:hash_size, :hash_size]
+    return low > np.median(low)
+
+
+def whash(image_array, hash_size=8):
+    """
+    Wavelet hash. Compares the approximation coefficients of a Haar wavelet decomposition of a \
+    grayscale thumbnail with their median. The image mean (the coarsest approximation) is \
+    removed before the decomposition so only the structure of the image counts.
+
+    :param image_array: Image as an array
+    :type image_array: :class:`~numpy:numpy.ndarray`
+    :param hash_size: Square root of the number of bits of the hash (a power of 2), defaults \
+    to 8
+    :type hash_size: :class:`int`, optional
+    :return: Hash bits
+    :rtype: :class:`~numpy:numpy.ndarray`
+    """
+    if hash_size & (hash_size - 1):
+        raise ValueError("Wavelet hash size must be a power of 2.")
+
+    size = hash_size * 4
+    resized = cv2.resize(
+        _grayscale(image_array), (size, size), interpolation=cv2.INTER_AREA
+    )
+    coefficients = resized.astype("float32") / 255
+    coefficients -= coefficients.mean()
+    while coefficients.shape[0] > hash_size:
+        # Haar approximation coefficients of the next level (up to a constant factor)
+        coefficients = coefficients.reshape(
+            coefficients.shape[0] // 2, 2, coefficients.shape[1] // 2, 2
+        ).mean(axis=(1, 3))
+    return coefficients > np.median(coefficients)
+
+
+hash_methods = {"dhash": dhash, "ahash": ahash, "phash": phash, "whash": whash}
+
+
+def image_hash(image_array, hash_size=8, method="dhash"):
+    """
+    Computes a perceptual hash of an image. Bits are packed in little-endian order, bit `i` of \
+    the hash is the `i`-th bit of the flattened hash bits. Thumbnails are resized with area \
+    interpolation from a grayscale image, so hashes don't match the ones computed by earlier \
+    versions (linear interpolation on the color image) and stored hashes must be recomputed. \
+    Currently supported methods:
+    \t**∙ dhash** - Difference hash\n
+    \t**∙ ahash** - Average hash\n
+    \t**∙ phash** - Perceptual (DCT) hash\n
+    \t**∙ whash** - Wavelet (Haar) hash\n
+
+    :param image_array: Image as an array
+    :type image_array: :class:`~numpy:numpy.ndarray`
+    :param hash_size: Square root of the number of bits of the hash, defaults to 8
+    :type hash_size: :class:`int`, optional
+    :param method: Hashing method, defaults to dhash
+    :type method: :class:`str`, optional
+    :return: Packed hash, `uint64` for hashes up to 64 bits, byte array otherwise
+    :rtype: :class:`~numpy:numpy.uint64`/:class:`~numpy:numpy.ndarray`
+    """
+    if method not in hash_methods:
+        raise InvalidMethodError(hash_methods)
+
+    packed = np.packbits(
+        hash_methods[method](image_array, hash_size), bitorder="little"
+    )
+    if hash_size * hash_size > 64:
+        return packed
+    return np.pad(packed, (0, 8 - packed.size)).view("<u8")[0]
+
+
+def image_hashes(image_arrays, hash_size=8, method="dhash", workers=None):
+    """
+    Computes the perceptual hashes of multiple images in parallel (see :func:`image_hash`).
+
+    :param image_arrays: Iterable of images as arrays (or of functions returning them)
+    :type image_arrays: :class:`list`
+    :param hash_size: Square root of the number of bits of the hash, defaults to 8
+    :type hash_size: :class:`int`, optional
+    :param method: Hashing method, defaults to dhash
+    :type method: :class:`str`, optional
+    :param workers: Number of threads, defaults to min(32, number of processors + 4)
+    :type workers: :class:`int`, optional
+    :return: Array of `uint64` hashes, or a 2D array of bytes (one row per image) for hashes \
+    larger than 64 bits
+    :rtype: :class:`~numpy:numpy.ndarray`
+    """
+    if method not in hash_methods:
+        raise InvalidMethodError(hash_methods)
+
+    def compute(image_array):
+        if callable(image_array):
+            image_array = image_array()
+        return image_hash(image_array, hash_size=hash_size, method=method)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        hashes = list(executor.map(compute, image_arrays))
+
+    if hash_size * hash_size > 64:
+        return np.array(hashes, dtype="uint8").reshape(len(hashes), -1)
+    return np.array(hashes, dtype="uint64")
+
+
+def hamming_distance(hash1, hash2):
+    """
+    Returns the number of different bits between two 64-bit hashes. Arrays of hashes are \
+    compared element wise.
+
+    :param hash1: Hash (or array of hashes)
+    :type hash1: :class:`int`/:class:`~numpy:numpy.ndarray`
+    :param hash2: Hash (or array of hashes)
+    :type hash2: :class:`int`/:class:`~numpy:numpy.ndarray`
+    :return: Number of different bits
+    :rtype: :class:`int`/:class:`~numpy:numpy.ndarray`
+    """
+    diff = np.bitwise_xor(
+        np.asarray(hash1, dtype="uint64"), np.asarray(hash2, dtype="uint64")
+    )
+    return np.unpackbits(diff[..., None].view("uint8"), axis=-1).sum(
+        axis=-1, dtype="int64"
+    )
+
+
+@lru_cache(maxsize=None)
+def _flip_masks(bits, radius):
+    """Returns all the masks that flip up to `radius` of the lower `bits` bits"""
+    masks = [0]
+    for distance in range(1, radius + 1):
+        for positions in combinations(range(bits), distance):
+            masks.append(sum(1 << p for p in positions))
+    return np.array(masks, dtype="uint64")
+
+
+def _concatenate_ranges(starts, ends):
+    """Returns the concatenation of all the ranges [starts[i], ends[i])"""
+    lengths = ends - starts
+    offsets = np.cumsum(lengths) - lengths
+    return np.arange(lengths.sum()) - np.repeat(offsets - starts, lengths)
+
+
+class HashIndex:
+    """
+    This class represents an index of 64-bit perceptual hashes for near-duplicate search.
+    The index uses multi-index hashing: hashes are split into `blocks` substrings and each \
+    substring is kept in a sorted table. If two hashes are at most `d` bits apart then at least \
+    one of their substrings is at most `d // blocks` bits apart, so a query only needs to look \
+    up the substrings close to the ones of the query hash instead of scanning every hash.
+
+    New hashes are kept in an unsorted buffer that is scanned linearly and merged into the \
+    sorted tables once it grows past `buffer_size`, so inserts stay cheap.
+
+    :param blocks: Number of substrings the hashes are split into (divisor of 64), defaults \
+    to 4
+    :type blocks: :class:`int`, optional
+    :param buffer_size: Maximum number of hashes outside the sorted tables, defaults to 4096
+    :type buffer_size: :class:`int`, optional
+
+    .. note::
+        Labels must be integers or strings to save the **index** to a file.
+    """
+
+    def __init__(self, blocks=4, buffer_size=4096):
+        if 64 % blocks:
+            raise ValueError("Number of blocks must be a divisor of 64.")
+
+        self._blocks = blocks
+        self._bits = 64 // blocks
+        self._buffer_size = buffer_size
+        self._key_dtype = np.min_scalar_type((1 << self._bits) - 1)
+
+        self._hashes = np.empty(0, dtype="uint64")
+        self._labels = []
+        self._keys = [np.empty(0, dtype=self._key_dtype) for _ in range(blocks)]
+        self._order = [np.empty(0, dtype="int64") for _ in range(blocks)]
+        self._buffer = []
+
+    def __len__(self):
+        return len(self._labels)
+
+    def _block(self, hashes, index):
+        mask = np.uint64((1 << self._bits) - 1)
+        return (hashes >> np.uint64(index * self._bits)) & mask
+
+    def add(self, hash_value, label=None):
+        """
+        Adds a hash to the **index**.
+
+        :param hash_value: 64-bit hash
+        :type hash_value: :class:`int`/:class:`~numpy:numpy.uint64`
+        :param label: Label returned by queries that match the hash, defaults to its position \
+        in the **index**
+        :type label: :class:`object`, optional
+        """
+        self._labels.append(len(self._labels) if label is None else label)
+        self._buffer.append(int(hash_value))
+        if len(self._buffer) > self._buffer_size:
+            self._merge()
+
+    def extend(self, hashes, labels=None):
+        """
+        Adds multiple hashes to the **index**.
+
+        :param hashes: 64-bit hashes
+        :type hashes: :class:`~numpy:numpy.ndarray`/:class:`list`
+        :param labels: Labels of the hashes, defaults to their positions in the **index**
+        :type labels: :class:`list`, optional
+        """
+        start = len(self._labels)
+        if labels is None:
+            labels = range(start, start + len(hashes))
+        elif len(labels) != len(hashes):
+            raise ValueError("Number of labels must match the number of hashes.")
+
+        self._labels.extend(labels)
+        self._buffer.extend(int(h) for h in hashes)
+        if len(self._buffer) > self._buffer_size:
+            self._merge()
+
+    def _merge(self):
+        """
+        Moves the buffered hashes into the sorted tables. Only the buffered hashes are sorted, \
+        then they are merged into the already sorted tables.
+        """
+        if not self._buffer:
+            return
+        start = len(self._hashes)
+        buffered = np.array(self._buffer, dtype="uint64")
+        self._hashes = np.concatenate([self._hashes, buffered])
+        self._buffer = []
+        for i in range(self._blocks):
+            keys = self._block(buffered, i).astype(self._key_dtype)
+            order = np.argsort(keys, kind="stable")
+            keys = keys[order]
+            # Inserted after equal keys, so the tables stay sorted by position too
+            positions = np.searchsorted(self._keys[i], keys, side="right")
+            self._keys[i] = np.insert(self._keys[i], positions, keys)
+            self._order[i] = np.insert(self._order[i], positions, order + start)
+
+    def query(self, hash_value, max_distance=4):
+        """
+        Finds the hashes in the **index** that are at most `max_distance` bits apart from the \
+        given hash.
+
+        :param hash_value: 64-bit hash
+        :type hash_value: :class:`int`/:class:`~numpy:numpy.uint64`
+        :param max_distance: Maximum hamming distance, defaults to 4
+        :type max_distance: :class:`int`, optional
+        :return: Labels and distances of the matches, sorted by distance
+        :rtype: :class:`list`
+        """
+        hash_value = np.uint64(hash_value)
+        masks = _flip_masks(self._bits, min(max_distance // self._blocks, self._bits))
+
+        positions = []
+        for i in range(self._blocks):
+            keys = self._block(hash_value, i) ^ masks
+            starts = np.searchsorted(self._keys[i], keys, side="left")
+            ends = np.searchsorted(self._keys[i], keys, side="right")
+            positions.append(self._order[i][_concatenate_ranges(starts, ends)])
+        positions = np.unique(np.concatenate(positions))
+
+        buffered = np.array(self._buffer, dtype="uint64")
+        positions = np.concatenate(
+            [positions, np.arange(len(self._hashes), len(self._labels))]
+        ).astype("int64")
+        candidates = np.concatenate([self._hashes, buffered])[positions]
+
+        distances = hamming_distance(hash_value, candidates)
+        matches = np.flatnonzero(distances <= max_distance)
+        matches = matches[np.argsort(distances[matches], kind="stable")]
+        return [(self._labels[positions[m]], int(distances[m])) for m in matches]
+
+    def save(self, filename):
+        """
+        Saves the **index** to a file (NumPy `.npz` format).
+
+        :param filename: Filename to save
+        :type filename: :class:`str`
+        """
+        self._merge()
+        np.savez(
+            filename,
+            hashes=self._hashes,
+            labels=np.array(self._labels),
+            blocks=self._blocks,
+            buffer_size=self._buffer_size,
+        )
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Loads an **index** saved with :meth:`save`.
+
+        :param filename: Saved index
+        :type filename: :class:`str`
+        :return: Loaded index
+        :rtype: :class:`HashIndex`
+        """
+        with np.load(filename) as saved:
+            index = cls(
+                blocks=int(saved["blocks"]), buffer_size=int(saved["buffer_size"])
+            )
+            index._labels = saved["labels"].tolist()
+            index._buffer = saved["hashes"].tolist()
+        index._merge()
+        return index
+
+    @classmethod
+    def from_list(cls, images, labels=None, method="dhash", workers=None, **kwargs):
+        """
+        Creates an **index** with the hashes of all the images of a list.
+
+        :param images: List of images
+        :type images: :class:`~easycv.list.List`
+        :param labels: Labels of the images, defaults to their positions in the list
+        :type labels: :class:`list`, optional
+        :param method: Hashing method, defaults to dhash
+        :type method: :class:`str`, optional
+        :param workers: Number of threads used for hashing, defaults to min(32, number of \
+        processors + 4)
+        :type workers: :class:`int`, optional
+        :return: Index with the hashes of the images
+        :rtype: :class:`HashIndex`
+        """
+        index = cls(**kwargs)
+        index.extend(images.hashes(method=method, workers=workers), labels=labels)
+        index._merge()
+        return index
@@ -1,19 +1,37 @@
 import io
 import os
+import hashlib
 import base64
 import json
+from collections import OrderedDict
+from contextlib import contextmanager
 
+import cv2
 import numpy as np
 
 from easycv.collection import Collection, auto_compute
+from easycv.expression import Operators
 from easycv.errors.io import InvalidImageInputSource
+from easycv.errors.transforms import InvalidMethodError
 from easycv.io import save, valid_image_source, get_image_array, show, random_dog_image
+from easycv.io.header import image_header, image_shape
+from easycv.io.input import ENCODED_TYPES, open_image, own_array, valid_image_array
+from easycv.io.serialize import MAGIC, serialize, deserialize
+from easycv.io.shared import SharedArray
+from easycv.io.storage import STORAGES, CompressedArray
+from easycv.io.tiles import TileStore
+from easycv.hashing import image_hash
+from easycv.representations import cached, representation
+from easycv.statistics import region_stats, histogram
 from easycv.output import Output
 from easycv.transforms.base import Transform
-import cv2
+from easycv.transforms.color import GrayScale
+from easycv.transforms.perspective import Perspective
+from easycv.transforms.spatial import Crop, Resize, Rescale
+from easycv.pipeline import Pipeline
 
 
-class Image(Collection):
+class Image(Collection, Operators):
     """
     This class represents an image.
     Images can be created from a NumPy array containing the **image** data, a path to a local file
@@ -21,30 +39,79 @@ class Image(Collection):
     :doc:`Pipelines <pipeline>` can easily be applied to any **image**.
     If the image is lazy, computations will be delayed until needed or until the image is \
     computed. This can facilitate large scale processing and distributed computation.
-
-    :param source: Image data source. An array representing the image or a path/link to a file \
-    containing the image
-    :type source: :class:`str`/:class:`~numpy:numpy.ndarray`
+    Image arrays are read-only and shared between images (copies, images created from \
+    read-only arrays, results of transforms that don't change the pixels...). Writable arrays \
+    are copied when an image is created from them, so changing them doesn't change the image. \
+    Transforms that write into the array get a private copy, so memory only grows with distinct \
+    pixel data.
+    With the compressed storage the array is kept compressed in memory and decoded on access \
+    (see :class:`~easycv.io.storage.CompressedArray`), for large collections that don't fit in \
+    memory once decoded.
+    Images can be passed to NumPy and other libraries without copying the pixels, they \
+    implement `__array__`, the array interface, the buffer protocol (Python 3.12+) and DLPack. \
+    Exported pixels are read-only: DLPack consumers that don't support read-only tensors get a \
+    copy.
+    Arithmetic and comparison operators (`a * 0.7 + b * 0.3`, `abs(a - b) > 30`...) build a \
+    lazy :class:`~easycv.expression.Expression` that is evaluated in a single pass when \
+    computed.
+
+    :param source: Image data source. An array representing the image, a path/link to a file \
+    containing the image or a :class:`~easycv.io.tiles.TileStore` (for images that are too \
+    large to be decoded at once, lazy images only read the tiles they need)
+    :type source: :class:`str`/:class:`~numpy:numpy.ndarray`/\
+    :class:`~easycv.io.tiles.TileStore`
     :param pipeline: Pipeline to be applied to the image at creation time, defaults to None
     :type pipeline: :class:`~easycv.pipeline.Pipeline`, optional
     :param lazy: `True` if the image is lazy (computations are delayed until needed), defaults to \
     False
     :type lazy: :class:`boolean`, optional
+    :param storage: How the **image** array is kept in memory, "memory" (decoded) or \
+    "compressed", defaults to "memory"
+    :type storage: :class:`str`, optional
     """
 
-    def __init__(self, source, pipeline=None, lazy=False):
+    def __init__(self, source, pipeline=None, lazy=False, storage="memory"):
         if not valid_image_source(source):
             raise InvalidImageInputSource()
+        if storage not in STORAGES:
+            raise ValueError("Storage must be one of: {}.".format(", ".join(STORAGES)))
 
         super().__init__(pending=pipeline, lazy=lazy)
+        self._shared = None
+        self._storage = storage
+        self._compressed = None
 
         if self._lazy:
-            self._source = source
+            # Arrays are owned when the image is created, not when it's computed
+            self._source = (
+                own_array(source) if isinstance(source, np.ndarray) else source
+            )
             self._img = None
         else:
             self._img = self._pending(get_image_array(source))["image"]
             self._pending.clear()
 
+    @property
+    def _img(self):
+        if self._compressed is not None:
+            return self._compressed.array
+        return self._array
+
+    @_img.setter
+    def _img(self, image_array):
+        # Arrays are owned by the image and read-only, so they can be shared between images
+        # (copy-on-write). Arrays of other objects are copied before (see own_array)
+        if image_array is not None and image_array.flags.writeable:
+            image_array.flags.writeable = False
+        # Values derived from the pixels (digest, ...) are cached until the array is replaced
+        self._cache = {}
+        if image_array is not None and self._storage == "compressed":
+            self._compressed = CompressedArray(image_array)
+            self._array = None
+        else:
+            self._compressed = None
+            self._array = image_array
+
     @classmethod
     def random(cls, lazy=False):
         """
@@ -64,10 +131,9 @@ class Image(Collection):
         :return: `True` if loaded, `False` otherwise
         :rtype: :class:`bool`
         """
-        return self._img is not None
+        return self._array is not None or self._compressed is not None
 
     @property
-    @auto_compute
     def height(self):
         """
         Returns image height.
@@ -75,10 +141,9 @@ class Image(Collection):
         :return: Image height
         :rtype: :class:`int`
         """
-        return self._img.shape[0]
+        return self._shape()[0]
 
     @property
-    @auto_compute
     def width(self):
         """
         Returns **image** width.
@@ -86,10 +151,9 @@ class Image(Collection):
         :return: Image width
         :rtype: :class:`int`
         """
-        return self._img.shape[1]
+        return self._shape()[1]
 
     @property
-    @auto_compute
     def channels(self):
         """
         Returns **image** number of channels.
@@ -97,11 +161,32 @@ class Image(Collection):
         :return: Image numeber of channels
         :rtype: :class:`int`
         """
-
-        if len(self._img.shape) == 2:
+        shape = self._shape()
+        if len(shape) == 2:
             return 1
         else:
-            return self._img.shape[2]
+            return shape[2]
+
+    def _shape(self):
+        """
+        Returns the shape of the **image** array. Lazy images read the shape from the file header \
+        and infer the effect of pending transforms, so they're only computed when that isn't \
+        possible.
+        """
+        if self._compressed is not None and self._pending.num_transforms() == 0:
+            return self._compressed.shape
+        if not self.loaded or self._pending.num_transforms() > 0:
+            if self.loaded:
+                shape = self._img.shape
+            elif isinstance(self._source, (str,) + ENCODED_TYPES):
+                shape = image_shape(self._source)
+            else:
+                shape = self._source.shape
+            if shape is not None:
+                shape = self._pending.output_shape(shape)
+            if shape is not None:
+                return shape
+        return self.array.shape
 
     @property
     @auto_compute
@@ -121,6 +206,103 @@ class Image(Collection):
         if not self.loaded:
             self._img = get_image_array(self._source)
 
+    @property
+    def storage(self):
+        """
+        Returns how the **image** array is kept in memory ("memory" or "compressed").
+
+        :return: Image storage
+        :rtype: :class:`str`
+        """
+        return self._storage
+
+    def set_storage(self, storage):
+        """
+        Changes how the **image** array is kept in memory. With "memory" the decoded array is \
+        kept, with "compressed" only the compressed array is kept and it is decoded on access \
+        (the most recently used decoded arrays are cached, see \
+        :func:`~easycv.io.storage.set_decoded_cache_size`). The pixels are the same with both.
+
+        :param storage: Image storage, "memory" or "compressed"
+        :type storage: :class:`str`
+        :return: The **image** itself
+        :rtype: :class:`~eascv.image.Image`
+        """
+        if storage not in STORAGES:
+            raise ValueError("Storage must be one of: {}.".format(", ".join(STORAGES)))
+
+        if storage != self._storage:
+            self._storage = storage
+            if self.loaded:
+                cache = self._cache
+                self._img = (
+                    self._compressed.array if storage == "memory" else self._array
+                )
+                # Same pixels, cached values are still valid. Compressed images only keep the
+                # values that don't hold decoded arrays
+                if storage == "compressed":
+                    cache = {"digest": cache["digest"]} if "digest" in cache else {}
+                self._cache = cache
+        return self
+
+    def share(self):
+        """
+        Moves the **image** array into shared memory. Shared images are pickled as a handle to \
+        the memory instead of a copy of the array, so they can be sent to other processes \
+        (e.g. in parallel :class:`~easycv.list.List` operations) almost for free. The array \
+        of a shared image is read-only, transforms applied in place replace it with a new one. \
+        Compressed images aren't moved, they are pickled compressed.
+
+        :return: The **image** itself
+        :rtype: :class:`~eascv.image.Image`
+        """
+        self.load()
+        if self._compressed is not None:
+            return self
+        if self._shared is None or self._shared.array is not self._img:
+            self._shared = SharedArray(self._img)
+            self._array = self._shared.array
+            # Same pixels, but cached representations and pyramids hold copies of the old
+            # array, only the digest is kept
+            self._cache = self._digest_cache()
+        return self
+
+    def _digest_cache(self):
+        # Cached values that don't hold arrays
+        return {"digest": self._cache["digest"]} if "digest" in self._cache else {}
+
+    def __copy__(self):
+        image = self.__class__.__new__(self.__class__)
+        image.__dict__.update(self.__dict__)
+        image._pending = self._pending.copy()
+        image._cache = dict(self._cache)
+        return image
+
+    def __deepcopy__(self, memo):
+        # Arrays are read-only, so copies can share them
+        image = self.__copy__()
+        memo[id(self)] = image
+        return image
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Cached representations and pyramids are cheap to recompute but large to send
+        state["_cache"] = self._digest_cache()
+        if isinstance(state.get("_source"), memoryview):
+            state["_source"] = state["_source"].tobytes()
+        if self._shared is not None:
+            if self._shared.array is self._img:
+                state["_array"] = None
+                state["_source"] = None
+            else:
+                state["_shared"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._shared is not None:
+            self._array = self._shared.array
+
     def apply(self, transform, in_place=False):
         """
         Returns a new **image** with the :doc:`transform <transforms/index>` or \
@@ -150,7 +332,12 @@ class Image(Collection):
                     self._pending.add_transform(transform)
                 else:
                     new_source = self._img if self.loaded else self._source
-                    new_image = Image(new_source, pipeline=self._pending, lazy=True)
+                    new_image = Image(
+                        new_source,
+                        pipeline=self._pending,
+                        lazy=True,
+                        storage=self._storage,
+                    )
                     new_image.apply(transform, in_place=True)
                     return new_image
             else:
@@ -159,13 +346,190 @@ class Image(Collection):
         else:
             self.load()
             if outputs == {}:  # If transform outputs an image
+                level, resize = self._pyramid_resize(transform)
+                if level is not None:
+                    new_image = resize(level)["image"]
+                else:
+                    with self._cached() as image:
+                        new_image = transform(image)["image"]
+
                 if in_place:
-                    self._img = transform(self._img)["image"]
+                    self._img = new_image
                 else:
-                    new_image = transform(self._img.copy())["image"]
-                    return Image(new_image)
+                    return Image._from_array(new_image, storage=self._storage)
             else:
-                return transform(self._img)
+                with self._cached() as image:
+                    return transform(image)
+
+    @auto_compute
+    def pyramid(self, levels=None, method="area"):
+        """
+        Returns a multi-resolution pyramid of the **image**, where each level has half the \
+        width and height of the previous one. The pyramid is built lazily and cached, so \
+        repeated calls (and :class:`~easycv.transforms.spatial.Resize`/\
+        :class:`~easycv.transforms.spatial.Rescale` with the pyramid method, which start from \
+        the nearest level) reuse it. Currently supported methods:
+        \t**∙ area** - Pixel area relation downscaling\n
+        \t**∙ gaussian** - Gaussian blur followed by subsampling (:func:`cv2.pyrDown`)\n
+
+        :param levels: Number of levels (including the **image** itself), defaults to all the \
+        levels until the image is 1 pixel wide/high
+        :type levels: :class:`int`, optional
+        :param method: Downscaling method, defaults to area
+        :type method: :class:`str`, optional
+        :return: Pyramid levels, the first one is the **image** itself
+        :rtype: :class:`list`
+        """
+        if method not in ("area", "gaussian"):
+            raise InvalidMethodError(["area", "gaussian"])
+
+        pyramid = self._pyramid_levels(method, levels=levels)
+        return [self] + [Image._from_array(level) for level in pyramid[1:]]
+
+    def region(self, rectangle, level=0):
+        """
+        Returns a rectangular region of the **image**, at full resolution or at a lower \
+        resolution level of its :meth:`pyramid`. Lazy images backed by a \
+        :class:`~easycv.io.tiles.TileStore` without pending operations only read the tiles \
+        that intersect the region.
+
+        :param rectangle: A 2-tuple with the upper left and lower right corners of the region \
+        (like :class:`~easycv.transforms.spatial.Crop`), in the coordinates of the level
+        :type rectangle: :class:`tuple`
+        :param level: Pyramid level, 0 is the full resolution **image**, defaults to 0
+        :type level: :class:`int`, optional
+        :return: Region of the **image**
+        :rtype: :class:`~eascv.image.Image`
+        """
+        if (
+            not self.loaded
+            and isinstance(self._source, TileStore)
+            and self._pending.num_transforms() == 0
+        ):
+            region = self._source.read(level, rectangle)
+        else:
+            self.compute(in_place=True)
+            levels = self._pyramid_levels("area", levels=level + 1)
+            if level >= len(levels):
+                raise ValueError(
+                    "Level must be between 0 and {}.".format(len(levels) - 1)
+                )
+            (left, top), (right, bottom) = rectangle
+            region = levels[level][top:bottom, left:right]
+        return Image._from_array(region, storage=self._storage)
+
+    @auto_compute
+    def representation(self, name):
+        """
+        Returns a representation of the **image** (grayscale, HSV, LAB or float). \
+        Representations are computed once and cached until the **image** array changes, \
+        transforms use the same cache. See :func:`~easycv.representations.representation` for \
+        all the supported representations.
+
+        :param name: Name of the representation
+        :type name: :class:`str`
+        :return: Representation of the image (read-only)
+        :rtype: :class:`~numpy:numpy.ndarray`
+        """
+        with self._cached() as image:
+            return representation(image, name)
+
+    @auto_compute
+    def region_stats(self, rectangles):
+        """
+        Returns the mean and variance of each channel inside each rectangle. The integral \
+        images used to compute them are cached until the **image** array changes, so any \
+        number of rectangles can be evaluated in constant time per rectangle. See \
+        :func:`~easycv.statistics.region_stats`.
+
+        :param rectangles: Rectangles as 2-tuples with the upper left and lower right corners \
+        (like :class:`~easycv.transforms.spatial.Crop`)
+        :type rectangles: :class:`list`/:class:`~numpy:numpy.ndarray`
+        :return: Means and variances, arrays with one row per rectangle and one column per \
+        channel
+        :rtype: :class:`tuple`
+        """
+        with self._cached() as image:
+            return region_stats(image, rectangles)
+
+    @auto_compute
+    def histogram(self):
+        """
+        Returns the histogram of the **image** (all channels together), with its median, \
+        percentiles, mean, standard deviation, minimum and maximum. The histogram is computed \
+        once and cached until the **image** array changes. Only `uint8` images are supported.
+
+        :return: Image histogram
+        :rtype: :class:`~easycv.statistics.Histogram`
+        """
+        with self._cached() as image:
+            return histogram(image)
+
+    @contextmanager
+    def _cached(self):
+        """
+        Caches the representations computed from the **image** array with its other cached \
+        values, while the `with` block runs (except for compressed images). Yields the array.
+        """
+        image = self._img
+        if self._compressed is not None:
+            # Cached arrays would keep decoded data in memory, defeating the compression
+            yield image
+            return
+        with cached(image, self._cache.setdefault("representations", OrderedDict())):
+            yield image
+
+    def _pyramid_levels(self, method, levels=None, min_shape=(1, 1)):
+        """
+        Returns the cached pyramid arrays, building the missing levels. Only the levels that \
+        are at least `min_shape` are built/returned. Pyramids of compressed images aren't \
+        cached, they would keep decoded data in memory.
+        """
+        if self._compressed is not None:
+            pyramid = [self._img]
+        else:
+            pyramid = self._cache.setdefault(("pyramid", method), [self._img])
+        while levels is None or len(pyramid) < levels:
+            height, width = pyramid[-1].shape[:2]
+            size = ((width + 1) // 2, (height + 1) // 2)
+            if (
+                (height, width) == (1, 1)
+                or size[1] < min_shape[0]
+                or size[0] < min_shape[1]
+            ):
+                break
+            if method == "gaussian":
+                level = cv2.pyrDown(pyramid[-1], dstsize=size)
+            else:
+                level = cv2.resize(pyramid[-1], size, interpolation=cv2.INTER_AREA)
+            level.flags.writeable = False
+            pyramid.append(level)
+        return [
+            level
+            for level in pyramid[:levels]
+            if level.shape[0] >= min_shape[0] and level.shape[1] >= min_shape[1]
+        ]
+
+    def _pyramid_resize(self, transform):
+        """
+        Returns the smallest cached area pyramid level that is still twice as large as the \
+        output of a :class:`~easycv.transforms.spatial.Resize`/\
+        :class:`~easycv.transforms.spatial.Rescale` with the pyramid method and the resize to \
+        apply to it. If the transform can't start from a pyramid level None is returned instead.
+        """
+        if (
+            type(transform) not in (Resize, Rescale)
+            or transform.args["method"] != "pyramid"
+        ):
+            return None, None
+
+        height, width = transform.infer_shape(self._img.shape, **transform.args)[:2]
+        min_shape = (2 * max(height, 1), 2 * max(width, 1))
+        if min_shape[0] > self._img.shape[0] or min_shape[1] > self._img.shape[1]:
+            return None, None
+
+        level = self._pyramid_levels("area", min_shape=min_shape)[-1]
+        return level, Resize(width=width, height=height, method="pyramid")
 
     def compute(self, in_place=True):
         """
@@ -179,14 +543,122 @@ class Image(Collection):
         :return: The new **image** if `in_place` is *False*
         :rtype: :class:`~eascv.image.Image`
         """
-        self.load()
+        if self.loaded or (in_place and self._pending.num_transforms() == 0):
+            self.load()
+            image, pending = self._img, self._pending
+        elif self._pending.num_transforms() == 0:
+            # A new image is returned, the current one stays lazy
+            image, pending = get_image_array(self._source), self._pending
+        else:
+            image, pending = self._decode()
+
+        if image is self._array:
+            with self._cached():
+                result = pending(image)["image"]
+        else:
+            result = pending(image)["image"]
+
         if in_place:
-            self._img = self._pending(self._img)["image"]
-            self._pending.clear()
+            if self._pending.num_transforms() > 0:
+                self._img = result
+                self._pending.clear()
             return self
         else:
-            result = Image(self._pending(self._img)["image"], lazy=self._lazy)
-            return result
+            return Image._from_array(result, lazy=self._lazy, storage=self._storage)
+
+    def _decode(self):
+        """
+        Decodes the **image** source pushing the leading pending transforms into the decoder. A \
+        leading :class:`~easycv.transforms.color.GrayScale` decodes the image directly in \
+        grayscale and a downscaling :class:`~easycv.transforms.spatial.Resize`/\
+        :class:`~easycv.transforms.spatial.Rescale` of a JPEG image decodes it at a reduced size \
+        (1/2, 1/4 or 1/8) that is still larger than the target, leaving a smaller resize to be \
+        done.
+
+        :return: Decoded image array and the pipeline with the remaining pending operations
+        :rtype: :class:`tuple`
+        """
+        if isinstance(self._source, TileStore):
+            return self._decode_tiles()
+        if not isinstance(self._source, (str,) + ENCODED_TYPES):
+            return get_image_array(self._source), self._pending
+
+        transforms = list(self._pending.transforms())
+        grayscale = type(transforms[0]) is GrayScale
+        if grayscale:
+            transforms.pop(0)
+
+        reduction = 1
+        if transforms and type(transforms[0]) in (Resize, Rescale):
+            resize = transforms[0]
+            resize.initialize()
+            header = image_header(self._source)
+            if header is not None and header[0] == "jpeg":
+                shape = header[1]
+                height, width = resize.infer_shape(shape, **resize.args)[:2]
+                for factor in (8, 4, 2):
+                    if shape[0] // factor >= height and shape[1] // factor >= width:
+                        reduction = factor
+                        break
+            if reduction > 1:
+                method = resize.args["method"]
+                transforms[0] = Resize(width=width, height=height, method=method)
+
+        if not grayscale and reduction == 1:
+            return get_image_array(self._source), self._pending
+
+        image = open_image(self._source, grayscale=grayscale, reduction=reduction)
+        return image, Pipeline(transforms, name="pending")
+
+    def _decode_tiles(self):
+        """
+        Reads the **image** from its tile store pushing the first pending transform into the \
+        read. A :class:`~easycv.transforms.spatial.Crop` only reads the tiles of the cropped \
+        region, a :class:`~easycv.transforms.perspective.Perspective` only the tiles around its \
+        points and a downscaling :class:`~easycv.transforms.spatial.Resize`/\
+        :class:`~easycv.transforms.spatial.Rescale` with the pyramid method starts from the \
+        smallest level that is still twice as large as the target.
+
+        :return: Image array and the pipeline with the remaining pending operations
+        :rtype: :class:`tuple`
+        """
+        store = self._source
+        transforms = list(self._pending.transforms())
+        transform = transforms[0]
+        transform.initialize()
+        height, width = store.shape[:2]
+
+        if type(transform) is Crop and not transform.args["original"]:
+            (left, top), (right, bottom) = transform.args["rectangle"]
+            if left < width and top < height:
+                region = store.read(0, ((left, top), (right, bottom)))
+                return region, Pipeline(transforms[1:], name="pending")
+
+        elif type(transform) is Perspective and len(transform.args["points"]) == 4:
+            # Interpolation reads the pixels next to the points, so they're included
+            xs, ys = zip(*transform.args["points"])
+            left, top = max(min(xs) - 1, 0), max(min(ys) - 1, 0)
+            right, bottom = min(max(xs) + 2, width), min(max(ys) + 2, height)
+            points = [[x - left, y - top] for x, y in transform.args["points"]]
+            transforms[0] = Perspective(points=points)
+            region = store.read(0, ((left, top), (right, bottom)))
+            return region, Pipeline(transforms, name="pending")
+
+        elif (
+            type(transform) in (Resize, Rescale)
+            and transform.args["method"] == "pyramid"
+        ):
+            # Levels are built like the pyramid method halves images, so the output is the same
+            target = transform.infer_shape(store.shape, **transform.args)[:2]
+            for level in reversed(range(store.levels)):
+                shape = store.level_shape(level)
+                if shape[0] >= target[0] * 2 and shape[1] >= target[1] * 2:
+                    transforms[0] = Resize(
+                        width=target[1], height=target[0], method="pyramid"
+                    )
+                    return store.read(level), Pipeline(transforms, name="pending")
+
+        return store.read(), self._pending
 
     @auto_compute
     def encode(self):
@@ -215,13 +687,112 @@ class Image(Collection):
         :rtype: :class:`~eascv.image.Image`
         """
         encoded = json.loads(encoded)
-        shape = (encoded["height"], encoded["width"], encoded["channels"])
+        shape = (encoded["height"], encoded["width"])
+        if encoded["channels"] > 1:
+            shape += (encoded["channels"],)
         image_data = bytes(encoded["data"], encoding="utf-8")
         image_array = np.frombuffer(
             base64.decodebytes(image_data), dtype=encoded["dtype"]
         )
         return cls(image_array.reshape(shape))
 
+    @auto_compute
+    def to_bytes(self, codec=None, quality=None):
+        """
+        Returns a binary serialization of the **image**. By default the raw array data is used, \
+        but the **image** can also be compressed (see :func:`~easycv.io.serialize.serialize` \
+        for all the supported codecs).
+
+        :param codec: Codec used to compress the image, defaults to raw
+        :type codec: :class:`str`, optional
+        :param quality: Codec quality/compression level, defaults to the codec default
+        :type quality: :class:`int`, optional
+        :return: Serialized image
+        :rtype: :class:`bytes`
+        """
+        return serialize(self._img, codec=codec, quality=quality)
+
+    @classmethod
+    def from_bytes(cls, buffer, lazy=False):
+        """
+        Creates an image from a binary serialization created with \
+        :meth:`~easycv.image.Image.to_bytes` or from an encoded image (the contents of a PNG, \
+        JPEG, WebP... file, e.g. received over the network). Raw images are not copied, the \
+        **image** array is a view of the buffer. Lazy images keep encoded images in memory and \
+        decode them when needed, applying the same decoding optimizations as images read from \
+        files.
+
+        :param buffer: Serialized or encoded image
+        :type buffer: :class:`bytes`/:class:`bytearray`/:class:`memoryview`
+        :param lazy: `True` if the image is lazy, defaults to False
+        :type lazy: :class:`boolean`, optional
+        :return: Deserialized image
+        :rtype: :class:`~eascv.image.Image`
+        """
+        if bytes(memoryview(buffer)[: len(MAGIC)]) != MAGIC:
+            return cls(buffer, lazy=lazy)
+        return cls._from_array(own_array(deserialize(buffer)), lazy=lazy)
+
+    @classmethod
+    def from_buffer(cls, buffer, shape, dtype="uint8", copy=False, lazy=False):
+        """
+        Creates an image from an object that exposes the buffer protocol (:class:`bytes`, \
+        :class:`bytearray`, :class:`memoryview`, arrays of other libraries...). The buffer \
+        isn't copied unless `copy` is *True*, the **image** array is a read-only view of it.
+
+        :param buffer: Buffer with the image data
+        :type buffer: :class:`bytes`/:class:`bytearray`/:class:`memoryview`
+        :param shape: Shape of the image (height, width) or (height, width, channels)
+        :type shape: :class:`tuple`
+        :param dtype: Data type of the image data, defaults to uint8
+        :type dtype: :class:`str`, optional
+        :param copy: `True` to copy the buffer, defaults to `False`
+        :type copy: :class:`bool`, optional
+        :param lazy: `True` if the image is lazy, defaults to False
+        :type lazy: :class:`boolean`, optional
+        :return: Image with the buffer data
+        :rtype: :class:`~eascv.image.Image`
+        """
+        image_array = np.frombuffer(buffer, dtype=dtype, count=int(np.prod(shape)))
+        image_array = image_array.reshape(shape)
+        if not valid_image_array(image_array):
+            raise InvalidImageInputSource()
+        image_array = image_array.copy() if copy else own_array(image_array)
+        return cls._from_array(image_array, lazy=lazy)
+
+    @classmethod
+    def from_dlpack(cls, tensor, lazy=False):
+        """
+        Creates an image from a tensor of another library (PyTorch, TensorFlow, JAX, CuPy...) \
+        using the `DLPack <https://dmlc.github.io/dlpack/latest/>`_ protocol. The tensor must be \
+        on the CPU. Its memory is only used by the **image** without copying it if it is \
+        read-only, since tensors can be changed after the **image** is created.
+
+        :param tensor: Tensor that implements `__dlpack__`
+        :type tensor: :class:`object`
+        :param lazy: `True` if the image is lazy, defaults to False
+        :type lazy: :class:`boolean`, optional
+        :return: Image with the tensor data
+        :rtype: :class:`~eascv.image.Image`
+        """
+        image_array = np.from_dlpack(tensor)
+        if not valid_image_array(image_array):
+            raise InvalidImageInputSource()
+        return cls._from_array(own_array(image_array), lazy=lazy)
+
+    @classmethod
+    def _from_array(cls, image_array, lazy=False, storage="memory"):
+        """
+        Creates an image that uses the given array without copying or validating it.
+        """
+        image = cls.__new__(cls)
+        Collection.__init__(image, lazy=lazy)
+        image._shared = None
+        image._storage = storage
+        image._img = image_array
+        image._source = image_array if image._compressed is None else None
+        return image
+
     @auto_compute
     def show(self, name="Image"):
         """
@@ -248,13 +819,68 @@ class Image(Collection):
         """
         save(self.array, filename)
 
+    @property
+    @auto_compute
+    def digest(self):
+        """
+        Returns a digest (BLAKE2 hash) of the **image** pixels, shape and data type. Images with \
+        the same digest have the same array, so it can be used for equality checks, to remove \
+        duplicates or as a cache key. The digest is computed once and cached until the array is \
+        replaced (e.g. by applying a transform in place).
+
+        .. note::
+            Changes made directly to the array returned by :attr:`array` are not tracked.
+
+        :return: Image digest (hexadecimal)
+        :rtype: :class:`str`
+        """
+        if "digest" not in self._cache:
+            image_array = np.ascontiguousarray(self._img)
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(
+                "{}{}".format(image_array.shape, image_array.dtype.str).encode()
+            )
+            digest.update(image_array.data)
+            self._cache["digest"] = digest.hexdigest()
+        return self._cache["digest"]
+
     @auto_compute
     def __eq__(self, other):
-        return (
-            isinstance(other, Image)
-            and np.array_equal(other.array, self.array)
-            and self.pending == other.pending
-        )
+        return isinstance(other, Image) and other.digest == self.digest
+
+    @auto_compute
+    def __array__(self, dtype=None, copy=None):
+        if copy:
+            return np.array(self._img, dtype=dtype)
+        return self._img if dtype is None else self._img.astype(dtype, copy=False)
+
+    @property
+    @auto_compute
+    def __array_interface__(self):
+        # The data is exported as a (read-only) buffer, so arrays created from the interface
+        # keep it alive themselves. Buffers are contiguous, other arrays are copied
+        image_array = np.ascontiguousarray(self._img)
+        image_array.flags.writeable = False
+        interface = dict(image_array.__array_interface__, data=memoryview(image_array))
+        interface.pop("strides", None)
+        return interface
+
+    @auto_compute
+    def __buffer__(self, flags):
+        return memoryview(self._img)
+
+    @auto_compute
+    def __dlpack__(self, **kwargs):
+        try:
+            # Read-only arrays are exported with the read-only flag of DLPack 1.0
+            return self._img.__dlpack__(**kwargs)
+        except (BufferError, TypeError):
+            # The consumer (or NumPy) doesn't support read-only tensors. The pixels can be
+            # shared with other images, so a copy is exported instead of a writeable alias
+            return self._img.copy().__dlpack__(**kwargs)
+
+    def __dlpack_device__(self):
+        return 1, 0  # Arrays are always on the CPU (kDLCPU, device 0)
 
     @auto_compute
     def __repr__(self):
@@ -267,13 +893,21 @@ class Image(Collection):
         save(self._img, b, "PNG")
         return b.getvalue()
 
-    def hash(self, hash_size=8):
+    def hash(self, hash_size=8, method="dhash"):
         """
-        Function to calculate the hash function of an Image using dhash
+        Function to calculate a perceptual hash of an Image. See \
+        :func:`~easycv.hashing.image_hash` for the supported methods. Hashes changed in this \
+        version (thumbnails are grayscale and resized with area interpolation), hashes stored \
+        by earlier versions must be recomputed.
 
         :param hash_size: Square root of the number of bits of the hash, defaults to 8
         :type hash_size: :class:`int`, optional
+        :param method: Hashing method, defaults to dhash
+        :type method: :class:`str`, optional
+        :return: Hash, bit `i` is the `i`-th bit of the flattened hash bits
+        :rtype: :class:`int`
         """
-        resized = cv2.resize(self.array, (hash_size + 1, hash_size))
-        diff = resized[:, 1:] > resized[:, :-1]
-        return sum([2 ** i for (i, v) in enumerate(diff.flatten()) if v])
+        packed = image_hash(self.array, hash_size=hash_size, method=method)
+        if isinstance(packed, np.ndarray):
+            return int.from_bytes(packed.tobytes(), "little")
+        return int(packed)
@@ -1,9 +1,18 @@
 from easycv.io.output import save, show, show_grid
+from easycv.io.header import image_shape, read_image_size
+from easycv.io.serialize import serialize, deserialize
+from easycv.io.shared import SharedArray
+from easycv.io.storage import CompressedArray
+from easycv.io.tiles import TileStore
+from easycv.io.discovery import discover_images, count_images
+from easycv.io.http import configure, fetch, fetch_all, set_cache
+from easycv.io.cache import URLCache
 from easycv.io.input import (
     open_image,
     valid_image_source,
     get_image_array,
     random_dog_image,
+    random_dog_images,
     get_image_list,
 )
 
@@ -11,9 +20,24 @@ __all__ = [
     "get_image_array",
     "open_image",
     "random_dog_image",
+    "random_dog_images",
     "save",
     "show",
     "show_grid",
     "valid_image_source",
     "get_image_list",
+    "image_shape",
+    "read_image_size",
+    "serialize",
+    "deserialize",
+    "SharedArray",
+    "CompressedArray",
+    "TileStore",
+    "discover_images",
+    "count_images",
+    "configure",
+    "fetch",
+    "fetch_all",
+    "set_cache",
+    "URLCache",
 ]
@@ -0,0 +1,214 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+
+# Eviction removes entries until the cache is under this fraction of its cap, so the next
+# downloads don't trigger another eviction right away
+LOW_WATERMARK = 0.9
+
+
+class URLCache:
+    """
+    This class represents a persistent cache of downloaded files on disk, keyed by url. Each \
+    entry is a single file named after the hash of its url, with a line of metadata (url, \
+    ETag and Last-Modified headers) followed by the contents of the file. Entries are written \
+    to a temporary file and atomically moved into place, so the cache can be shared by \
+    multiple processes and readers never see incomplete entries.
+
+    The modification time of an entry is updated every time it is used, when the total size \
+    of the cache exceeds the cap the least recently used entries are removed. The total size is \
+    tracked as entries are added (the directory is only scanned once and when evicting), so \
+    entries added by other processes are only counted after the next eviction.
+
+    Enable the cache for all the downloads with :func:`~easycv.io.http.set_cache`, cached \
+    entries are revalidated with the server (using the ETag and Last-Modified headers) and \
+    only downloaded again if they changed.
+
+    :param path: Path to the cache directory, it is created if needed
+    :type path: :class:`str`
+    :param max_size: Maximum total size of the cached files in bytes, defaults to 1 GB
+    :type max_size: :class:`int`, optional
+    """
+
+    def __init__(self, path, max_size=1 << 30):
+        os.makedirs(path, exist_ok=True)
+        self._path = path
+        self._max_size = max_size
+        self._size = None  # Total size, scanned when the first entry is added
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        """
+        Returns the path to the cache directory.
+
+        :return: Cache path
+        :rtype: :class:`str`
+        """
+        return self._path
+
+    @property
+    def max_size(self):
+        """
+        Returns the maximum total size of the cached files.
+
+        :return: Size in bytes
+        :rtype: :class:`int`
+        """
+        return self._max_size
+
+    def _entry_path(self, url):
+        return os.path.join(self._path, hashlib.sha256(url.encode("utf-8")).hexdigest())
+
+    def get(self, url):
+        """
+        Reads an entry of the cache and marks it as recently used.
+
+        :param url: Link to a file
+        :type url: :class:`str`
+        :return: Metadata (with the keys "url", "etag" and "last_modified") and contents of \
+        the file, or None if the url isn't cached
+        :rtype: :class:`tuple`
+        """
+        path = self._entry_path(url)
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline().decode("utf-8"))
+                data = f.read()
+        except (OSError, ValueError):
+            return None
+
+        # Two urls with the same hash would be a collision, treated as a miss
+        if meta.get("url") != url:
+            return None
+        self.touch(url)
+        return meta, data
+
+    def touch(self, url):
+        """
+        Marks an entry as recently used.
+
+        :param url: Link to a file
+        :type url: :class:`str`
+        """
+        try:
+            # File times set by the system are too coarse to order entries used in a row
+            now = time.time_ns()
+            os.utime(self._entry_path(url), ns=(now, now))
+        except OSError:
+            pass  # Removed by another process
+
+    def put(self, url, data, etag=None, last_modified=None):
+        """
+        Adds (or replaces) an entry of the cache, then removes the least recently used entries \
+        if the cache is over its size cap.
+
+        :param url: Link to a file
+        :type url: :class:`str`
+        :param data: Contents of the file
+        :type data: :class:`bytes`
+        :param etag: ETag header of the response, defaults to None
+        :type etag: :class:`str`, optional
+        :param last_modified: Last-Modified header of the response, defaults to None
+        :type last_modified: :class:`str`, optional
+        """
+        if len(data) > self._max_size:
+            return
+
+        path = self._entry_path(url)
+        try:
+            previous = os.stat(path).st_size
+        except OSError:
+            previous = 0
+
+        meta = {"url": url, "etag": etag, "last_modified": last_modified}
+        fd, temporary = tempfile.mkstemp(dir=self._path, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json.dumps(meta).encode("utf-8") + b"\n")
+                f.write(data)
+                written = f.tell()
+            os.replace(temporary, path)
+        except BaseException:
+            os.remove(temporary)
+            raise
+        self.touch(url)
+
+        with self._lock:
+            if self._size is None:
+                self._size = self.size
+            else:
+                self._size += written - previous
+            full = self._size > self._max_size
+        if full:
+            self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache is under its size cap (under \
+        :data:`LOW_WATERMARK` of it if the cap is exceeded).
+        """
+        entries = []
+        with os.scandir(self._path) as scan:
+            for entry in scan:
+                if entry.name.startswith(".tmp-") or not entry.is_file():
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        size = sum(entry[1] for entry in entries)
+        limit = (
+            self._max_size * LOW_WATERMARK if size > self._max_size else self._max_size
+        )
+        for _, entry_size, path in sorted(entries):
+            if size <= limit:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # Already removed by another process
+            size -= entry_size
+
+        with self._lock:
+            self._size = size
+
+    @property
+    def size(self):
+        """
+        Returns the total size of the cached files.
+
+        :return: Size in bytes
+        :rtype: :class:`int`
+        """
+        with os.scandir(self._path) as scan:
+            return sum(
+                entry.stat().st_size
+                for entry in scan
+                if entry.is_file() and not entry.name.startswith(".tmp-")
+            )
+
+    def clear(self):
+        """
+        Removes all the entries of the cache.
+        """
+        with self._lock:
+            self._size = 0
+        with os.scandir(self._path) as scan:
+            for entry in scan:
+                if entry.is_file() and not entry.name.startswith(".tmp-"):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+
+    def __reduce__(self):
+        return self.__class__, (self._path, self._max_size)
+
+    def __repr__(self):
+        return "<url cache max_size={} at {}>".format(self._max_size, self._path)
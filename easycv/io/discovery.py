@@ -0,0 +1,145 @@
+import os
+from fnmatch import fnmatch
+
+from easycv.io.header import image_format
+
+# Extensions of the image formats OpenCV can decode
+IMAGE_EXTENSIONS = {
+    ".bmp",
+    ".dib",
+    ".jpeg",
+    ".jpg",
+    ".jpe",
+    ".jp2",
+    ".png",
+    ".webp",
+    ".pbm",
+    ".pgm",
+    ".ppm",
+    ".pxm",
+    ".pnm",
+    ".pfm",
+    ".sr",
+    ".ras",
+    ".tiff",
+    ".tif",
+    ".exr",
+    ".hdr",
+    ".pic",
+}
+
+# Signatures of formats not recognized by image_format
+SIGNATURES = (
+    b"II*\x00",  # TIFF (little endian)
+    b"MM\x00*",  # TIFF (big endian)
+    b"\x00\x00\x00\x0cjP  ",  # JPEG 2000
+    b"\x76\x2f\x31\x01",  # OpenEXR
+    b"#?RADIANCE",  # Radiance HDR
+)
+
+# Magic numbers of portable bitmaps (PBM, PGM, PPM...), followed by whitespace
+NETPBM_SIGNATURES = {b"P1", b"P2", b"P3", b"P4", b"P5", b"P6"}
+
+
+def is_image_file(path):
+    """
+    Checks if a file is an image by reading its first bytes (magic bytes).
+
+    :param path: Path to a file
+    :type path: :class:`str`
+    :return: `True` if the file starts with the signature of an image format
+    :rtype: :class:`bool`
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(32)
+    except OSError:
+        return False
+    if image_format(head) is not None or head.startswith(SIGNATURES):
+        return True
+    return head[:2] in NETPBM_SIGNATURES and head[2:3].isspace()
+
+
+def _matches(relative, patterns):
+    return any(fnmatch(relative, pattern) for pattern in patterns)
+
+
+def discover_images(
+    path,
+    recursive=False,
+    max_depth=None,
+    extensions=IMAGE_EXTENSIONS,
+    magic=False,
+    include=None,
+    exclude=None,
+):
+    """
+    Finds the images in a folder, yielding their paths as they are found. Files are selected \
+    by extension and/or by their magic bytes, without decoding them (only the magic bytes are \
+    read, and only if `magic` is *True*). Paths are yielded in a deterministic order: the \
+    files of each folder sorted by name, followed by its sub folders sorted by name. Symbolic \
+    links to folders aren't followed.
+
+    :param path: Path to a folder of images
+    :type path: :class:`str`
+    :param recursive: Flag to search in the sub folders, defaults to `False`
+    :type recursive: :class:`bool`, optional
+    :param max_depth: Maximum depth of the sub folders searched when recursive (1 only \
+    searches the direct sub folders), defaults to unlimited
+    :type max_depth: :class:`int`, optional
+    :param extensions: Extensions of the files to select (lowercase, with the dot), None to \
+    select files with any extension, defaults to the formats supported by OpenCV
+    :type extensions: :class:`set`, optional
+    :param magic: `True` to select only files that start with the signature of an image \
+    format, defaults to `False`
+    :type magic: :class:`bool`, optional
+    :param include: Glob patterns (relative to `path`) of the files to select, defaults to all \
+    the files
+    :type include: :class:`list`, optional
+    :param exclude: Glob patterns (relative to `path`) of the files and folders to skip, \
+    defaults to None
+    :type exclude: :class:`list`, optional
+    :return: Generator of image paths
+    :rtype: :class:`generator`
+    """
+    folders = [(path, 0)]
+    while folders:
+        folder, depth = folders.pop()
+        with os.scandir(folder) as scan:
+            entries = sorted(scan, key=lambda entry: entry.name)
+
+        sub_folders = []
+        for entry in entries:
+            relative = os.path.relpath(entry.path, path).replace(os.sep, "/")
+            if exclude and _matches(relative, exclude):
+                continue
+
+            # Links to folders aren't followed, they could create cycles
+            if entry.is_dir(follow_symlinks=False):
+                if recursive and (max_depth is None or depth < max_depth):
+                    sub_folders.append((entry.path, depth + 1))
+            elif entry.is_file():
+                if extensions is not None:
+                    if os.path.splitext(entry.name)[1].lower() not in extensions:
+                        continue
+                if include and not _matches(relative, include):
+                    continue
+                if magic and not is_image_file(entry.path):
+                    continue
+                yield entry.path
+
+        # Reversed, so the first sub folder is the next one to be searched
+        folders.extend(reversed(sub_folders))
+
+
+def count_images(path, **kwargs):
+    """
+    Returns the number of images in a folder (see :func:`discover_images` for the arguments), \
+    without reading the files unless `magic` is *True*.
+
+    :param path: Path to a folder of images
+    :type path: :class:`str`
+    :return: Number of images
+    :rtype: :class:`int`
+    """
+    return sum(1 for _ in discover_images(path, **kwargs))
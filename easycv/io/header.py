@@ -0,0 +1,240 @@
+import io
+import os
+import struct
+
+from easycv.errors.io import ImageDownloadError, InvalidPathError
+from easycv.io.http import open_url, get_cache, fetch
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# JPEG start of frame markers (all SOFn except DHT, JPG and DAC)
+SOF_MARKERS = {
+    0xC0,
+    0xC1,
+    0xC2,
+    0xC3,
+    0xC5,
+    0xC6,
+    0xC7,
+    0xC9,
+    0xCA,
+    0xCB,
+    0xCD,
+    0xCE,
+    0xCF,
+}
+
+# Markers without a length field
+STANDALONE_MARKERS = {0x01, 0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7, 0xD8}
+
+# EXIF orientations that swap width and height (rotations of 90/270 degrees)
+TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
+
+
+class _PrefixedStream:
+    """Stream that serves already read bytes before reading from the wrapped stream"""
+
+    def __init__(self, prefix, stream):
+        self._prefix = prefix
+        self._stream = stream
+
+    def read(self, n):
+        data = self._prefix[:n]
+        self._prefix = self._prefix[n:]
+        if len(data) < n:
+            data += self._stream.read(n - len(data))
+        return data
+
+
+def _exif_orientation(payload):
+    """
+    Extracts the orientation tag from the payload of an APP1 (EXIF) segment.
+
+    :param payload: APP1 segment payload
+    :type payload: :class:`bytes`
+    :return: EXIF orientation (1-8) or None if not present
+    :rtype: :class:`int`
+    """
+    if payload[:6] != b"Exif\x00\x00" or len(payload) < 14:
+        return None
+    tiff = payload[6:]
+    if tiff[:2] == b"II":
+        order = "<"
+    elif tiff[:2] == b"MM":
+        order = ">"
+    else:
+        return None
+
+    ifd = struct.unpack(order + "I", tiff[4:8])[0]
+    if ifd + 2 > len(tiff):
+        return None
+    entries = struct.unpack(order + "H", tiff[ifd : ifd + 2])[0]
+    for i in range(entries):
+        entry = tiff[ifd + 2 + 12 * i : ifd + 14 + 12 * i]
+        if len(entry) < 12:
+            break
+        tag = struct.unpack(order + "H", entry[:2])[0]
+        if tag == 0x0112:
+            return struct.unpack(order + "H", entry[8:10])[0]
+    return None
+
+
+def _jpeg_size(stream):
+    orientation = None
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            return None
+        if byte != b"\xff":
+            continue
+
+        marker = stream.read(1)
+        while marker == b"\xff":
+            marker = stream.read(1)
+        if not marker:
+            return None
+
+        marker = marker[0]
+        if marker in STANDALONE_MARKERS:
+            continue
+        if marker in (0xD9, 0xDA):  # End of image/start of scan before any frame header
+            return None
+
+        length = stream.read(2)
+        if len(length) < 2:
+            return None
+        length = struct.unpack(">H", length)[0] - 2
+
+        if marker in SOF_MARKERS:
+            frame = stream.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">HH", frame[1:5])
+            if orientation in TRANSPOSED_ORIENTATIONS:
+                height, width = width, height
+            return height, width
+
+        payload = stream.read(length)
+        if marker == 0xE1 and orientation is None:
+            orientation = _exif_orientation(payload)
+
+
+def read_image_size(stream):
+    """
+    Reads the size of an image from the header of an encoded file. Only the bytes needed to \
+    find the size are read from the stream. Supported formats are PNG, JPEG, WebP and BMP. JPEG \
+    EXIF orientation is taken into account, like when decoding.
+
+    :param stream: Binary stream positioned at the start of the file
+    :type stream: :class:`io.BufferedIOBase`
+    :return: Image height and width, or None if the format isn't supported or the header is \
+    invalid
+    :rtype: :class:`tuple`
+    """
+    head = stream.read(32)
+
+    if head[:8] == PNG_SIGNATURE and head[12:16] == b"IHDR" and len(head) >= 24:
+        width, height = struct.unpack(">II", head[16:24])
+        return height, width
+
+    if head[:2] == b"\xff\xd8":
+        return _jpeg_size(_PrefixedStream(head[2:], stream))
+
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP" and len(head) >= 30:
+        chunk = head[12:16]
+        if chunk == b"VP8 " and head[23:26] == b"\x9d\x01\x2a":
+            width, height = struct.unpack("<HH", head[26:30])
+            return height & 0x3FFF, width & 0x3FFF
+        if chunk == b"VP8L" and head[20] == 0x2F:
+            bits = struct.unpack("<I", head[21:25])[0]
+            return ((bits >> 14) & 0x3FFF) + 1, (bits & 0x3FFF) + 1
+        if chunk == b"VP8X":
+            width = int.from_bytes(head[24:27], "little") + 1
+            height = int.from_bytes(head[27:30], "little") + 1
+            return height, width
+        return None
+
+    if head[:2] == b"BM" and len(head) >= 26:
+        header_size = struct.unpack("<I", head[14:18])[0]
+        if header_size == 12:
+            width, height = struct.unpack("<HH", head[18:22])
+        else:
+            width, height = struct.unpack("<ii", head[18:26])
+        return abs(height), width
+
+    return None
+
+
+def image_format(head):
+    """
+    Returns the format of an image given the first bytes of its file.
+
+    :param head: First bytes of the file (at least 12)
+    :type head: :class:`bytes`
+    :return: Image format ("png", "jpeg", "webp" or "bmp"), or None if it isn't supported
+    :rtype: :class:`str`
+    """
+    if head[:8] == PNG_SIGNATURE:
+        return "png"
+    if head[:2] == b"\xff\xd8":
+        return "jpeg"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    if head[:2] == b"BM":
+        return "bmp"
+    return None
+
+
+def image_header(source):
+    """
+    Reads the format and shape of an image from the header of its file, without decoding it. \
+    Images are always decoded in color so the shape always has 3 channels.
+
+    :param source: Path/Link to an image or encoded image
+    :type source: :class:`str`/:class:`bytes`
+    :return: Image format ("png", "jpeg", "webp" or "bmp") and shape (height, width, channels), \
+    or None if they can't be read from the header
+    :rtype: :class:`tuple`
+    """
+    try:
+        if (
+            isinstance(source, str)
+            and not os.path.isfile(source)
+            and get_cache() is not None
+        ):
+            # The whole file is cached, so decoding it later doesn't download it again
+            source = fetch(source)
+
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            stream = io.BytesIO(source)
+            head = stream.read(32)
+            size = read_image_size(_PrefixedStream(head, stream))
+        elif os.path.isfile(source):
+            with open(source, "rb") as f:
+                head = f.read(32)
+                size = read_image_size(_PrefixedStream(head, f))
+        else:
+            with open_url(source, stream=True) as response:
+                response.raw.decode_content = True
+                head = response.raw.read(32)
+                size = read_image_size(_PrefixedStream(head, response.raw))
+    except (InvalidPathError, ImageDownloadError, ValueError, OSError):
+        return None
+
+    if size is None:
+        return None
+    return image_format(head), size + (3,)
+
+
+def image_shape(source):
+    """
+    Returns the shape the array of an image will have once decoded, by reading only the header \
+    of the file. Images are always decoded in color so they always have 3 channels.
+
+    :param source: Path/Link to an image or encoded image
+    :type source: :class:`str`/:class:`bytes`
+    :return: Image shape (height, width, channels), or None if it can't be read from the header
+    :rtype: :class:`tuple`
+    """
+    header = image_header(source)
+    return None if header is None else header[1]
@@ -0,0 +1,189 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from easycv.errors.io import ImageDownloadError, InvalidPathError
+
+# Settings of the shared session (see configure)
+_settings = {"pool_size": 16, "retries": 3, "backoff": 0.5, "timeout": 10}
+_session = None
+_cache = None
+_lock = threading.Lock()
+
+
+def configure(pool_size=16, retries=3, backoff=0.5, timeout=10):
+    """
+    Configures the HTTP client used to download images. All downloads share a session with a \
+    pool of keep-alive connections per host. Failed requests (connection errors and 429/5xx \
+    responses) are retried with exponential backoff.
+
+    :param pool_size: Maximum number of connections kept per host (and default number of \
+    concurrent downloads), defaults to 16
+    :type pool_size: :class:`int`, optional
+    :param retries: Number of retries of failed requests, defaults to 3
+    :type retries: :class:`int`, optional
+    :param backoff: Backoff factor between retries in seconds (the delays are `backoff`, \
+    `2 * backoff`, `4 * backoff`...), defaults to 0.5
+    :type backoff: :class:`float`, optional
+    :param timeout: Timeout of connections and reads in seconds, defaults to 10
+    :type timeout: :class:`float`, optional
+    """
+    global _session
+    with _lock:
+        _settings.update(
+            pool_size=pool_size, retries=retries, backoff=backoff, timeout=timeout
+        )
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def get_session():
+    """
+    Returns the session shared by all downloads, creating it if needed.
+
+    :return: HTTP session
+    :rtype: :class:`requests.Session`
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            retry = Retry(
+                total=_settings["retries"],
+                backoff_factor=_settings["backoff"],
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=_settings["pool_size"],
+                pool_maxsize=_settings["pool_size"],
+                max_retries=retry,
+            )
+            _session = requests.Session()
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+        return _session
+
+
+def set_cache(cache):
+    """
+    Sets the cache used by all downloads (see :class:`~easycv.io.cache.URLCache`). Files \
+    already in the cache are revalidated with the server and only downloaded again if they \
+    changed, or read from the cache if the server can't be reached or keeps failing (429/5xx).
+
+    :param cache: Cache or None to disable caching
+    :type cache: :class:`~easycv.io.cache.URLCache`
+    """
+    global _cache
+    _cache = cache
+
+
+def get_cache():
+    """
+    Returns the cache used by all downloads.
+
+    :return: Cache or None if caching is disabled
+    :rtype: :class:`~easycv.io.cache.URLCache`
+    """
+    return _cache
+
+
+def open_url(url, stream=False, headers=None):
+    """
+    Sends a GET request using the shared session.
+
+    :param url: Link to a file
+    :type url: :class:`str`
+    :param stream: `True` to read the body of the response as it is needed, defaults to \
+    `False`
+    :type stream: :class:`bool`, optional
+    :param headers: Extra headers of the request, if given (conditional requests) \
+    *304 Not Modified* responses are returned instead of raising an error, defaults to None
+    :type headers: :class:`dict`, optional
+    :return: Response
+    :rtype: :class:`requests.Response`
+    """
+    try:
+        response = get_session().get(
+            url, stream=stream, headers=headers, timeout=_settings["timeout"]
+        )
+    except (
+        requests.exceptions.InvalidURL,
+        requests.exceptions.InvalidSchema,
+        requests.exceptions.MissingSchema,
+        requests.exceptions.ConnectionError,
+    ):
+        raise InvalidPathError("File path is invalid.") from None
+    except requests.exceptions.RequestException as e:
+        raise ImageDownloadError("Failed to Download file, {}.".format(e)) from None
+
+    if response.status_code != 200 and not (headers and response.status_code == 304):
+        response.close()
+        raise ImageDownloadError(
+            "Failed to Download file, error {}.".format(response.status_code),
+            status=response.status_code,
+        )
+    return response
+
+
+def fetch(url):
+    """
+    Downloads a file using the shared session and the cache (see :func:`set_cache`).
+
+    :param url: Link to a file
+    :type url: :class:`str`
+    :return: Contents of the file
+    :rtype: :class:`bytes`
+    """
+    cache = _cache
+    if cache is None:
+        with open_url(url) as response:
+            return response.content
+
+    entry = cache.get(url)
+    headers = {}
+    if entry is not None:
+        meta, data = entry
+        if meta["etag"]:
+            headers["If-None-Match"] = meta["etag"]
+        if meta["last_modified"]:
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        response = open_url(url, headers=headers)
+    except (InvalidPathError, ImageDownloadError) as e:
+        # The server is unreachable or failing (after retries), the cached file is used
+        status = getattr(e, "status", None)
+        if entry is None or (status is not None and status != 429 and status < 500):
+            raise
+        return data
+
+    with response:
+        if response.status_code == 304:
+            return data
+        content = response.content
+        cache.put(
+            url,
+            content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return content
+
+
+def fetch_all(urls, workers=None):
+    """
+    Downloads multiple files concurrently using the shared session.
+
+    :param urls: Links to the files
+    :type urls: :class:`list`
+    :param workers: Number of concurrent downloads, defaults to the connection pool size
+    :type workers: :class:`int`, optional
+    :return: Contents of the files, in the same order as the links
+    :rtype: :class:`list`
+    """
+    with ThreadPoolExecutor(max_workers=workers or _settings["pool_size"]) as executor:
+        return list(executor.map(fetch, urls))
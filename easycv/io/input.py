@@ -1,13 +1,18 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-from urllib.error import URLError
-from urllib.request import urlopen
 from json import loads
 
 import cv2
 import numpy as np
 
-from easycv.errors.io import ImageDownloadError, InvalidPathError
+from easycv.errors.io import ImageDecodeError, InvalidPathError
+from easycv.io.discovery import discover_images
+from easycv.io.http import fetch, fetch_all
+from easycv.io.tiles import TileStore
+
+# Types of in-memory encoded images (the contents of an image file)
+ENCODED_TYPES = (bytes, bytearray, memoryview)
 
 
 def valid_image_array(image_array):
@@ -29,44 +34,76 @@ def valid_image_array(image_array):
 def valid_image_source(source):
     """
     Returns `True` if a source is valid
-    A source is valid if it is a string or a :class:`~numpy:numpy.ndarray`
+    A source is valid if it is a string, an encoded image (:class:`bytes`), a \
+    :class:`~numpy:numpy.ndarray` or a :class:`~easycv.io.tiles.TileStore`
 
     :param source: Source of an image
-    :type source: :class:`str`/:class:`~numpy:numpy.ndarray`
+    :type source: :class:`str`/:class:`bytes`/:class:`~numpy:numpy.ndarray`/\
+    :class:`~easycv.io.tiles.TileStore`
     :return: Returns `True` if a source is valid, otherwise `False`
     :rtype: :class:`bool`
     """
     source_is_str = isinstance(source, str)
     source_is_array = isinstance(source, np.ndarray)
-    return source_is_str or (source_is_array and valid_image_array(source))
-
-
-def open_image(path):
+    source_is_encoded = isinstance(source, ENCODED_TYPES)
+    source_is_store = isinstance(source, TileStore)
+    return (
+        source_is_str
+        or source_is_encoded
+        or source_is_store
+        or (source_is_array and valid_image_array(source))
+    )
+
+
+# Decoding flags by (grayscale, reduction)
+DECODE_FLAGS = {
+    (False, 1): cv2.IMREAD_COLOR,
+    (False, 2): cv2.IMREAD_REDUCED_COLOR_2,
+    (False, 4): cv2.IMREAD_REDUCED_COLOR_4,
+    (False, 8): cv2.IMREAD_REDUCED_COLOR_8,
+    (True, 1): cv2.IMREAD_GRAYSCALE,
+    (True, 2): cv2.IMREAD_REDUCED_GRAYSCALE_2,
+    (True, 4): cv2.IMREAD_REDUCED_GRAYSCALE_4,
+    (True, 8): cv2.IMREAD_REDUCED_GRAYSCALE_8,
+}
+
+
+def open_image(path, grayscale=False, reduction=1):
     """
-    Opens/Downloads an image and reads it into an array
-
-    :param path: Path/Link to an image
-    :type path: :class:`str`
+    Opens/Downloads an image and reads it into an array. Images are downloaded with the \
+    shared HTTP client (see :func:`~easycv.io.http.configure`). Images that are already in \
+    memory (the encoded contents of a file) are decoded without copying them. The image can be \
+    decoded directly in grayscale and/or at a reduced size. JPEG images are reduced while \
+    decoding (in the DCT domain), which is much faster than decoding at full size and resizing \
+    afterwards.
+
+    :param path: Path/Link to an image or encoded image
+    :type path: :class:`str`/:class:`bytes`
+    :param grayscale: `True` to decode the image in grayscale, defaults to `False`
+    :type grayscale: :class:`bool`, optional
+    :param reduction: Factor to reduce the image size while decoding (1, 2, 4 or 8), defaults \
+    to 1
+    :type reduction: :class:`int`, optional
     :return: Image as an array
     :rtype: :class:`~numpy:numpy.ndarray`
     """
-    try:
-        if os.path.isfile(path):
-            img = cv2.imread(path)
-        else:
-            response = urlopen(path)
-            if response.getcode() != 200:
-                raise ImageDownloadError(
-                    "Failed to Download file, error {}.".format(response.getcode())
-                )
-            img = np.asarray(bytearray(response.read()), dtype="uint8")
-            img = cv2.imdecode(img, cv2.IMREAD_COLOR)
-            if not isinstance(img, np.ndarray):
-                raise InvalidPathError("The given path is not an image.")
+    if (grayscale, reduction) not in DECODE_FLAGS:
+        raise ValueError("Reduction must be 1, 2, 4 or 8.")
+    flags = DECODE_FLAGS[(grayscale, reduction)]
+
+    if isinstance(path, ENCODED_TYPES):
+        img = cv2.imdecode(np.frombuffer(path, dtype="uint8"), flags)
+        if img is None:
+            raise ImageDecodeError("The given data is not an image.")
         return img
 
-    except URLError:
-        raise InvalidPathError("File path is invalid.") from None
+    if os.path.isfile(path):
+        return cv2.imread(path, flags)
+
+    img = cv2.imdecode(np.frombuffer(fetch(path), dtype="uint8"), flags)
+    if not isinstance(img, np.ndarray):
+        raise InvalidPathError("The given path is not an image.")
+    return img
 
 
 def random_dog_image():
@@ -77,56 +114,112 @@ def random_dog_image():
     :return: Link to a random dog image
     :rtype: :class:`str`
     """
-    response = urlopen("https://dog.ceo/api/breeds/image/random")
-    if response.getcode() != 200:
-        raise ImageDownloadError(
-            "Failed to Download file, error {}.".format(response.getcode())
-        )
-    buf = response.read()
+    buf = fetch("https://dog.ceo/api/breeds/image/random")
     result = loads(buf.decode("utf-8"))
     return result["message"]
 
 
+def random_dog_images(length):
+    """
+    Makes concurrent requests to `DogApi <https://dog.ceo/dog-api/>`_ for random images and \
+    extracts the links from the responses.
+
+    :param length: Number of links
+    :type length: :class:`int`
+    :return: Links to random dog images
+    :rtype: :class:`list`
+    """
+    # The API returns at most 50 links per request
+    sizes = [min(50, length - start) for start in range(0, length, 50)]
+    urls = ["https://dog.ceo/api/breeds/image/random/{}".format(size) for size in sizes]
+    return [
+        link
+        for buf in fetch_all(urls)
+        for link in loads(buf.decode("utf-8"))["message"]
+    ]
+
+
+def is_read_only(image_array):
+    """
+    Checks if the data of an array can't be changed, through the array or through any of the \
+    arrays/buffers it is a view of.
+
+    :param image_array: Array to check
+    :type image_array: :class:`~numpy:numpy.ndarray`
+    :return: `True` if the data is read-only
+    :rtype: :class:`bool`
+    """
+    while isinstance(image_array, np.ndarray):
+        if image_array.flags.writeable:
+            return False
+        image_array = image_array.base
+    if image_array is None:
+        return True
+    try:
+        return memoryview(image_array).readonly
+    except TypeError:
+        return False
+
+
+def own_array(image_array):
+    """
+    Returns a read-only array with the data of the given array. The data is copied unless it \
+    is read-only (see :func:`is_read_only`), so it can't be changed by the caller afterwards.
+
+    :param image_array: Array of an image
+    :type image_array: :class:`~numpy:numpy.ndarray`
+    :return: Read-only array
+    :rtype: :class:`~numpy:numpy.ndarray`
+    """
+    image_array = (
+        image_array.view() if is_read_only(image_array) else image_array.copy()
+    )
+    image_array.flags.writeable = False
+    return image_array
+
+
 def get_image_array(image_source):
     """
-    :param image_source: Path/Link to an image or an array of an image
-    :type image_source: :class:`~numpy:numpy.ndarray`/:class:`str`
+    Returns the array of an image. Arrays are only copied if their data can be changed, \
+    read-only arrays are shared (see :func:`own_array`).
+
+    :param image_source: Path/Link to an image, an encoded image, an array of an image or a \
+    tile store
+    :type image_source: :class:`~numpy:numpy.ndarray`/:class:`str`/:class:`bytes`/\
+    :class:`~easycv.io.tiles.TileStore`
     :return: image as an array
     :rtype: :class:`~numpy:numpy.ndarray`
     """
-    if isinstance(image_source, str):
+    if isinstance(image_source, (str,) + ENCODED_TYPES):
         return open_image(image_source)
+    elif isinstance(image_source, TileStore):
+        return image_source.read()
     else:
-        return np.copy(image_source)
+        return own_array(image_source)
 
 
-def open_folder(list_source, recursive=False):
+def open_folder(list_source, recursive=False, workers=None):
     """
-    Searches in the folder path given for the images present
+    Searches in the folder path given for the images present (see \
+    :func:`~easycv.io.discovery.discover_images`). Images are decoded in parallel by a pool of \
+    threads.
 
     :param list_source: Path to a folder of images
     :type list_source: :class:`str`
     :param recursive: Flag to allow search in the all directories of the folder
     :type recursive: :class:`bool`
+    :param workers: Number of threads, defaults to min(32, number of processors + 4)
+    :type workers: :class:`int`, optional
     :return: list of images
     :rtype: :class:`list`
     """
-    if not recursive:
-        paths = [os.path.join(list_source, fn) for fn in next(os.walk(list_source))[2]]
-    else:
-        paths = []
-        for root, _, files in os.walk(list_source):
-            for filename in files:
-                paths.append(os.path.join(root, filename))
-    images = []
-    for file in paths:
-        tmp = get_image_array(file)
-        if tmp is not None:
-            images.append(tmp)
-    return images
+    paths = discover_images(list_source, recursive=recursive)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        images = list(executor.map(get_image_array, paths))
+    return [image for image in images if image is not None]
 
 
-def get_image_list(list_source, recursive=False):
+def get_image_list(list_source, recursive=False, workers=None):
     """
     Gets all the images from a folder
 
@@ -134,10 +227,13 @@ def get_image_list(list_source, recursive=False):
     :type list_source: :class:`str`
     :param recursive: Flag to allow search in the all directories of the folder
     :type recursive: :class:`bool`
+    :param workers: Number of threads used to decode the images, defaults to min(32, number \
+    of processors + 4)
+    :type workers: :class:`int`, optional
     :return: list of images
     :rtype: :class:`list`
     """
     if isinstance(list_source, str):
-        return open_folder(list_source, recursive=recursive)
+        return open_folder(list_source, recursive=recursive, workers=workers)
     else:
         return np.copy(list_source)
@@ -0,0 +1,119 @@
+import struct
+
+import cv2
+import numpy as np
+
+from easycv.errors.io import ImageDecodeError
+
+MAGIC = b"ECVI"
+VERSION = 1
+
+# magic, version, codec, dtype, height, width, channels (32 bytes)
+HEADER = struct.Struct("<4sBB2x4sIII8x")
+
+CODECS = {"raw": 0, "png": 1, "jpeg": 2, "webp": 3}
+CODEC_NAMES = {code: name for name, code in CODECS.items()}
+
+QUALITY_FLAGS = {
+    "png": cv2.IMWRITE_PNG_COMPRESSION,
+    "jpeg": cv2.IMWRITE_JPEG_QUALITY,
+    "webp": cv2.IMWRITE_WEBP_QUALITY,
+}
+
+
+def serialize(image_array, codec=None, quality=None):
+    """
+    Serializes an image array into a binary message. The message has a 32 byte header (with \
+    the shape and data type of the array) followed by the raw array data or by the image \
+    compressed with one of the supported codecs:
+    \t**∙ raw** - Raw array data, no compression (default)\n
+    \t**∙ png** - Lossless compression, `quality` is the compression level (0-9)\n
+    \t**∙ jpeg** - Lossy compression, `quality` ranges from 0 to 100\n
+    \t**∙ webp** - Lossy compression, `quality` ranges from 1 to 100 (above 100 is lossless)\n
+
+    :param image_array: Image as an array
+    :type image_array: :class:`~numpy:numpy.ndarray`
+    :param codec: Codec used to compress the image, defaults to raw
+    :type codec: :class:`str`, optional
+    :param quality: Codec quality/compression level, defaults to the codec default
+    :type quality: :class:`int`, optional
+    :return: Serialized image
+    :rtype: :class:`bytes`
+    """
+    codec = codec if codec else "raw"
+    if codec not in CODECS:
+        raise ValueError("Codec must be one of: {}.".format(", ".join(CODECS)))
+
+    height, width = image_array.shape[:2]
+    channels = image_array.shape[2] if image_array.ndim == 3 else 1
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        CODECS[codec],
+        image_array.dtype.str.encode("ascii"),
+        height,
+        width,
+        channels,
+    )
+
+    if codec == "raw":
+        return header + np.ascontiguousarray(image_array).data
+
+    params = [] if quality is None else [QUALITY_FLAGS[codec], quality]
+    success, payload = cv2.imencode("." + codec, image_array, params)
+    if not success:
+        raise ValueError("Image can't be compressed with {}.".format(codec))
+    return header + payload.tobytes()
+
+
+def read_header(buffer):
+    """
+    Reads the header of a binary message created with :func:`serialize`, without decoding the \
+    image.
+
+    :param buffer: Serialized image
+    :type buffer: :class:`bytes`/:class:`bytearray`/:class:`memoryview`
+    :return: Codec, shape and data type of the image
+    :rtype: :class:`tuple`
+    """
+    view = memoryview(buffer).cast("B")
+    if len(view) < HEADER.size:
+        raise ImageDecodeError("Buffer is too small to contain an image.")
+
+    magic, version, codec, dtype, height, width, channels = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ImageDecodeError("Buffer doesn't contain a serialized image.")
+    if version != VERSION or codec not in CODEC_NAMES:
+        raise ImageDecodeError("Unsupported image serialization format.")
+
+    shape = (height, width) if channels == 1 else (height, width, channels)
+    dtype = np.dtype(dtype.rstrip(b"\x00").decode("ascii"))
+    return CODEC_NAMES[codec], shape, dtype
+
+
+def deserialize(buffer):
+    """
+    Deserializes an image array from a binary message created with :func:`serialize`. Raw \
+    images aren't copied, the array is a view of the buffer (read-only if the buffer is \
+    read-only, like :class:`bytes`).
+
+    :param buffer: Serialized image
+    :type buffer: :class:`bytes`/:class:`bytearray`/:class:`memoryview`
+    :return: Image as an array
+    :rtype: :class:`~numpy:numpy.ndarray`
+    """
+    view = memoryview(buffer).cast("B")
+    codec, shape, dtype = read_header(view)
+
+    if codec == "raw":
+        count = int(np.prod(shape))
+        if len(view) - HEADER.size < count * dtype.itemsize:
+            raise ImageDecodeError("Buffer is too small to contain the image data.")
+        image_array = np.frombuffer(view, dtype=dtype, count=count, offset=HEADER.size)
+        return image_array.reshape(shape)
+
+    payload = np.frombuffer(view, dtype="uint8", offset=HEADER.size)
+    image_array = cv2.imdecode(payload, cv2.IMREAD_UNCHANGED)
+    if image_array is None or image_array.shape != shape:
+        raise ImageDecodeError("Failed to decode the image data.")
+    return image_array.astype(dtype, copy=False)
@@ -0,0 +1,99 @@
+import weakref
+from multiprocessing import shared_memory, resource_tracker
+
+import numpy as np
+
+# Segments created by this process (or inherited from the parent when forked)
+_segments = weakref.WeakValueDictionary()
+
+
+def _release(segment, owner):
+    if owner:
+        segment.unlink()
+    try:
+        segment.close()
+    except BufferError:
+        pass  # Arrays using the segment are still alive, it is unmapped when they are collected
+
+
+def attach_shared_array(name, shape, dtype):
+    """
+    Attaches to an array in shared memory created by another process. Used to unpickle \
+    :class:`SharedArray` handles.
+
+    :param name: Name of the shared memory segment
+    :type name: :class:`str`
+    :param shape: Shape of the array
+    :type shape: :class:`tuple`
+    :param dtype: Data type of the array
+    :type dtype: :class:`str`
+    :return: Shared array
+    :rtype: :class:`SharedArray`
+    """
+    shared = _segments.get(name)
+    if shared is not None:
+        return shared
+
+    segment = shared_memory.SharedMemory(name=name)
+    # The creator of the segment is responsible for unlinking it, so it must not be unlinked by
+    # the resource tracker of this process when it exits
+    resource_tracker.unregister(segment._name, "shared_memory")
+
+    shared = SharedArray.__new__(SharedArray)
+    shared._setup(segment, shape, dtype, owner=False)
+    return shared
+
+
+class SharedArray:
+    """
+    This class represents a read-only NumPy array stored in shared memory. When pickled only a \
+    handle (name, shape and data type) is serialized, so sending the array to another process \
+    costs the same regardless of its size. The receiving process maps the same memory without \
+    copying it.
+
+    The process that creates the array owns the shared memory and releases it when the \
+    **shared array** is garbage collected, so it must outlive its use by other processes.
+
+    :param array: Array to copy into shared memory
+    :type array: :class:`~numpy:numpy.ndarray`
+    """
+
+    def __init__(self, array):
+        segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._setup(segment, array.shape, array.dtype, owner=True, data=array)
+        _segments[segment.name] = self
+
+    def _setup(self, segment, shape, dtype, owner, data=None):
+        self._segment = segment
+        self._array = np.ndarray(shape, dtype=dtype, buffer=segment.buf)
+        if data is not None:
+            self._array[...] = data
+        self._array.flags.writeable = False
+        self._finalizer = weakref.finalize(self, _release, segment, owner)
+
+    @property
+    def name(self):
+        """
+        Returns the name of the shared memory segment.
+
+        :return: Segment name
+        :rtype: :class:`str`
+        """
+        return self._segment.name
+
+    @property
+    def array(self):
+        """
+        Returns the array (read-only) stored in shared memory.
+
+        :return: Shared array
+        :rtype: :class:`~numpy:numpy.ndarray`
+        """
+        return self._array
+
+    def __reduce__(self):
+        return attach_shared_array, (
+            self.name,
+            self._array.shape,
+            self._array.dtype.str,
+        )
@@ -0,0 +1,132 @@
+import threading
+import weakref
+from collections import OrderedDict
+
+from easycv.io.serialize import serialize, deserialize, read_header
+
+STORAGES = ("memory", "compressed")
+
+# Decoded arrays of the most recently used compressed arrays (by id of the compressed array)
+_decoded = OrderedDict()
+_decoded_lock = threading.Lock()
+_decoded_size = 16
+
+
+def set_decoded_cache_size(size):
+    """
+    Sets how many decoded arrays of :class:`CompressedArray` objects are kept in memory. The \
+    least recently used arrays are dropped first.
+
+    :param size: Maximum number of decoded arrays, 0 disables the cache
+    :type size: :class:`int`
+    """
+    global _decoded_size
+    with _decoded_lock:
+        _decoded_size = size
+        while len(_decoded) > _decoded_size:
+            _decoded.popitem(last=False)
+
+
+def _remember(key, array):
+    with _decoded_lock:
+        _decoded[key] = array
+        _decoded.move_to_end(key)
+        while len(_decoded) > _decoded_size:
+            _decoded.popitem(last=False)
+
+
+def _forget(key):
+    with _decoded_lock:
+        _decoded.pop(key, None)
+
+
+def _from_data(data):
+    compressed = CompressedArray.__new__(CompressedArray)
+    compressed._setup(data)
+    return compressed
+
+
+class CompressedArray:
+    """
+    This class represents a read-only NumPy array kept compressed in memory. The array is \
+    decoded on access and the most recently used decoded arrays are cached (see \
+    :func:`set_decoded_cache_size`), so memory usage follows the compressed size. By default \
+    images are compressed with PNG at the fastest compression level, which is lossless (arrays \
+    that PNG doesn't support are kept uncompressed). When pickled only the compressed data is \
+    serialized.
+
+    :param array: Array to compress
+    :type array: :class:`~numpy:numpy.ndarray`
+    :param codec: Codec used to compress the array (see \
+    :func:`~easycv.io.serialize.serialize`), defaults to png
+    :type codec: :class:`str`, optional
+    :param quality: Codec quality/compression level, defaults to 1
+    :type quality: :class:`int`, optional
+    """
+
+    def __init__(self, array, codec="png", quality=1):
+        channels = array.shape[2] if array.ndim == 3 else 1
+        if codec == "png" and (array.dtype.str not in ("|u1", "<u2") or channels == 2):
+            codec, quality = "raw", None  # Not supported by PNG, stored uncompressed
+        self._setup(serialize(array, codec=codec, quality=quality))
+        # Writeable arrays can change, decode them when needed
+        if not array.flags.writeable:
+            _remember(id(self), array)
+
+    def _setup(self, data):
+        self._data = data
+        _, self._shape, self._dtype = read_header(data)
+        weakref.finalize(self, _forget, id(self))
+
+    @property
+    def shape(self):
+        """
+        Returns the shape of the array, without decoding it.
+
+        :return: Array shape
+        :rtype: :class:`tuple`
+        """
+        return self._shape
+
+    @property
+    def dtype(self):
+        """
+        Returns the data type of the array, without decoding it.
+
+        :return: Array data type
+        :rtype: :class:`~numpy:numpy.dtype`
+        """
+        return self._dtype
+
+    @property
+    def nbytes(self):
+        """
+        Returns the size of the compressed data.
+
+        :return: Compressed size in bytes
+        :rtype: :class:`int`
+        """
+        return len(self._data)
+
+    @property
+    def array(self):
+        """
+        Returns the decoded array (read-only).
+
+        :return: Decoded array
+        :rtype: :class:`~numpy:numpy.ndarray`
+        """
+        key = id(self)
+        with _decoded_lock:
+            array = _decoded.get(key)
+            if array is not None:
+                _decoded.move_to_end(key)
+                return array
+
+        array = deserialize(self._data)
+        array.flags.writeable = False
+        _remember(key, array)
+        return array
+
+    def __reduce__(self):
+        return _from_data, (self._data,)
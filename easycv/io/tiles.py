@@ -0,0 +1,237 @@
+import os
+import json
+import threading
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+from easycv.errors.io import ImageDecodeError
+
+TILE_CODECS = ("png", "jpeg", "webp")
+
+
+class TileStore:
+    """
+    This class represents a large image stored on disk as a pyramid of compressed tiles. The \
+    store is a directory with a `meta.json` file and one directory per level (level 0 is the \
+    full resolution image, each level has half the width and height of the previous one) with \
+    the tiles of the level named `<row>.<col>.<codec>`. Only the tiles that intersect a \
+    requested region are decoded, and the most recently used tiles are cached, so parts of \
+    images that don't fit in memory can be read quickly.
+
+    Use :meth:`create` to write a store. Lazy :class:`~easycv.image.Image` objects can use a \
+    store as their source, leading crops, perspective transforms and pyramid downscales only \
+    read the tiles they need.
+
+    :param path: Path to the store directory
+    :type path: :class:`str`
+    :param cache_size: Maximum number of decoded tiles kept in memory, defaults to 64
+    :type cache_size: :class:`int`, optional
+    """
+
+    def __init__(self, path, cache_size=64):
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+
+        self._path = path
+        self._cache_size = cache_size
+        self._tile_size = meta["tile_size"]
+        self._codec = meta["codec"]
+        self._dtype = np.dtype(meta["dtype"])
+        self._shapes = [tuple(shape) for shape in meta["levels"]]
+        self._tiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, path, image_array, tile_size=256, levels=None, codec="png"):
+        """
+        Writes an image array to a new tile store. Levels are added until the image fits in \
+        a single tile.
+
+        :param path: Path to the store directory
+        :type path: :class:`str`
+        :param image_array: Image as an array
+        :type image_array: :class:`~numpy:numpy.ndarray`
+        :param tile_size: Width and height of the tiles, defaults to 256
+        :type tile_size: :class:`int`, optional
+        :param levels: Maximum number of levels, defaults to all the levels
+        :type levels: :class:`int`, optional
+        :param codec: Codec used to compress the tiles ("png", "jpeg" or "webp"), defaults to \
+        png (lossless)
+        :type codec: :class:`str`, optional
+        :return: The new store
+        :rtype: :class:`TileStore`
+        """
+        if codec not in TILE_CODECS:
+            raise ValueError("Codec must be one of: {}.".format(", ".join(TILE_CODECS)))
+
+        shapes = []
+        level = image_array
+        while True:
+            directory = os.path.join(path, str(len(shapes)))
+            os.makedirs(directory, exist_ok=True)
+            for y in range(0, level.shape[0], tile_size):
+                for x in range(0, level.shape[1], tile_size):
+                    tile = np.ascontiguousarray(
+                        level[y : y + tile_size, x : x + tile_size]
+                    )
+                    name = "{}.{}.{}".format(y // tile_size, x // tile_size, codec)
+                    success, data = cv2.imencode("." + codec, tile)
+                    if not success:
+                        raise ValueError(
+                            "Image can't be compressed with {}.".format(codec)
+                        )
+                    data.tofile(os.path.join(directory, name))
+            shapes.append(level.shape)
+
+            height, width = level.shape[:2]
+            if len(shapes) == levels or (height <= tile_size and width <= tile_size):
+                break
+            size = ((width + 1) // 2, (height + 1) // 2)
+            level = cv2.resize(level, size, interpolation=cv2.INTER_AREA)
+
+        # The metadata is written last, so incomplete stores can't be opened
+        meta = {
+            "tile_size": tile_size,
+            "codec": codec,
+            "dtype": image_array.dtype.str,
+            "levels": shapes,
+        }
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        return cls(path)
+
+    @property
+    def path(self):
+        """
+        Returns the path to the store directory.
+
+        :return: Store path
+        :rtype: :class:`str`
+        """
+        return self._path
+
+    @property
+    def shape(self):
+        """
+        Returns the shape of the full resolution image.
+
+        :return: Image shape
+        :rtype: :class:`tuple`
+        """
+        return self._shapes[0]
+
+    @property
+    def levels(self):
+        """
+        Returns the number of levels of the store.
+
+        :return: Number of levels
+        :rtype: :class:`int`
+        """
+        return len(self._shapes)
+
+    @property
+    def tile_size(self):
+        """
+        Returns the width and height of the tiles.
+
+        :return: Tile size
+        :rtype: :class:`int`
+        """
+        return self._tile_size
+
+    def level_shape(self, level):
+        """
+        Returns the shape of the image at a given level.
+
+        :param level: Pyramid level (0 is the full resolution image)
+        :type level: :class:`int`
+        :return: Image shape at the level
+        :rtype: :class:`tuple`
+        """
+        return self._shapes[level]
+
+    def tile(self, level, row, col):
+        """
+        Returns a decoded tile (read-only). Tiles are cached, the least recently used tiles are \
+        dropped first.
+
+        :param level: Pyramid level
+        :type level: :class:`int`
+        :param row: Tile row
+        :type row: :class:`int`
+        :param col: Tile column
+        :type col: :class:`int`
+        :return: Tile array
+        :rtype: :class:`~numpy:numpy.ndarray`
+        """
+        key = (level, row, col)
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._tiles.move_to_end(key)
+                return tile
+
+        name = "{}.{}.{}".format(row, col, self._codec)
+        data = np.fromfile(os.path.join(self._path, str(level), name), dtype="uint8")
+        tile = cv2.imdecode(data, cv2.IMREAD_UNCHANGED)
+        if tile is None:
+            raise ImageDecodeError(
+                "Failed to decode tile {} of level {}.".format(name, level)
+            )
+        tile.flags.writeable = False
+
+        with self._lock:
+            self._tiles[key] = tile
+            while len(self._tiles) > self._cache_size:
+                self._tiles.popitem(last=False)
+        return tile
+
+    def read(self, level=0, rectangle=None):
+        """
+        Reads a region of the image at a given level, decoding only the tiles it intersects.
+
+        :param level: Pyramid level (0 is the full resolution image), defaults to 0
+        :type level: :class:`int`, optional
+        :param rectangle: Region to read, a 2-tuple with the upper left and lower right \
+        corners (like :class:`~easycv.transforms.spatial.Crop`), in the coordinates of the \
+        level. The region is clipped to the image. Defaults to the whole image
+        :type rectangle: :class:`tuple`, optional
+        :return: Region of the image
+        :rtype: :class:`~numpy:numpy.ndarray`
+        """
+        if not 0 <= level < len(self._shapes):
+            raise ValueError(
+                "Level must be between 0 and {}.".format(len(self._shapes) - 1)
+            )
+
+        shape = self._shapes[level]
+        if rectangle is None:
+            rectangle = ((0, 0), (shape[1], shape[0]))
+        (left, top), (right, bottom) = rectangle
+        left, right = max(left, 0), min(right, shape[1])
+        top, bottom = max(top, 0), min(bottom, shape[0])
+
+        region = np.zeros(
+            (max(bottom - top, 0), max(right - left, 0)) + shape[2:], dtype=self._dtype
+        )
+        size = self._tile_size
+        for row in range(top // size, (bottom + size - 1) // size):
+            for col in range(left // size, (right + size - 1) // size):
+                tile = self.tile(level, row, col)
+                y0, x0 = max(top, row * size), max(left, col * size)
+                y1, x1 = min(bottom, (row + 1) * size), min(right, (col + 1) * size)
+                region[y0 - top : y1 - top, x0 - left : x1 - left] = tile[
+                    y0 - row * size : y1 - row * size, x0 - col * size : x1 - col * size
+                ]
+        return region
+
+    def __reduce__(self):
+        return self.__class__, (self._path, self._cache_size)
+
+    def __repr__(self):
+        return "<tile store size={}x{} levels={} at {}>".format(
+            self.shape[0], self.shape[1], self.levels, self._path
+        )
@@ -1,9 +1,13 @@
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy, deepcopy
 
 import ray
 
 import easycv.image
-from easycv.io import show_grid, get_image_list
+from easycv.io import show_grid, get_image_list, random_dog_images
+from easycv.io.discovery import discover_images
+from easycv.hashing import image_hashes
+from easycv.metrics import compare
 from easycv.collection import auto_compute
 from easycv.transforms.base import Transform
 from easycv.errors.list import InvalidListInputSource
@@ -15,36 +19,132 @@ class List:
     Lists can be created from a list of image objects or by asking for a random list of images.
     Images inside the List can be lazy (delayed computation) or normal (everything runs in \
     the moment). Lists support parallel processing, locally or in a distributed cluster.
+    Lazy lists created from a folder only hold the paths of the images, which are decoded when \
+    needed by a pool of threads. When iterating over a **list** the next images are decoded \
+    (and their pending operations applied) ahead of time.
 
-    :param images: List of the images to include
-    :type images: :class:`list`
+    :param images: List of the images to include, path to a folder of images or list of \
+    paths/urls (urls are downloaded concurrently, see :func:`~easycv.io.http.configure`)
+    :type images: :class:`list`/:class:`str`
+    :param recursive: Flag to include the images in all the directories of the folder, defaults \
+    to `False`
+    :type recursive: :class:`bool`, optional
+    :param lazy: `True` to create a List of lazy images, `False` otherwise, defaults to `False`
+    :type lazy: :class:`bool`, optional
+    :param storage: How the arrays of the images are kept in memory, "memory" (decoded) or \
+    "compressed" (see :meth:`~easycv.image.Image.set_storage`). Images created by operations \
+    on the **list** use the same storage, images given with another storage are copied (the \
+    copies share the arrays) instead of changed. Defaults to None (images are left as they are)
+    :type storage: :class:`str`, optional
+    :param workers: Number of threads used to decode images, defaults to min(32, number of \
+    processors + 4)
+    :type workers: :class:`int`, optional
+    :param prefetch: Number of images decoded ahead when iterating, 0 disables prefetching, \
+    defaults to 8. Iterating yields computed copies of lazy images, the images in the \
+    **list** stay lazy
+    :type prefetch: :class:`int`, optional
     """
 
-    def __init__(self, source, recursive=False, lazy=False):
+    def __init__(
+        self,
+        source,
+        recursive=False,
+        lazy=False,
+        storage=None,
+        workers=None,
+        prefetch=8,
+    ):
         if isinstance(source, list) and all(
             isinstance(i, easycv.image.Image) for i in source
         ):
+            # Images with another storage are copied (arrays are shared), the caller's images
+            # aren't changed
             self._images = source
+            if storage is not None:
+                self._images = [
+                    image if image.storage == storage else copy(image)
+                    for image in source
+                ]
         elif isinstance(source, str):
-            images = [
-                easycv.image.Image(img, lazy=lazy)
-                for img in get_image_list(source, recursive=recursive)
-            ]
+            if lazy:
+                sources = discover_images(source, recursive=recursive)
+                images = [
+                    easycv.image.Image(img, lazy=True, storage=storage or "memory")
+                    for img in sources
+                ]
+            else:
+                # Decoded arrays aren't used elsewhere, so the images take them without copying
+                sources = get_image_list(source, recursive=recursive, workers=workers)
+                images = [
+                    easycv.image.Image._from_array(img, storage=storage or "memory")
+                    for img in sources
+                ]
             self._images = images
+        elif isinstance(source, list) and all(isinstance(i, str) for i in source):
+
+            def create(img):
+                return easycv.image.Image(img, lazy=lazy, storage=storage or "memory")
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                self._images = list(executor.map(create, source))
         else:
             raise InvalidListInputSource()
+        self._storage = storage
+        self._workers = workers
+        self._prefetch = prefetch
+        self._set_storage(self._images)
+
+    def _new(self, images):
+        """
+        Creates a **list** with the same settings (storage, workers...) as the current one.
+        """
+        return List(
+            images,
+            storage=self._storage,
+            workers=self._workers,
+            prefetch=self._prefetch,
+        )
+
+    def _set_storage(self, images):
+        """
+        Changes the storage of images created by the **list** to the storage of the **list**.
+        """
+        if self._storage is not None:
+            for image in images:
+                image.set_storage(self._storage)
 
     def __getitem__(self, key):
         if isinstance(key, int):
             return self._images[key]
         elif isinstance(key, slice):
-            return List(self._images[key])
+            return self._new(self._images[key])
         else:
             raise TypeError("Unsupported type to access List.")
 
     def __len__(self):
         return len(self._images)
 
+    def __iter__(self):
+        if self._prefetch == 0:
+            yield from self._images
+            return
+
+        def prefetch(image):
+            # Computed copies are yielded, so iterating doesn't keep every decoded array
+            if not image.loaded or image.pending.num_transforms() > 0:
+                return image.compute(in_place=False)
+            return image
+
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            futures = {}
+            for index in range(len(self._images)):
+                for ahead in range(
+                    index, min(index + self._prefetch + 1, len(self._images))
+                ):
+                    if ahead not in futures:
+                        futures[ahead] = executor.submit(prefetch, self._images[ahead])
+                yield futures.pop(index).result()
+
     @staticmethod
     def start():
         """
@@ -74,8 +174,35 @@ class List:
         :return: Random list of Images
         :rtype: :class:`~easycv.list.List`
         """
-        images = [easycv.image.Image.random(lazy=lazy) for _ in range(length)]
-        return cls(images)
+        return cls(random_dog_images(length), lazy=lazy)
+
+    @classmethod
+    def from_bytes(cls, buffers, lazy=False, storage=None, workers=None):
+        """
+        Creates a list of images from serialized or encoded images (see \
+        :meth:`~easycv.image.Image.from_bytes`). Images are decoded in parallel by a pool of \
+        threads (decoding releases the GIL), unless they are lazy.
+
+        :param buffers: Iterable of serialized or encoded images
+        :type buffers: :class:`list`
+        :param lazy: `True` to create a List of lazy images (decoded when needed), `False` \
+        otherwise, defaults to `False`
+        :type lazy: :class:`bool`, optional
+        :param storage: How the arrays of the images are kept in memory, defaults to None
+        :type storage: :class:`str`, optional
+        :param workers: Number of threads, defaults to min(32, number of processors + 4)
+        :type workers: :class:`int`, optional
+        :return: List of Images
+        :rtype: :class:`~easycv.list.List`
+        """
+
+        def create(buffer):
+            image = easycv.image.Image.from_bytes(buffer, lazy=lazy)
+            return image if storage is None else image.set_storage(storage)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            images = list(executor.map(create, buffers))
+        return cls(images, storage=storage)
 
     @staticmethod
     @ray.remote
@@ -96,6 +223,9 @@ class List:
         (no computation is done).
         If `in_place` is *True* the operation will change the **current image** instead of \
         returning a new Image.
+        When running in parallel, loaded images (and image arguments of the operation) are \
+        moved into shared memory (see :meth:`~easycv.image.Image.share`) so they aren't copied \
+        to the workers.
 
         :param operation: Operation to be applied
         :type operation: :class:`~easycv.transforms.operation.Operation`
@@ -116,9 +246,16 @@ class List:
         outputs = operation.outputs
 
         if parallel:
-            operation = ray.put(operation)
+            # Workers receive shared memory handles instead of copies of the arrays
+            operation.share()
+            for image in self._images:
+                if image.loaded:
+                    image.share()
+
+            # Keep the operation referenced until the workers are done with its shared images
+            operation_ref = ray.put(operation)
             operation_outputs = ray.get(
-                [self._process_image.remote(operation, i) for i in self._images]
+                [self._process_image.remote(operation_ref, i) for i in self._images]
             )
         else:
             operation_outputs = [operation.apply(i) for i in self._images]
@@ -126,8 +263,9 @@ class List:
         if outputs == {}:
             if in_place:
                 self._images = operation_outputs
+                self._set_storage(self._images)
             else:
-                return List(operation_outputs)
+                return self._new(operation_outputs)
         else:
             return operation_outputs
 
@@ -151,12 +289,63 @@ class List:
         if parallel:
             images = ray.get([self._compute_image.remote(i) for i in self._images])
         else:
-            images = [i.compute(in_place=False) for i in self._images]
+            # Decoding releases the GIL, so images are decoded by a pool of threads
+            with ThreadPoolExecutor(max_workers=self._workers) as executor:
+                images = list(
+                    executor.map(lambda i: i.compute(in_place=False), self._images)
+                )
 
         if in_place:
             self._images = images
+            self._set_storage(self._images)
         else:
-            return List(images)
+            return self._new(images)
+
+    def hashes(self, hash_size=8, method="dhash", workers=None):
+        """
+        Computes the perceptual hashes of all the images in the **list** in parallel. See \
+        :func:`~easycv.hashing.image_hash` for the supported methods.
+
+        :param hash_size: Square root of the number of bits of the hash, defaults to 8
+        :type hash_size: :class:`int`, optional
+        :param method: Hashing method, defaults to dhash
+        :type method: :class:`str`, optional
+        :param workers: Number of threads, defaults to min(32, number of processors + 4)
+        :type workers: :class:`int`, optional
+        :return: Array of `uint64` hashes, or a 2D array of bytes (one row per image) for \
+        hashes larger than 64 bits
+        :rtype: :class:`~numpy:numpy.ndarray`
+        """
+        return image_hashes(
+            [lambda image=image: image.array for image in self._images],
+            hash_size=hash_size,
+            method=method,
+            workers=workers,
+        )
+
+    def compare(self, other, metric="psnr", workers=None):
+        """
+        Compares each image of the **list** with the image at the same position of another \
+        list in parallel (e.g. to check that the outputs of a pipeline match reference \
+        outputs). See :func:`~easycv.metrics.compare` for the supported metrics.
+
+        :param other: List with the same number of images
+        :type other: :class:`~easycv.list.List`
+        :param metric: Metric to evaluate, defaults to psnr
+        :type metric: :class:`str`, optional
+        :param workers: Number of threads, defaults to min(32, number of processors + 4)
+        :type workers: :class:`int`, optional
+        :return: Metric of each pair of images
+        :rtype: :class:`~numpy:numpy.ndarray`
+        """
+        if len(other) != len(self):
+            raise ValueError("Lists must have the same number of images.")
+        return compare(
+            [lambda image=image: image.array for image in self._images],
+            [lambda image=image: image.array for image in other._images],
+            metric=metric,
+            workers=workers,
+        )
 
     def copy(self):
         """
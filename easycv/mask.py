@@ -0,0 +1,144 @@
+import numpy as np
+
+import easycv.image
+
+# Number of set bits of each byte value
+BIT_COUNTS = np.unpackbits(np.arange(256, dtype="uint8")[:, None], axis=1).sum(axis=1)
+
+
+class BinaryMask:
+    """
+    This class represents a binary mask packed with 1 bit per pixel, so it uses 8 times less \
+    memory than an 8-bit mask (and is 8 times smaller when pickled into pipelines or sent to \
+    workers). Masks can be created from OpenCV masks (any non zero pixel is set), boolean \
+    arrays or :class:`~easycv.image.Image` objects and converted back with :attr:`array`. Set \
+    operations (`&`, `|`, `^`, `-` and `~`), counting and bounding boxes work directly on \
+    the packed bits.
+
+    :param mask: Mask as an array (2D or 3D, where a pixel is set if any channel is non zero) \
+    or as an image
+    :type mask: :class:`~numpy:numpy.ndarray`/:class:`~easycv.image.Image`
+    """
+
+    def __init__(self, mask):
+        if isinstance(mask, easycv.image.Image):
+            mask = mask.array
+        mask = np.asarray(mask)
+        if mask.ndim == 3:
+            mask = mask.any(axis=2)
+        if mask.ndim != 2:
+            raise ValueError("Mask must have 2 or 3 dimensions.")
+
+        self._shape = mask.shape
+        self._bits = np.packbits(mask != 0, axis=1)
+
+    @classmethod
+    def _from_bits(cls, bits, shape):
+        mask = cls.__new__(cls)
+        mask._shape = shape
+        mask._bits = bits
+        return mask
+
+    @property
+    def shape(self):
+        """
+        Returns the shape of the mask (height, width).
+
+        :return: Mask shape
+        :rtype: :class:`tuple`
+        """
+        return self._shape
+
+    @property
+    def nbytes(self):
+        """
+        Returns the size of the packed mask.
+
+        :return: Size in bytes
+        :rtype: :class:`int`
+        """
+        return self._bits.nbytes
+
+    @property
+    def array(self):
+        """
+        Returns the mask as an OpenCV mask (`uint8` array where set pixels are 255).
+
+        :return: Unpacked mask
+        :rtype: :class:`~numpy:numpy.ndarray`
+        """
+        unpacked = np.unpackbits(self._bits, axis=1, count=self._shape[1])
+        return unpacked * np.uint8(255)
+
+    def count(self):
+        """
+        Returns the number of set pixels.
+
+        :return: Number of set pixels
+        :rtype: :class:`int`
+        """
+        return int(BIT_COUNTS[self._bits].sum())
+
+    def bbox(self):
+        """
+        Returns the bounding box of the set pixels, as a 2-tuple with the upper left and \
+        lower right corners (like :class:`~easycv.transforms.spatial.Crop`).
+
+        :return: Bounding box or None if the mask is empty
+        :rtype: :class:`tuple`
+        """
+        rows = np.flatnonzero(self._bits.any(axis=1))
+        if len(rows) == 0:
+            return None
+        columns = np.bitwise_or.reduce(self._bits[rows[0] : rows[-1] + 1], axis=0)
+        columns = np.flatnonzero(np.unpackbits(columns, count=self._shape[1]))
+        return (int(columns[0]), int(rows[0])), (
+            int(columns[-1]) + 1,
+            int(rows[-1]) + 1,
+        )
+
+    def _check_shape(self, other):
+        if not isinstance(other, BinaryMask):
+            return False
+        if other.shape != self._shape:
+            raise ValueError("Masks must have the same shape.")
+        return True
+
+    def __and__(self, other):
+        if not self._check_shape(other):
+            return NotImplemented
+        return BinaryMask._from_bits(self._bits & other._bits, self._shape)
+
+    def __or__(self, other):
+        if not self._check_shape(other):
+            return NotImplemented
+        return BinaryMask._from_bits(self._bits | other._bits, self._shape)
+
+    def __xor__(self, other):
+        if not self._check_shape(other):
+            return NotImplemented
+        return BinaryMask._from_bits(self._bits ^ other._bits, self._shape)
+
+    def __sub__(self, other):
+        if not self._check_shape(other):
+            return NotImplemented
+        return BinaryMask._from_bits(self._bits & ~other._bits, self._shape)
+
+    def __invert__(self):
+        bits = ~self._bits
+        padding = self._bits.shape[1] * 8 - self._shape[1]
+        if padding:  # Bits after the last column must stay clear
+            bits[:, -1] &= np.uint8((0xFF << padding) & 0xFF)
+        return BinaryMask._from_bits(bits, self._shape)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, BinaryMask)
+            and other.shape == self._shape
+            and np.array_equal(other._bits, self._bits)
+        )
+
+    def __repr__(self):
+        return "<binary mask size={}x{} at 0x{}>".format(
+            self._shape[0], self._shape[1], id(self)
+        )
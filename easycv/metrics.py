@@ -0,0 +1,127 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+from easycv.errors.transforms import InvalidMethodError
+
+
+def _data_range(image_array, data_range):
+    if data_range is not None:
+        return data_range
+    if np.issubdtype(image_array.dtype, np.integer):
+        return np.iinfo(image_array.dtype).max
+    return 1.0
+
+
+def _check_shapes(image_array1, image_array2):
+    if image_array1.shape != image_array2.shape:
+        raise ValueError("Images must have the same shape.")
+
+
+def mse(image_array1, image_array2):
+    """
+    Returns the mean squared error between two images.
+
+    :param image_array1: First image as an array
+    :type image_array1: :class:`~numpy:numpy.ndarray`
+    :param image_array2: Second image as an array
+    :type image_array2: :class:`~numpy:numpy.ndarray`
+    :return: Mean squared error
+    :rtype: :class:`float`
+    """
+    _check_shapes(image_array1, image_array2)
+    return cv2.norm(image_array1, image_array2, cv2.NORM_L2SQR) / image_array1.size
+
+
+def psnr(image_array1, image_array2, data_range=None):
+    """
+    Returns the peak signal-to-noise ratio (in dB) between two images. Identical images have \
+    an infinite PSNR.
+
+    :param image_array1: First image as an array
+    :type image_array1: :class:`~numpy:numpy.ndarray`
+    :param image_array2: Second image as an array
+    :type image_array2: :class:`~numpy:numpy.ndarray`
+    :param data_range: Range of the pixel values, defaults to the maximum value of the data \
+    type for integer images and 1 for float images
+    :type data_range: :class:`float`, optional
+    :return: PSNR
+    :rtype: :class:`float`
+    """
+    error = mse(image_array1, image_array2)
+    if error == 0:
+        return float("inf")
+    return float(10 * np.log10(_data_range(image_array1, data_range) ** 2 / error))
+
+
+def ssim(image_array1, image_array2, data_range=None):
+    """
+    Returns the mean structural similarity index between two images. Local statistics are \
+    computed with a separable 11x11 Gaussian window (sigma 1.5) in `float32`, as proposed by \
+    Wang et al. Color images are compared channel by channel and averaged.
+
+    :param image_array1: First image as an array
+    :type image_array1: :class:`~numpy:numpy.ndarray`
+    :param image_array2: Second image as an array
+    :type image_array2: :class:`~numpy:numpy.ndarray`
+    :param data_range: Range of the pixel values, defaults to the maximum value of the data \
+    type for integer images and 1 for float images
+    :type data_range: :class:`float`, optional
+    :return: SSIM (1 for identical images)
+    :rtype: :class:`float`
+    """
+    _check_shapes(image_array1, image_array2)
+    data_range = _data_range(image_array1, data_range)
+    c1, c2 = (0.01 * data_range) ** 2, (0.03 * data_range) ** 2
+
+    def blur(array):
+        return cv2.GaussianBlur(array, (11, 11), 1.5, borderType=cv2.BORDER_REFLECT)
+
+    x = image_array1.astype("float32")
+    y = image_array2.astype("float32")
+    mu_x, mu_y = blur(x), blur(y)
+    mu_xx, mu_yy, mu_xy = mu_x * mu_x, mu_y * mu_y, mu_x * mu_y
+    sigma_xx = blur(x * x) - mu_xx
+    sigma_yy = blur(y * y) - mu_yy
+    sigma_xy = blur(x * y) - mu_xy
+
+    numerator = (2 * mu_xy + c1) * (2 * sigma_xy + c2)
+    denominator = (mu_xx + mu_yy + c1) * (sigma_xx + sigma_yy + c2)
+    return float((numerator / denominator).mean())
+
+
+metrics = {"mse": mse, "psnr": psnr, "ssim": ssim}
+
+
+def compare(image_arrays1, image_arrays2, metric="psnr", workers=None):
+    """
+    Evaluates a metric for multiple pairs of images in parallel. Currently supported metrics:
+    \t**∙ mse** - Mean squared error (:func:`mse`)\n
+    \t**∙ psnr** - Peak signal-to-noise ratio (:func:`psnr`)\n
+    \t**∙ ssim** - Structural similarity index (:func:`ssim`)\n
+
+    :param image_arrays1: Iterable of images as arrays (or of functions returning them)
+    :type image_arrays1: :class:`list`
+    :param image_arrays2: Iterable of images as arrays (or of functions returning them), \
+    compared with the image at the same position of `image_arrays1`
+    :type image_arrays2: :class:`list`
+    :param metric: Metric to evaluate, defaults to psnr
+    :type metric: :class:`str`, optional
+    :param workers: Number of threads, defaults to min(32, number of processors + 4)
+    :type workers: :class:`int`, optional
+    :return: Metric of each pair of images
+    :rtype: :class:`~numpy:numpy.ndarray`
+    """
+    if metric not in metrics:
+        raise InvalidMethodError(metrics)
+
+    def evaluate(image_array1, image_array2):
+        if callable(image_array1):
+            image_array1 = image_array1()
+        if callable(image_array2):
+            image_array2 = image_array2()
+        return metrics[metric](image_array1, image_array2)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return np.array(list(executor.map(evaluate, image_arrays1, image_arrays2)))
@@ -96,3 +96,14 @@ class Operation:
 
     def copy(self):
         return copy(self)
+
+    def share(self):
+        """
+        Moves the :class:`~easycv.image.Image` arguments of the operation (e.g. the image \
+        pasted by :class:`~easycv.transforms.spatial.Paste`) into shared memory, so sending \
+        the operation to other processes doesn't copy them. See \
+        :meth:`~easycv.image.Image.share`.
+        """
+        for value in self._args.values():
+            if isinstance(value, easycv.image.Image):
+                value.share()
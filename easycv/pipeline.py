@@ -1,9 +1,37 @@
 import os
+import re
+import sys
 import pickle
+import inspect
+import itertools
+import keyword
+import linecache
+import importlib.util
+from types import ModuleType
 from copy import deepcopy
 
 from easycv.transforms.base import Transform
-from easycv.errors import InvalidPipelineInputSource
+from easycv.errors import (
+    InvalidPipelineInputSource,
+    MissingArgumentError,
+    UnsupportedExportError,
+    UnsupportedSaveError,
+)
+
+# Numbers the in memory modules of exported functions, so each export has its own module
+_export_ids = itertools.count()
+
+EXPORT_TEMPLATE = """\"\"\"
+Function generated by easycv from the pipeline "{pipeline}".
+\"\"\"
+import cv2
+import numpy as np
+
+
+def {name}(image):
+{body}
+    return image
+"""
 
 
 class Pipeline:
@@ -51,6 +79,7 @@ class Pipeline:
     @staticmethod
     def _calculate_forwards(source):
         outputs = {}
+        produced = {}
         forwards = {}
 
         for i in range(len(source)):
@@ -70,17 +99,29 @@ class Pipeline:
 
                 source[i].initialize(index=i, forwarded=forwards[i].keys())
 
+            elif isinstance(source[i], Branch):
+                for argument in source[i].parameters:
+                    for output_index in reversed(list(produced)):
+                        if argument in produced[output_index]:
+                            forwards[i][argument] = output_index
+                            break
+                    else:
+                        raise MissingArgumentError(argument, index=i)
+
             elif not isinstance(source[i], Pipeline):
                 raise InvalidPipelineInputSource()
 
-            if source[i].outputs:
-                outputs[i] = source[i].outputs
+            # Outputs of a branch are missing when it's skipped, so they are never forwarded
+            if source[i].outputs and not isinstance(source[i], Branch):
+                outputs[i] = source[i].outputs.copy()
+                produced[i] = source[i].outputs
 
         return forwards
 
     def __call__(self, image):
         if self._transforms:
             outputs = {}
+            skipped = []
             for i in range(len(self._transforms)):
                 transform = self._transforms[i]
                 forwarded = {
@@ -88,17 +129,64 @@ class Pipeline:
                 }
                 if isinstance(transform, Transform):
                     output = transform(image, forwarded=forwarded)
+                elif isinstance(transform, Branch):
+                    if transform.evaluate(forwarded):
+                        output = transform.run(image)
+                    else:
+                        output = {"image": image}
+                        skipped.append(i)
                 else:
                     output = transform(image)
 
                 if "image" in output:
                     image = output["image"]
+                if isinstance(transform, Pipeline) and "skipped" in output:
+                    # Branches skipped inside nested pipelines are identified by their path
+                    for index in output["skipped"]:
+                        skipped.append(
+                            (i,) + (index if isinstance(index, tuple) else (index,))
+                        )
 
                 outputs[i] = output
 
-            return outputs[len(self._transforms) - 1]
+            result = outputs[len(self._transforms) - 1]
+            if self._has_branches():
+                result = dict(result, skipped=skipped)
+            return result
         return {"image": image}
 
+    def _has_branches(self):
+        return any(
+            isinstance(t, Branch) or (isinstance(t, Pipeline) and t._has_branches())
+            for t in self._transforms
+        )
+
+    def output_shape(self, shape):
+        """
+        Returns the shape of the image array after applying the **pipeline** to an image with the \
+        given shape, without running any transform. If the shape can't be inferred (for example \
+        when a transform depends on the output of a previous one) None is returned.
+
+        :param shape: Shape of the input image array
+        :type shape: :class:`tuple`
+        :return: Shape of the output image array
+        :rtype: :class:`tuple`
+        """
+        for i, transform in enumerate(self._transforms):
+            if shape is None:
+                return None
+            if isinstance(transform, Branch):
+                if transform.output_shape(shape) != shape:
+                    return None
+            elif isinstance(transform, Pipeline):
+                shape = transform.output_shape(shape)
+            elif not transform.outputs:
+                if self.forwards.get(i):
+                    return None
+                transform.initialize()
+                shape = transform.infer_shape(shape, **transform.args)
+        return shape
+
     @property
     def name(self):
         """
@@ -127,8 +215,8 @@ class Pipeline:
         r = [
             indent
             + index
-            + "Pipeline ({}) with {} transforms".format(
-                self.name, self.num_transforms()
+            + "{} ({}) with {} transforms".format(
+                self.__class__.__name__, self.name, self.num_transforms()
             )
         ]
         for i, t in enumerate(self._transforms):
@@ -193,6 +281,14 @@ class Pipeline:
         """
         return deepcopy(self)
 
+    def share(self):
+        """
+        Moves the :class:`~easycv.image.Image` arguments of all the transforms of the \
+        **pipeline** into shared memory. See :meth:`~easycv.operation.Operation.share`.
+        """
+        for transform in self._transforms:
+            transform.share()
+
     def clear(self):
         """
         Clears the **pipeline** (removes all transforms/pipelines).
@@ -203,14 +299,125 @@ class Pipeline:
         """
         Saves the **pipeline** to a file.
 
+        Pipelines with branches whose predicates can't be pickled (lambdas, nested functions) \
+        raise an :class:`~easycv.errors.UnsupportedSaveError`.
+
         :param filename: Name of the saved file, if not specified pipeline's name will be used
         :type filename: :class:`str`, optional
         """
+        self._check_saveable()
         if not filename:
             filename = "_".join(self._name.lower().split()) + ".pipe"
         with open(filename, "wb") as f:
             pickle.dump(self, f)
 
+    def _check_saveable(self):
+        """
+        Raises an :class:`~easycv.errors.UnsupportedSaveError` if a **branch** predicate \
+        can't be pickled.
+        """
+        for i, transform in enumerate(self._transforms):
+            if isinstance(transform, Branch):
+                try:
+                    pickle.dumps(transform.predicate)
+                except (pickle.PicklingError, AttributeError, TypeError):
+                    raise UnsupportedSaveError(
+                        "the branch predicate can't be pickled, use a module level function",
+                        index=i,
+                    ) from None
+            if isinstance(transform, Pipeline):
+                transform._check_saveable()
+
+    def _export_statements(self):
+        statements = []
+        for i, transform in enumerate(self._transforms):
+            if isinstance(transform, Branch):
+                raise UnsupportedExportError("branches are not supported", index=i)
+            elif isinstance(transform, Pipeline):
+                statements.extend(transform._export_statements())
+                continue
+
+            transform.initialize()
+            if transform.outputs or self.forwards.get(i):
+                raise UnsupportedExportError(
+                    "only transforms that output images are supported", index=i
+                )
+            code = transform.code(**transform.args)
+            if code is None:
+                raise UnsupportedExportError(str(transform), index=i)
+            statements.extend(code.split("\n"))
+        return statements
+
+    def export_source(self, name=None):
+        """
+        Returns the Python source of a standalone function that applies the **pipeline**. The \
+        function calls OpenCV/NumPy directly with the **pipeline** arguments written as \
+        constants, skipping all the transform machinery. Only transforms that output images \
+        can be exported, otherwise an :class:`~easycv.errors.UnsupportedExportError` is raised.
+
+        Exported functions receive and return arrays and don't normalize the output of each \
+        step like transforms do, so they should be used with `uint8` images.
+
+        :param name: Name of the function, defaults to the **pipeline** name
+        :type name: :class:`str`, optional
+        :return: Python source of a module with the function
+        :rtype: :class:`str`
+        """
+        name = re.sub(r"\W", "_", name if name else self._name)
+        if not name or name[0].isdigit() or keyword.iskeyword(name):
+            name = "_" + name
+
+        statements = self._export_statements()
+        body = (
+            "\n".join("    " + line for line in statements)
+            if statements
+            else "    pass"
+        )
+        return EXPORT_TEMPLATE.format(pipeline=self._name, name=name, body=body)
+
+    def export_function(self, name=None, filename=None):
+        """
+        Returns a standalone function that applies the **pipeline** (see \
+        :meth:`~easycv.pipeline.Pipeline.export_source`). The function lives in its own module, \
+        so it can be inspected and pickled by reference. If a filename is given the module is \
+        also written to that file, allowing other processes to import it.
+
+        :param name: Name of the function, defaults to the **pipeline** name
+        :type name: :class:`str`, optional
+        :param filename: File to write the generated module to, defaults to None (in memory)
+        :type filename: :class:`str`, optional
+        :return: The exported function
+        :rtype: :class:`function`
+        """
+        source = self.export_source(name=name)
+        function_name = re.search(r"^def (\w+)\(", source, re.MULTILINE).group(1)
+
+        if filename is not None:
+            with open(filename, "w") as f:
+                f.write(source)
+            module_name = os.path.splitext(os.path.basename(filename))[0]
+            spec = importlib.util.spec_from_file_location(module_name, filename)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+        else:
+            module_name = "easycv_pipeline_{}_{}".format(
+                function_name, next(_export_ids)
+            )
+            filename = "<{}>".format(module_name)
+            module = ModuleType(module_name)
+            module.__file__ = filename
+            linecache.cache[filename] = (
+                len(source),
+                None,
+                source.splitlines(True),
+                filename,
+            )
+            sys.modules[module_name] = module
+            exec(compile(source, filename, "exec"), module.__dict__)
+
+        return getattr(module, function_name)
+
     def __eq__(self, other):
         return (
             isinstance(other, Pipeline)
@@ -224,3 +431,79 @@ class Pipeline:
 
     def __repr__(self):
         return str(self)
+
+
+class Branch(Pipeline):
+    """
+    This class represents a conditional **pipeline** (a **branch**).
+
+    A **branch** is a series of :doc:`transforms <transforms/index>` that only runs when a \
+    predicate is true. The predicate is evaluated on the outputs of previous steps of the \
+    enclosing **pipeline**: each parameter of the predicate receives the most recent output with \
+    the same name. When the predicate is false the image passes through unchanged and the index \
+    of the **branch** is recorded in the ``skipped`` field of the pipeline results (branches \
+    inside nested pipelines are recorded as tuples of indexes, e.g. ``(2, 1)``). The results \
+    are returned when the **pipeline** is called with an image array \
+    (``pipeline(image.array)["skipped"]``), :meth:`~easycv.image.Image.apply` only returns the \
+    resulting image. Outputs of a **branch** aren't forwarded to the following steps, since \
+    they are missing when it's skipped.
+
+    Example: ``Pipeline([Sharpness(), Branch(lambda sharpen: not sharpen, [Sharpen()])])``
+
+    Pipelines are saved with :mod:`pickle`, so pipelines with branches can only be saved if \
+    their predicates are module level functions (lambdas and nested functions can't be \
+    pickled).
+
+    :param predicate: Function that receives previous outputs (by name) and returns `True` if \
+    the branch should run
+    :type predicate: :class:`function`
+    :param source: Branch data source. A list of transforms/pipelines or a path to a \
+    previously saved pipeline
+    :type source: :class:`list`/:class:`str`
+    :param name: Name of the **branch**, "branch" if no name is specified
+    :type name: :class:`str`, optional
+    """
+
+    def __init__(self, predicate, source, name=None):
+        super().__init__(source, name=name if name else "branch")
+        self.predicate = predicate
+        self.parameters = tuple(inspect.signature(predicate).parameters)
+
+    def evaluate(self, forwarded=None):
+        """
+        Evaluates the predicate with the forwarded outputs. If some output required by the \
+        predicate is missing a :class:`~easycv.errors.MissingArgumentError` is raised.
+
+        :param forwarded: Outputs forwarded to the branch, defaults to None
+        :type forwarded: :class:`dict`, optional
+        :return: `True` if the branch should run, `False` otherwise
+        :rtype: :class:`bool`
+        """
+        forwarded = forwarded if forwarded is not None else {}
+        for parameter in self.parameters:
+            if parameter not in forwarded:
+                raise MissingArgumentError(parameter)
+        return bool(self.predicate(**{p: forwarded[p] for p in self.parameters}))
+
+    def run(self, image):
+        """
+        Runs the **branch** transforms without evaluating the predicate.
+
+        :param image: Image represented as an array
+        :type image: :class:`~numpy:numpy.ndarray`
+        :return: Branch results
+        :rtype: :class:`dict`
+        """
+        return super().__call__(image)
+
+    def __call__(self, image, forwarded=None):
+        if self.evaluate(forwarded):
+            return self.run(image)
+        return {"image": image}
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, Branch)
+            and self.predicate == other.predicate
+            and super().__eq__(other)
+        )
@@ -0,0 +1,141 @@
+import threading
+from contextlib import contextmanager
+
+import cv2
+import numpy as np
+
+from easycv.errors.transforms import InvalidMethodError
+
+# Maximum number of representations cached per image (see set_representation_cache_size)
+_cache_size = 4
+
+# Array and cache of the image whose transforms are running in the current thread
+_active = threading.local()
+
+
+def _color(image_array):
+    if len(image_array.shape) == 2:
+        return cv2.cvtColor(image_array, cv2.COLOR_GRAY2BGR)
+    return image_array
+
+
+def _gray(image_array):
+    if len(image_array.shape) == 3:
+        return cv2.cvtColor(image_array, cv2.COLOR_BGR2GRAY)
+    return image_array
+
+
+def _float(image_array):
+    if image_array.dtype == np.uint8:
+        return image_array.astype("float32") / 255
+    return image_array.astype("float32")
+
+
+def _integral(image_array):
+    return cv2.integral(image_array, sdepth=cv2.CV_64F)
+
+
+def _squared_integral(image_array):
+    return cv2.integral2(image_array, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)[1]
+
+
+def _histogram(image_array):
+    if image_array.dtype != np.uint8:
+        raise ValueError("Histograms are only supported for uint8 images.")
+    return np.bincount(image_array.ravel(), minlength=256)
+
+
+converters = {
+    "gray": _gray,
+    "hsv": lambda image_array: cv2.cvtColor(_color(image_array), cv2.COLOR_BGR2HSV),
+    "lab": lambda image_array: cv2.cvtColor(_color(image_array), cv2.COLOR_BGR2LAB),
+    "float": _float,
+    "integral": _integral,
+    "squared_integral": _squared_integral,
+    "histogram": _histogram,
+}
+
+
+def set_representation_cache_size(size):
+    """
+    Sets how many representations are cached per image. The least recently used \
+    representations of an image are dropped first.
+
+    :param size: Maximum number of representations, 0 disables the cache
+    :type size: :class:`int`
+    """
+    global _cache_size
+    _cache_size = size
+
+
+@contextmanager
+def cached(image_array, cache):
+    """
+    Caches the representations of an image array in the given dictionary, inside the \
+    `with` block and in the current thread. :class:`~easycv.image.Image` objects use it to \
+    keep the representations of their array with their other cached values while their \
+    transforms run.
+
+    :param image_array: Image as an array, it must not change while it is cached
+    :type image_array: :class:`~numpy:numpy.ndarray`
+    :param cache: Cached representations by name (ordered from the least recently used)
+    :type cache: :class:`~collections.OrderedDict`
+    """
+    previous = getattr(_active, "cache", None)
+    _active.cache = (image_array, cache)
+    try:
+        yield
+    finally:
+        _active.cache = previous
+
+
+def representation(image_array, name, cache=None):
+    """
+    Returns a representation of an image derived from its array. Representations of the \
+    arrays of :class:`~easycv.image.Image` objects are computed once and cached with the image \
+    (see :func:`cached`) until its array changes, so transforms that need the same conversion \
+    of an image only pay for it once. Cached arrays are read-only. Currently supported \
+    representations:
+    \t**∙ gray** - Grayscale\n
+    \t**∙ hsv** - HSV color space\n
+    \t**∙ lab** - LAB color space\n
+    \t**∙ float** - `float32` array, normalized to [0, 1] for `uint8` images\n
+    \t**∙ integral** - Integral image (summed-area table), one row and column larger than the \
+    image\n
+    \t**∙ squared_integral** - Integral image of the squared pixel values\n
+    \t**∙ histogram** - Number of occurrences of each value (0-255) in a `uint8` image\n
+
+    :param image_array: Image as an array
+    :type image_array: :class:`~numpy:numpy.ndarray`
+    :param name: Name of the representation
+    :type name: :class:`str`
+    :param cache: Cached representations of the array, defaults to the cache of the image \
+    whose transforms are running (if its array is `image_array`)
+    :type cache: :class:`~collections.OrderedDict`, optional
+    :return: Representation of the image
+    :rtype: :class:`~numpy:numpy.ndarray`
+    """
+    if name not in converters:
+        raise InvalidMethodError(converters)
+
+    if cache is None:
+        active = getattr(_active, "cache", None)
+        # Compared by identity, the array is alive while it's cached
+        if active is not None and active[0] is image_array:
+            cache = active[1]
+    if cache is None or _cache_size == 0:
+        return converters[name](image_array)
+
+    converted = cache.get(name)
+    if converted is None:
+        converted = converters[name](image_array)
+        converted.flags.writeable = False
+        cache[name] = converted
+        while len(cache) > _cache_size:
+            cache.popitem(last=False)
+    else:
+        try:
+            cache.move_to_end(name)
+        except KeyError:  # Dropped by another thread
+            pass
+    return converted
@@ -0,0 +1,183 @@
+import numpy as np
+
+from easycv.representations import representation
+
+
+def region_sums(image_array, rectangles, squared=False):
+    """
+    Returns the sum of the pixels of each rectangle using the cached integral image of the \
+    image (see :func:`~easycv.representations.representation`), so each sum costs the same \
+    regardless of the size of the rectangle.
+
+    :param image_array: Image as an array
+    :type image_array: :class:`~numpy:numpy.ndarray`
+    :param rectangles: Rectangles as 2-tuples with the upper left and lower right corners \
+    (like :class:`~easycv.transforms.spatial.Crop`), they are clipped to the image
+    :type rectangles: :class:`list`/:class:`~numpy:numpy.ndarray`
+    :param squared: `True` to sum the squared pixel values, defaults to `False`
+    :type squared: :class:`bool`, optional
+    :return: Sums (one row per rectangle and one column per channel) and areas of the rectangles
+    :rtype: :class:`tuple`
+    """
+    integral = representation(
+        image_array, "squared_integral" if squared else "integral"
+    )
+    height, width = image_array.shape[:2]
+    rectangles = np.asarray(rectangles, dtype="int64").reshape(-1, 4)
+    left, right = np.clip(rectangles[:, 0], 0, width), np.clip(
+        rectangles[:, 2], 0, width
+    )
+    top, bottom = np.clip(rectangles[:, 1], 0, height), np.clip(
+        rectangles[:, 3], 0, height
+    )
+    right, bottom = np.maximum(left, right), np.maximum(top, bottom)
+
+    sums = (
+        integral[bottom, right]
+        - integral[top, right]
+        - integral[bottom, left]
+        + integral[top, left]
+    )
+    if sums.ndim == 1:
+        sums = sums[:, None]
+    return sums, (right - left) * (bottom - top)
+
+
+def region_stats(image_array, rectangles):
+    """
+    Returns the mean and variance of each channel of the pixels inside each rectangle. All \
+    the rectangles are computed at once from the cached integral images of the image, so \
+    thousands of rectangles (sliding windows, detections...) cost about the same as one. \
+    Empty rectangles have a mean and variance of NaN.
+
+    :param image_array: Image as an array
+    :type image_array: :class:`~numpy:numpy.ndarray`
+    :param rectangles: Rectangles as 2-tuples with the upper left and lower right corners \
+    (like :class:`~easycv.transforms.spatial.Crop`), they are clipped to the image
+    :type rectangles: :class:`list`/:class:`~numpy:numpy.ndarray`
+    :return: Means and variances, arrays with one row per rectangle and one column per channel
+    :rtype: :class:`tuple`
+    """
+    sums, areas = region_sums(image_array, rectangles)
+    squared_sums, _ = region_sums(image_array, rectangles, squared=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        areas = areas[:, None].astype("float64")
+        means = sums / areas
+        variances = np.maximum(squared_sums / areas - means ** 2, 0)
+    return means, variances
+
+
+class Histogram:
+    """
+    This class represents the 256-bin histogram of a `uint8` image (all channels together). \
+    Median, percentiles, mean, standard deviation, minimum and maximum are derived from the \
+    histogram, so they don't need a pass over the pixels (or a sort). Use :func:`histogram` \
+    to get the cached histogram of an image.
+
+    :param counts: Number of occurrences of each value (256 values)
+    :type counts: :class:`~numpy:numpy.ndarray`
+    """
+
+    def __init__(self, counts):
+        self._counts = counts
+        self._cumulative = np.cumsum(counts)
+
+    @property
+    def counts(self):
+        """
+        Returns the number of occurrences of each value.
+
+        :return: Histogram counts (256 values)
+        :rtype: :class:`~numpy:numpy.ndarray`
+        """
+        return self._counts
+
+    @property
+    def total(self):
+        """
+        Returns the number of values in the histogram.
+
+        :return: Number of values
+        :rtype: :class:`int`
+        """
+        return int(self._cumulative[-1])
+
+    def _value(self, index):
+        return np.searchsorted(self._cumulative, index, side="right")
+
+    def percentile(self, q):
+        """
+        Returns the q-th percentile of the values, interpolating linearly between the two \
+        nearest values (like :func:`numpy.percentile`).
+
+        :param q: Percentile (0-100)
+        :type q: :class:`float`
+        :return: Percentile value
+        :rtype: :class:`float`
+        """
+        position = q / 100 * (self.total - 1)
+        lower = int(np.floor(position))
+        low, high = self._value(lower), self._value(min(lower + 1, self.total - 1))
+        return float(low + (position - lower) * (high - low))
+
+    def median(self):
+        """
+        Returns the median of the values.
+
+        :return: Median
+        :rtype: :class:`float`
+        """
+        return self.percentile(50)
+
+    def mean(self):
+        """
+        Returns the mean of the values.
+
+        :return: Mean
+        :rtype: :class:`float`
+        """
+        return float(np.dot(self._counts, np.arange(256)) / self.total)
+
+    def std(self):
+        """
+        Returns the standard deviation of the values.
+
+        :return: Standard deviation
+        :rtype: :class:`float`
+        """
+        values = np.arange(256) - self.mean()
+        return float(np.sqrt(np.dot(self._counts, values ** 2) / self.total))
+
+    def min(self):
+        """
+        Returns the minimum value.
+
+        :return: Minimum
+        :rtype: :class:`int`
+        """
+        return int(np.flatnonzero(self._counts)[0])
+
+    def max(self):
+        """
+        Returns the maximum value.
+
+        :return: Maximum
+        :rtype: :class:`int`
+        """
+        return int(np.flatnonzero(self._counts)[-1])
+
+
+def histogram(image_array):
+    """
+    Returns the histogram of a `uint8` image. Histograms are only cached per image when \
+    computed through :meth:`Image.histogram <easycv.image.Image.histogram>` (or by transforms \
+    applied to an image), like other \
+    :func:`representations <easycv.representations.representation>`. Otherwise they're \
+    computed on every call.
+
+    :param image_array: Image as an array
+    :type image_array: :class:`~numpy:numpy.ndarray`
+    :return: Image histogram
+    :rtype: :class:`Histogram`
+    """
+    return Histogram(representation(image_array, "histogram"))
@@ -17,6 +17,9 @@ class Metadata(type):
         "method_name",
         "methods",
         "default_method",
+        "code",
+        "infer_shape",
+        "writes_input",
     }
 
     def __dir__(cls):
@@ -26,6 +29,8 @@ class Metadata(type):
 class Transform(Operation, metaclass=Metadata):
     methods = None
     default_method = None
+    # True if process changes the input array (it receives a private copy)
+    writes_input = False
     method_name = "method"
 
     def __init__(self, **kwargs):
@@ -56,7 +61,7 @@ class Transform(Operation, metaclass=Metadata):
                 if output.dtype.kind != "i":
                     if output.min() >= 0 and output.max() <= 1:
                         output = output * 255
-                    output = output.astype("uint8")
+                    output = output.astype("uint8", copy=False)
             else:
                 output = cv2.normalize(output, None, 0, 255, cv2.NORM_MINMAX).astype(
                     "uint8"
@@ -146,8 +151,35 @@ class Transform(Operation, metaclass=Metadata):
     def process(self, image, **kwargs):
         pass
 
+    def infer_shape(self, shape, **kwargs):
+        """
+        Returns the shape of the image array after applying the transform to an image with the \
+        given shape, without running the transform. This allows lazy images to know their size \
+        without being computed. Transforms that can't infer their output shape return None.
+
+        :param shape: Shape of the input image array
+        :type shape: :class:`tuple`
+        :return: Shape of the output image array
+        :rtype: :class:`tuple`
+        """
+        return None
+
+    def code(self, **kwargs):
+        """
+        Returns Python source that applies the transform to an array named ``image`` by calling \
+        OpenCV/NumPy directly, using the given argument values. The source is used to export \
+        pipelines to plain functions (see :meth:`~easycv.pipeline.Pipeline.export_function`). \
+        Transforms that can't be exported return None.
+
+        :return: Python statements that update ``image``
+        :rtype: :class:`str`
+        """
+        return None
+
     def run(self, image, forwarded=None):
         self.initialize()
+        if self.writes_input and not image.flags.writeable:
+            image = image.copy()
         if forwarded is None:
             args = self._args
         else:
@@ -6,8 +6,9 @@ from color_transfer import color_transfer
 from easycv.validators import Option, List, Number, Image
 from easycv.transforms.base import Transform
 from easycv.transforms.selectors import Select
-from easycv.transforms.spatial import Crop
 from easycv.resources import get_resource
+from easycv.representations import representation
+from easycv.statistics import region_stats
 
 
 class GrayScale(Transform):
@@ -16,10 +17,13 @@ class GrayScale(Transform):
     """
 
     def process(self, image, **kwargs):
-        if len(image.shape) == 3:
-            return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        else:
-            return image
+        return representation(image, "gray")
+
+    def code(self, **kwargs):
+        return "if len(image.shape) == 3:\n    image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)"
+
+    def infer_shape(self, shape, **kwargs):
+        return shape[:2]
 
 
 class Sepia(Transform):
@@ -32,6 +36,9 @@ class Sepia(Transform):
         sepia = np.array([153 / 255 * gray, 204 / 255 * gray, gray])
         return sepia.transpose(1, 2, 0).astype("uint8")
 
+    def infer_shape(self, shape, **kwargs):
+        return shape[:2] + (3,)
+
 
 class FilterChannels(Transform):
     """
@@ -48,6 +55,8 @@ class FilterChannels(Transform):
         "scheme": Option(["rgb", "bgr"], default=0),
     }
 
+    writes_input = True
+
     def process(self, image, **kwargs):
         channels = np.array(kwargs["channels"])
         if kwargs["scheme"] == "rgb":
@@ -56,6 +65,9 @@ class FilterChannels(Transform):
             image[:, :, channels] = 0
         return image
 
+    def infer_shape(self, shape, **kwargs):
+        return shape
+
 
 class GammaCorrection(Transform):
     """
@@ -75,6 +87,9 @@ class GammaCorrection(Transform):
         ).astype("uint8")
         return cv2.LUT(image, table)
 
+    def infer_shape(self, shape, **kwargs):
+        return shape
+
 
 class Negative(Transform):
     """
@@ -84,6 +99,12 @@ class Negative(Transform):
     def process(self, image, **kwargs):
         return 255 - image
 
+    def code(self, **kwargs):
+        return "image = 255 - image"
+
+    def infer_shape(self, shape, **kwargs):
+        return shape
+
 
 class Cartoon(Transform):
     """
@@ -105,6 +126,9 @@ class Cartoon(Transform):
             image, sigma_s=kwargs["smoothing"], sigma_r=kwargs["region_size"]
         )
 
+    def infer_shape(self, shape, **kwargs):
+        return shape[:2] + (3,)
+
 
 class PhotoSketch(Transform):
     """
@@ -112,11 +136,21 @@ class PhotoSketch(Transform):
     """
 
     def process(self, image, **kwargs):
-        img_gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        img_gray = representation(image, "gray")
         img_blur = cv2.GaussianBlur(img_gray, (21, 21), 0, 0)
         img_blend = cv2.divide(img_gray, img_blur, scale=256)
         return img_blend
 
+    def code(self, **kwargs):
+        return (
+            "img_gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)\n"
+            "img_blur = cv2.GaussianBlur(img_gray, (21, 21), 0, 0)\n"
+            "image = cv2.divide(img_gray, img_blur, scale=256)"
+        )
+
+    def infer_shape(self, shape, **kwargs):
+        return shape[:2]
+
 
 class ColorTransfer(Transform):
     """
@@ -133,6 +167,9 @@ class ColorTransfer(Transform):
     def process(self, image, **kwargs):
         return color_transfer(kwargs["source"].array, image)
 
+    def infer_shape(self, shape, **kwargs):
+        return shape
+
 
 class Hue(Transform):
     """
@@ -147,10 +184,13 @@ class Hue(Transform):
     }
 
     def process(self, image, **kwargs):
-        image = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+        image = representation(image, "hsv").copy()
         image[:, :, 0] = (image[:, :, 0] + kwargs["value"]) % 180
         return cv2.cvtColor(image, cv2.COLOR_HSV2BGR)
 
+    def infer_shape(self, shape, **kwargs):
+        return shape
+
 
 class Contrast(Transform):
     """
@@ -168,6 +208,14 @@ class Contrast(Transform):
         image = cv2.addWeighted(image, kwargs["alpha"], image, 0, 0)
         return image
 
+    def code(self, **kwargs):
+        return "image = cv2.addWeighted(image, {!r}, image, 0, 0)".format(
+            kwargs["alpha"]
+        )
+
+    def infer_shape(self, shape, **kwargs):
+        return shape
+
 
 class Brightness(Transform):
     """
@@ -185,6 +233,14 @@ class Brightness(Transform):
         image = cv2.addWeighted(image, 1, image, 0, kwargs["beta"])
         return image
 
+    def code(self, **kwargs):
+        return "image = cv2.addWeighted(image, 1, image, 0, {!r})".format(
+            kwargs["beta"]
+        )
+
+    def infer_shape(self, shape, **kwargs):
+        return shape
+
 
 class Hsv(Transform):
     """
@@ -192,7 +248,13 @@ class Hsv(Transform):
     """
 
     def process(self, image, **kwargs):
-        return cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+        return representation(image, "hsv")
+
+    def code(self, **kwargs):
+        return "image = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)"
+
+    def infer_shape(self, shape, **kwargs):
+        return shape
 
 
 class ColorPick(Transform):
@@ -217,10 +279,8 @@ class ColorPick(Transform):
             return {"color": list(image[point[1]][point[0]][::-1])}
         if kwargs["method"] == "rectangle":
             rectangle = Select(method="rectangle").apply(image)["rectangle"]
-            cropped = Crop(rectangle=rectangle).apply(image)
-            return {
-                "color": list(cropped.mean(axis=(1, 0)).round().astype("uint8"))[::-1]
-            }
+            means, _ = region_stats(image, [rectangle])
+            return {"color": list(means[0].round().astype("uint8"))[::-1]}
 
 
 class Colorize(Transform):
@@ -229,8 +289,6 @@ class Colorize(Transform):
     """
 
     def process(self, image, **kwargs):
-        image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
-
         proto = get_resource("colorization_zhang", "colorization_deploy_v2.prototxt")
         model = get_resource("colorization_zhang", "colorization_release_v2.caffemodel")
         pts = np.load(str(get_resource("colorization_zhang", "pts_in_hull.npy")))
@@ -242,7 +300,7 @@ class Colorize(Transform):
         net.getLayer(class8).blobs = [pts.astype("float32")]
         net.getLayer(conv8).blobs = [np.full([1, 313], 2.606, dtype="float32")]
 
-        scaled = image.astype("float32") / 255.0
+        scaled = cv2.cvtColor(representation(image, "float"), cv2.COLOR_GRAY2BGR)
         lab = cv2.cvtColor(scaled, cv2.COLOR_BGR2LAB)
         resized = cv2.resize(lab, (224, 224))
         L = cv2.split(resized)[0] - 50
@@ -255,6 +313,9 @@ class Colorize(Transform):
         colorized = cv2.cvtColor(colorized, cv2.COLOR_LAB2BGR)
         return (255 * np.clip(colorized, 0, 1)).astype("uint8")
 
+    def infer_shape(self, shape, **kwargs):
+        return shape[:2] + (3,)
+
 
 class Quantitization(Transform):
     """
@@ -270,7 +331,7 @@ class Quantitization(Transform):
 
     def process(self, image, **kwargs):
         (h, w) = image.shape[:2]
-        image = cv2.cvtColor(image, cv2.COLOR_BGR2LAB)
+        image = representation(image, "lab")
         image = image.reshape((image.shape[0] * image.shape[1], 3))
 
         clt = MiniBatchKMeans(n_clusters=kwargs["clusters"])
@@ -281,3 +342,6 @@ class Quantitization(Transform):
         quant = cv2.cvtColor(quant, cv2.COLOR_LAB2BGR)
 
         return quant
+
+    def infer_shape(self, shape, **kwargs):
+        return shape
@@ -6,6 +6,7 @@ from easycv.transforms.color import GrayScale
 from easycv.transforms.spatial import Crop
 from easycv.transforms.edges import Canny
 from easycv.resources import get_resource
+from easycv.representations import representation
 import easycv.transforms.filter
 from easycv.validators import Type, List, Number, File
 
@@ -65,7 +66,7 @@ class CascadeDetector(Transform):
 
     def process(self, image, **kwargs):
         cascade = cv2.CascadeClassifier(kwargs["cascade"])
-        gray = GrayScale().apply(image)
+        gray = representation(image, "gray")
         detections = cascade.detectMultiScale(
             gray,
             scaleFactor=kwargs["scale"],
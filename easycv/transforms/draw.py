@@ -155,6 +155,8 @@ class Draw(Transform):
         ),
     }
 
+    writes_input = True
+
     def process(self, image, **kwargs):
         if len(image.shape) < 3:
             kwargs["color"] = (
@@ -236,3 +238,6 @@ class Draw(Transform):
             for rectangle in kwargs.pop("rectangles"):
                 image = cv.rectangle(image, rectangle[0], rectangle[1], **kwargs)
             return image
+
+    def infer_shape(self, shape, **kwargs):
+        return shape
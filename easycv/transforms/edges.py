@@ -3,7 +3,8 @@ import numpy as np
 
 from easycv.validators import Number, Option
 from easycv.transforms.base import Transform
-from easycv.transforms.color import GrayScale
+from easycv.representations import representation
+from easycv.statistics import histogram
 
 
 class Gradient(Transform):
@@ -35,7 +36,7 @@ class Gradient(Transform):
     }
 
     def process(self, image, **kwargs):
-        image = GrayScale().apply(image)
+        image = representation(image, "gray")
         if kwargs["method"] == "sobel":
             if kwargs["axis"] == "both":
                 x = cv2.Sobel(image, cv2.CV_64F, 1, 0, ksize=kwargs["size"])
@@ -51,6 +52,9 @@ class Gradient(Transform):
             kernel = np.ones((kwargs["size"], kwargs["size"]), np.uint8)
             return cv2.morphologyEx(image, cv2.MORPH_GRADIENT, kernel)
 
+    def infer_shape(self, shape, **kwargs):
+        return shape[:2]
+
 
 class GradientAngle(Transform):
     """
@@ -67,11 +71,14 @@ class GradientAngle(Transform):
     }
 
     def process(self, image, **kwargs):
-        image = GrayScale().apply(image)
+        image = representation(image, "gray")
         x = cv2.Sobel(image, cv2.CV_64F, 1, 0, ksize=kwargs["size"])
         y = cv2.Sobel(image, cv2.CV_64F, 0, 1, ksize=kwargs["size"])
         return np.arctan2(x, y)
 
+    def infer_shape(self, shape, **kwargs):
+        return shape[:2]
+
 
 class Canny(Transform):
     """
@@ -97,12 +104,40 @@ class Canny(Transform):
     }
 
     def process(self, image, **kwargs):
+        if "auto" in (kwargs["low"], kwargs["high"]):
+            v = histogram(image).median()
         if kwargs["low"] == "auto":
-            v = np.median(image)
             kwargs["low"] = int(max(0, (1.0 - kwargs["sigma"]) * v))
         if kwargs["high"] == "auto":
-            v = np.median(image)
             kwargs["high"] = int(min(255, (1.0 + kwargs["sigma"]) * v))
         return cv2.Canny(
             image, kwargs["low"], kwargs["high"], apertureSize=kwargs["size"]
         )
+
+    def code(self, **kwargs):
+        lines = []
+        if kwargs["low"] == "auto":
+            lines.append(
+                "low = int(max(0, {!r} * np.median(image)))".format(
+                    1.0 - kwargs["sigma"]
+                )
+            )
+        else:
+            lines.append("low = {!r}".format(kwargs["low"]))
+        if kwargs["high"] == "auto":
+            lines.append(
+                "high = int(min(255, {!r} * np.median(image)))".format(
+                    1.0 + kwargs["sigma"]
+                )
+            )
+        else:
+            lines.append("high = {!r}".format(kwargs["high"]))
+        lines.append(
+            "image = cv2.Canny(image, low, high, apertureSize={!r})".format(
+                kwargs["size"]
+            )
+        )
+        return "\n".join(lines)
+
+    def infer_shape(self, shape, **kwargs):
+        return shape[:2]
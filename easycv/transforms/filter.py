@@ -65,6 +65,29 @@ class Blur(Transform):
                 image, kwargs["size"], kwargs["sigma_color"], kwargs["sigma_space"]
             )
 
+    def code(self, **kwargs):
+        size = kwargs["size"]
+        if kwargs["method"] == "gaussian":
+            if size == "auto":
+                size = 2 * int(kwargs["sigma"] * kwargs["truncate"] + 0.5) + 1
+            return "image = cv2.GaussianBlur(image, ({0!r}, {0!r}), {1!r})".format(
+                size, kwargs["sigma"]
+            )
+        elif kwargs["method"] == "bilateral":
+            size = 5 if size == "auto" else size
+            return "image = cv2.bilateralFilter(image, {!r}, {!r}, {!r})".format(
+                size, kwargs["sigma_color"], kwargs["sigma_space"]
+            )
+        elif size == "auto":
+            return None
+        elif kwargs["method"] == "uniform":
+            return "image = cv2.blur(image, ({0!r}, {0!r}))".format(size)
+        else:
+            return "image = cv2.medianBlur(image, {!r})".format(size)
+
+    def infer_shape(self, shape, **kwargs):
+        return shape
+
 
 class Sharpness(Transform):
     """
@@ -99,11 +122,10 @@ class Sharpness(Transform):
         grayscale = GrayScale().apply(image)
 
         if kwargs["method"] == "laplace":
-            sharpness = (
-                easycv.transforms.edges.Gradient(method="laplace")
-                .apply(grayscale)
-                .var()
+            laplacian = easycv.transforms.edges.Gradient(method="laplace").apply(
+                grayscale
             )
+            sharpness = cv2.meanStdDev(laplacian)[1][0][0] ** 2
         else:
             h, w = grayscale.shape
             centerx, centery = (int(w / 2.0), int(h / 2.0))
@@ -141,3 +163,6 @@ class Sharpen(Transform):
     def process(self, image, **kwargs):
         kwargs["radius"] = kwargs.pop("sigma")
         return unsharp_mask(image, preserve_range=True, **kwargs)
+
+    def infer_shape(self, shape, **kwargs):
+        return shape
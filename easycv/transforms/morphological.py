@@ -25,6 +25,15 @@ class Erode(Transform):
         kernel = np.ones((kwargs["size"], kwargs["size"]), np.uint8)
         return cv2.erode(image, kernel, iterations=kwargs["iterations"])
 
+    def code(self, **kwargs):
+        return (
+            "image = cv2.erode(image, np.ones(({0!r}, {0!r}), np.uint8), "
+            "iterations={1!r})".format(kwargs["size"], kwargs["iterations"])
+        )
+
+    def infer_shape(self, shape, **kwargs):
+        return shape
+
 
 class Dilate(Transform):
     """
@@ -45,6 +54,15 @@ class Dilate(Transform):
         kernel = np.ones((kwargs["size"], kwargs["size"]), np.uint8)
         return cv2.dilate(image, kernel, iterations=kwargs["iterations"])
 
+    def code(self, **kwargs):
+        return (
+            "image = cv2.dilate(image, np.ones(({0!r}, {0!r}), np.uint8), "
+            "iterations={1!r})".format(kwargs["size"], kwargs["iterations"])
+        )
+
+    def infer_shape(self, shape, **kwargs):
+        return shape
+
 
 class Morphology(Transform):
     """
@@ -78,3 +96,14 @@ class Morphology(Transform):
             kernel,
             iterations=kwargs["iterations"],
         )
+
+    def code(self, **kwargs):
+        return (
+            "image = cv2.morphologyEx(image, {0!r}, np.ones(({1!r}, {1!r}), np.uint8), "
+            "iterations={2!r})".format(
+                morp_methods[kwargs["method"]], kwargs["size"], kwargs["iterations"]
+            )
+        )
+
+    def infer_shape(self, shape, **kwargs):
+        return shape
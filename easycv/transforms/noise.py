@@ -62,3 +62,6 @@ class Noise(Transform):
         if kwargs["mode"] == "sp":
             kwargs["mode"] = "s&p"
         return random_noise(image, **kwargs)
+
+    def infer_shape(self, shape, **kwargs):
+        return shape
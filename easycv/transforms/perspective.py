@@ -44,3 +44,11 @@ class Perspective(Transform):
         warped = cv2.warpPerspective(image, shift_matrix, (new_width, new_height))
 
         return warped
+
+    def infer_shape(self, shape, **kwargs):
+        if len(kwargs["points"]) != 4:
+            return None
+        tl, tr, br, bl = order_corners(kwargs["points"])
+        new_width = max(distance(br, bl), distance(tr, tl))
+        new_height = max(distance(tr, br), distance(tl, bl))
+        return (new_height, new_width) + shape[2:]
@@ -6,10 +6,10 @@ import matplotlib as mpl
 import matplotlib.pyplot as plt
 from matplotlib.widgets import RectangleSelector, EllipseSelector
 
-import easycv.image
+from easycv.mask import BinaryMask
 from easycv.transforms.base import Transform
 from easycv.errors import InvalidSelectionError
-from easycv.validators import Number, List, Type, Image
+from easycv.validators import Number, List, Type, Mask as MaskValidator
 from easycv.io.output import prepare_image_to_output
 
 
@@ -63,7 +63,7 @@ class Select(Transform):
         # point
         "points": List(List(Number(min_value=0, only_integer=True), length=2)),
         # mask
-        "mask": Image(),
+        "mask": MaskValidator(),
     }
 
     def process(self, image, **kwargs):
@@ -109,7 +109,7 @@ class Select(Transform):
             mask = cv2.cvtColor(mask, cv2.COLOR_BGR2GRAY)
             mask[mask != 0] = 255
 
-            return {"mask": easycv.image.Image(mask)}
+            return {"mask": BinaryMask(mask)}
 
         mpl.use("Qt5Agg")
 
@@ -204,7 +204,7 @@ class Mask(Transform):
     Mask applies a mask to an image.
 
     :param mask: Mask to apply
-    :type brush: :class:`Image`
+    :type mask: :class:`~easycv.mask.BinaryMask`/:class:`~easycv.image.Image`
     :param inverse: Inverts mask
     :type inverse: :class:`bool`
     :param fill_color: Color to fill
@@ -212,7 +212,7 @@ class Mask(Transform):
     """
 
     arguments = {
-        "mask": Image(),
+        "mask": MaskValidator(),
         "inverse": Type(bool, default=False),
         "fill_color": List(
             Number(only_integer=True, min_value=0, max_value=255),
@@ -233,6 +233,9 @@ class Mask(Transform):
 
         return image
 
+    def infer_shape(self, shape, **kwargs):
+        return shape
+
 
 class Inpaint(Transform):
     """
@@ -241,7 +244,7 @@ class Inpaint(Transform):
     :param radius: Inpainting radius
     :type radius: :class:`int`
     :param mask: Mask to apply inpaint
-    :type mask: :class:`Image`
+    :type mask: :class:`~easycv.mask.BinaryMask`/:class:`~easycv.image.Image`
     """
 
     methods = {
@@ -252,10 +255,13 @@ class Inpaint(Transform):
 
     arguments = {
         "radius": Number(only_integer=True, min_value=0, default=3),
-        "mask": Image(),
+        "mask": MaskValidator(),
     }
 
     def process(self, image, **kwargs):
         flag = cv2.INPAINT_TELEA if kwargs["method"] == "telea" else cv2.INPAINT_NS
 
         return cv2.inpaint(image, kwargs["mask"].array, kwargs["radius"], flags=flag)
+
+    def infer_shape(self, shape, **kwargs):
+        return shape
@@ -8,6 +8,35 @@ from easycv.utils import interpolation_methods
 from easycv.errors.transforms import InvalidArgumentError
 
 
+def pyramid_resize(image, width, height):
+    """
+    Downscales an image by halving it with area interpolation while it is at least twice as \
+    large as the output, then resizing the last level with area interpolation. Images are \
+    halved to `((width + 1) // 2, (height + 1) // 2)`, like the levels of \
+    :meth:`~easycv.image.Image.pyramid`, so images can start from their cached levels.
+    """
+    min_height, min_width = 2 * max(height, 1), 2 * max(width, 1)
+    while (image.shape[0] + 1) // 2 >= min_height and (
+        image.shape[1] + 1
+    ) // 2 >= min_width:
+        size = ((image.shape[1] + 1) // 2, (image.shape[0] + 1) // 2)
+        image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    return cv2.resize(image, (width, height), interpolation=cv2.INTER_AREA)
+
+
+def _pyramid_code(width, height):
+    """
+    Returns the code of :func:`pyramid_resize`, given the code of the output width and height.
+    """
+    return (
+        "while (image.shape[0] + 1) // 2 >= 2 * max({height}, 1) and "
+        "(image.shape[1] + 1) // 2 >= 2 * max({width}, 1):\n"
+        "    size = ((image.shape[1] + 1) // 2, (image.shape[0] + 1) // 2)\n"
+        "    image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)\n"
+        "image = cv2.resize(image, ({width}, {height}), interpolation=cv2.INTER_AREA)"
+    ).format(width=width, height=height)
+
+
 class Resize(Transform):
     """
     Resize is a transform that resizes an image to a given width and height. Currently supported \
@@ -18,6 +47,9 @@ class Resize(Transform):
     \t**∙ area** - Pixel area relation interpolation\n
     \t**∙ cubic** - Bicubic interpolation (4x4 pixel neighborhood)\n
     \t**∙ lanczos4** - Lanczos interpolation (8x8 pixel neighborhood)\n
+    \t**∙ pyramid** - Repeated halving followed by area interpolation (see \
+    :func:`pyramid_resize`), fast for large downscales. Images reuse their cached \
+    :meth:`~easycv.image.Image.pyramid` levels\n
     :param width: Output image width
     :type width: :class:`int`
     :param height: Output image height
@@ -26,7 +58,7 @@ class Resize(Transform):
     :type method: :class:`str`, optional
     """
 
-    methods = ["auto", "nearest", "linear", "area", "cubic", "lanczos4"]
+    methods = ["auto", "nearest", "linear", "area", "cubic", "lanczos4", "pyramid"]
     default_method = "auto"
     arguments = {
         "width": Number(min_value=0, only_integer=True),
@@ -34,6 +66,8 @@ class Resize(Transform):
     }
 
     def process(self, image, **kwargs):
+        if kwargs["method"] == "pyramid":
+            return pyramid_resize(image, kwargs["width"], kwargs["height"])
         if kwargs["method"] == "auto":
             if image.shape[1] * image.shape[0] < kwargs["width"] * kwargs["height"]:
                 kwargs["method"] = "cubic"
@@ -46,6 +80,25 @@ class Resize(Transform):
             interpolation=interpolation_methods[kwargs["method"]],
         )
 
+    def code(self, **kwargs):
+        resize = "image = cv2.resize(image, ({!r}, {!r}), interpolation=cv2.INTER_{})"
+        size = (kwargs["width"], kwargs["height"])
+        if kwargs["method"] == "pyramid":
+            return _pyramid_code(*map(repr, size))
+        if kwargs["method"] == "auto":
+            return (
+                "if image.shape[1] * image.shape[0] < {!r}:\n    ".format(
+                    size[0] * size[1]
+                )
+                + resize.format(*size, "CUBIC")
+                + "\nelse:\n    "
+                + resize.format(*size, "AREA")
+            )
+        return resize.format(*size, kwargs["method"].upper())
+
+    def infer_shape(self, shape, **kwargs):
+        return (kwargs["height"], kwargs["width"]) + shape[2:]
+
 
 class Rescale(Transform):
     """
@@ -57,6 +110,9 @@ class Rescale(Transform):
         \t**∙ area** - Pixel area relation interpolation\n
         \t**∙ cubic** - Bicubic interpolation (4x4 pixel neighborhood)\n
         \t**∙ lanczos4** - Lanczos interpolation (8x8 pixel neighborhood)\n
+        \t**∙ pyramid** - Repeated halving followed by area interpolation (see \
+        :func:`pyramid_resize`), fast for large downscales. Images reuse their cached \
+        :meth:`~easycv.image.Image.pyramid` levels\n
         :param fx: Scale factor along the horizontal axis
         :type fx: :class:`float`
         :param fy: Scale factor along the vertical axis
@@ -65,7 +121,7 @@ class Rescale(Transform):
         :type method: :class:`str`, optional
     """
 
-    methods = ["auto", "nearest", "linear", "area", "cubic", "lanczos4"]
+    methods = ["auto", "nearest", "linear", "area", "cubic", "lanczos4", "pyramid"]
     default_method = "auto"
     arguments = {
         "fx": Number(min_value=0),
@@ -73,6 +129,9 @@ class Rescale(Transform):
     }
 
     def process(self, image, **kwargs):
+        if kwargs["method"] == "pyramid":
+            height, width = self.infer_shape(image.shape, **kwargs)[:2]
+            return pyramid_resize(image, width, height)
         if kwargs["method"] == "auto":
             if kwargs["fx"] * kwargs["fy"] > 1:
                 kwargs["method"] = "cubic"
@@ -87,6 +146,28 @@ class Rescale(Transform):
             interpolation=interpolation_methods[kwargs["method"]],
         )
 
+    def code(self, **kwargs):
+        method = kwargs["method"]
+        if method == "pyramid":
+            return (
+                "width = int(round(image.shape[1] * {fx!r}))\n"
+                "height = int(round(image.shape[0] * {fy!r}))\n".format(**kwargs)
+                + _pyramid_code("width", "height")
+            )
+        if method == "auto":
+            method = "cubic" if kwargs["fx"] * kwargs["fy"] > 1 else "area"
+        return (
+            "image = cv2.resize(image, (0, 0), fx={!r}, fy={!r}, "
+            "interpolation=cv2.INTER_{})".format(
+                kwargs["fx"], kwargs["fy"], method.upper()
+            )
+        )
+
+    def infer_shape(self, shape, **kwargs):
+        height = int(round(shape[0] * kwargs["fy"]))
+        width = int(round(shape[1] * kwargs["fx"]))
+        return (height, width) + shape[2:]
+
 
 class Rotate(Transform):
     """
@@ -136,6 +217,17 @@ class Rotate(Transform):
 
         return cv2.warpAffine(image, matrix, (w, h))
 
+    def infer_shape(self, shape, **kwargs):
+        if not kwargs["original"]:
+            return shape
+        (h, w) = shape[:2]
+        matrix = cv2.getRotationMatrix2D(
+            (w / 2, h / 2), -kwargs["degrees"], kwargs["scale"]
+        )
+        cos = np.abs(matrix[0, 0])
+        sin = np.abs(matrix[0, 1])
+        return (int((h * cos) + (w * sin)), int((h * sin) + (w * cos))) + shape[2:]
+
 
 class Crop(Transform):
     """
@@ -181,6 +273,18 @@ class Crop(Transform):
         else:
             return image[ty:by, lx:rx]
 
+    def code(self, **kwargs):
+        if kwargs["original"]:
+            return None
+        (lx, ty), (rx, by) = kwargs["rectangle"]
+        return "image = image[{!r}:{!r}, {!r}:{!r}]".format(ty, by, lx, rx)
+
+    def infer_shape(self, shape, **kwargs):
+        if kwargs["original"]:
+            return shape
+        (lx, ty), (rx, by) = kwargs["rectangle"]
+        return (len(range(shape[0])[ty:by]), len(range(shape[1])[lx:rx])) + shape[2:]
+
 
 class Translate(Transform):
     """
@@ -204,6 +308,15 @@ class Translate(Transform):
 
         return cv2.warpAffine(image, matrix, (width, height))
 
+    def code(self, **kwargs):
+        return (
+            "image = cv2.warpAffine(image, np.float32([[1, 0, {!r}], [0, 1, {!r}]]), "
+            "(image.shape[1], image.shape[0]))".format(kwargs["x"], kwargs["y"])
+        )
+
+    def infer_shape(self, shape, **kwargs):
+        return shape
+
 
 class Mirror(Transform):
     """
@@ -225,6 +338,13 @@ class Mirror(Transform):
         if kwargs["axis"] == "both":
             return cv2.flip(image, -1)
 
+    def code(self, **kwargs):
+        flip_codes = {"x": 0, "y": 1, "both": -1}
+        return "image = cv2.flip(image, {!r})".format(flip_codes[kwargs["axis"]])
+
+    def infer_shape(self, shape, **kwargs):
+        return shape
+
 
 class Paste(Transform):
     """
@@ -243,6 +363,8 @@ class Paste(Transform):
         ),
     }
 
+    writes_input = True
+
     def process(self, image, **kwargs):
         rect = kwargs["rectangle"]
         paste = kwargs["paste"]
@@ -251,3 +373,6 @@ class Paste(Transform):
         paste = paste.apply(Resize(width=width, height=height)).array
         image[rect[0][1] : rect[1][1], rect[0][0] : rect[1][0], :] = paste
         return image
+
+    def infer_shape(self, shape, **kwargs):
+        return shape
@@ -3,6 +3,7 @@ import re
 import numpy as np
 from pathlib import Path
 import easycv.image
+import easycv.mask
 
 from easycv.errors import (
     InvalidArgumentError,
@@ -348,3 +349,17 @@ class Image(Validator):
 
     def accepts(self, other):
         return isinstance(other, Image)
+
+
+class Mask(Validator):
+    """
+    Validator to check if an argument is a mask, a :class:`~easycv.mask.BinaryMask` or an \
+    image.
+    """
+
+    def validate(self, value):
+        if not isinstance(value, (easycv.mask.BinaryMask, easycv.image.Image)):
+            raise ValidatorError("be a mask or an image")
+
+    def accepts(self, other):
+        return isinstance(other, (Mask, Image))
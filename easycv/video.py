@@ -9,6 +9,15 @@ import os
 import shutil
 
 
+# Transform applied by the worker processes (sent once per worker instead of once per task)
+_transform = None
+
+
+def _set_transform(transform):
+    global _transform
+    _transform = transform
+
+
 def generate_ffmpeg_cmd(width, height, fps, preset):
     ffmpeg_bin = "ffmpeg"
     command = [
@@ -91,7 +100,7 @@ class Video:
             if frame is None:
                 break
 
-            frame = info["transform"].apply(frame)
+            frame = _transform.apply(frame)
             if len(frame.shape) == 2:
                 frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
 
@@ -121,14 +130,14 @@ class Video:
 
         cmd = generate_ffmpeg_cmd(width, height, self.fps, preset)
 
-        p = mp.Pool(num_processes)
+        transform.share()
+        p = mp.Pool(num_processes, initializer=_set_transform, initargs=(transform,))
         chunks = self._create_chunks(num_processes, self.total_frames)
         info = []
         for chunk in chunks:
             chunk_info = {
                 "start": chunk[0],
                 "end": chunk[1],
-                "transform": transform,
                 "name": name,
                 "cmd": cmd,
             }
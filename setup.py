@@ -24,9 +24,9 @@ setup(
     setup_requires=["setuptools>=38.6.0"],
     packages=find_packages(),
     package_data={"easycv": ["resources/sources/*.yaml"]},
-    python_requires=">=3.5",
+    python_requires=">=3.8",
     install_requires=[
-        "numpy",
+        "numpy>=1.22",
         "pillow",
         "requests",
         "matplotlib",
@@ -45,9 +45,9 @@ setup(
         "Topic :: Software Development :: Build Tools",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.5",
-        "Programming Language :: Python :: 3.6",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
     ],
 )
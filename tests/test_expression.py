@@ -0,0 +1,24 @@
+import cv2
+import numpy as np
+
+from easycv import Image
+from easycv.expression import Expression
+from easycv.transforms import Blur
+
+
+def test_expression():
+    a = Image("tests/images/lenna.png")
+    b = a.apply(Blur(size=9))
+    blend = a * 0.5 + b * 0.5
+    assert isinstance(blend, Expression) and isinstance(0.5 * a, Expression)
+    assert blend.compute().array.dtype == np.uint8
+    assert np.array_equal((a + b).array, cv2.add(a.array, b.array))
+    assert np.array_equal((a - b).array, cv2.subtract(a.array, b.array))
+    assert np.array_equal((a / b).array, cv2.divide(a.array, b.array))
+    difference = cv2.absdiff(a.array, b.array)
+    assert np.array_equal(abs(a - b).array, difference)
+    assert np.array_equal(
+        (abs(a - b) > 30).array, cv2.compare(difference, 30, cv2.CMP_GT)
+    )
+    float_array = a.array.astype("float32")
+    assert np.allclose((a * float_array).array, float_array * float_array)
@@ -0,0 +1,59 @@
+import numpy as np
+
+from easycv import Image, List
+from easycv.hashing import image_hash, hamming_distance, HashIndex
+from easycv.transforms import GrayScale, Blur
+
+
+def test_hash():
+    image = Image("tests/images/lenna.png")
+    gray = image.apply(GrayScale())
+    for method in ["dhash", "ahash", "phash", "whash"]:
+        assert image.hash(method=method) == gray.hash(method=method)
+        assert image.hash(method=method) < 2 ** 64
+    assert image.hash(hash_size=16) < 2 ** 256
+    assert isinstance(image_hash(image.array), np.uint64)
+
+
+def test_hashes():
+    image = Image("tests/images/lenna.png")
+    images = List(
+        [image, image.apply(Blur(size=5)), Image("tests/images/lenna.png", lazy=True)]
+    )
+    hashes = images.hashes(method="phash")
+    assert hashes.dtype == np.uint64 and hashes[0] == image.hash(method="phash")
+    assert hamming_distance(hashes[0], hashes[1]) < 10
+    assert list(hamming_distance(hashes[0], hashes)) == [
+        0,
+        hamming_distance(*hashes[:2]),
+        0,
+    ]
+    assert images.hashes(hash_size=16).shape == (3, 32)
+
+
+def test_hash_index(tmp_path):
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 2 ** 63, 100, dtype="int64").astype("uint64")
+    flips = rng.integers(0, 2 ** 63, (100, 10), dtype="int64").astype("uint64")
+    flips &= rng.integers(0, 2 ** 63, (100, 10), dtype="int64").astype("uint64")
+    hashes = (base[:, None] ^ (flips & flips >> np.uint64(7))).ravel()
+
+    index = HashIndex(buffer_size=100)
+    index.extend(hashes[:500])
+    for h in hashes[500:]:
+        index.add(h)
+    assert len(index) == 1000
+
+    for distance in [0, 5, 12]:
+        result = index.query(base[3], max_distance=distance)
+        expected = np.flatnonzero(hamming_distance(base[3], hashes) <= distance)
+        assert sorted(label for label, _ in result) == expected.tolist()
+        assert [d for _, d in result] == sorted(d for _, d in result)
+
+    index.save(str(tmp_path / "index.npz"))
+    loaded = HashIndex.load(str(tmp_path / "index.npz"))
+    assert loaded.query(base[3], 12) == index.query(base[3], 12)
+
+    images = List([Image("tests/images/lenna.png"), Image("tests/images/lenna.png")])
+    index = HashIndex.from_list(images, labels=["a", "b"])
+    assert index.query(images[0].hash()) == [("a", 0), ("b", 0)]
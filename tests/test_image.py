@@ -1,6 +1,14 @@
-from easycv import Image, Pipeline
+import pickle
+
+import cv2
+import numpy as np
+
+from easycv import Image, List, Pipeline
+from easycv.io.storage import set_decoded_cache_size
+from easycv.representations import representation, set_representation_cache_size
 from easycv.transforms.color import GrayScale, FilterChannels
 from easycv.transforms.filter import Blur
+from easycv.transforms.spatial import Resize, Crop
 
 
 def test_image():
@@ -36,6 +44,25 @@ def test_width():
     assert image.width == 512
 
 
+def test_lazy_shape():
+    image = Image("tests/images/lenna.png", lazy=True)
+    image = image.apply(GrayScale()).apply(Resize(width=100, height=60))
+    image = image.apply(Crop(rectangle=[(10, 0), (200, 30)]))
+    assert (image.height, image.width, image.channels) == (30, 90, 1)
+    assert not image.loaded
+    assert image.array.shape == (30, 90)
+
+
+def test_decode_pushdown(tmp_path):
+    path = str(tmp_path / "lenna.jpg")
+    Image("tests/images/lenna.png").save(path)
+    image = Image(path, lazy=True)
+    image = image.apply(GrayScale()).apply(Resize(width=100, height=60))
+    assert image.array.shape == (60, 100)
+    eager = Image(path).apply(GrayScale()).apply(Resize(width=100, height=60))
+    assert abs(image.array.astype("int") - eager.array).mean() < 2
+
+
 def test_compute():
     image = Image("tests/images/lenna.png", lazy=True)
     image = image.apply(GrayScale())
@@ -52,3 +79,154 @@ def test_apply():
     image2 = image.apply(Blur()).apply(GrayScale())
     image = image.apply(pipe)
     assert image == image2
+
+
+def test_bytes():
+    image = Image("tests/images/lenna.png")
+    buffer = image.to_bytes()
+    assert len(buffer) == 32 + 512 * 512 * 3
+    assert Image.from_bytes(buffer) == image
+    assert Image.from_bytes(image.to_bytes(codec="png")) == image
+    gray = image.apply(GrayScale())
+    assert Image.from_bytes(memoryview(gray.to_bytes())).array.shape == (512, 512)
+    assert Image.decode(gray.encode()) == gray
+
+
+def test_encoded_bytes():
+    image = Image("tests/images/lenna.png")
+    with open("tests/images/lenna.png", "rb") as f:
+        data = f.read()
+    assert Image.from_bytes(data) == image
+    lazy = Image.from_bytes(memoryview(data), lazy=True)
+    assert not lazy.loaded and lazy.height == 512
+    assert pickle.loads(pickle.dumps(lazy.apply(Blur()))) == image.apply(Blur())
+    jpeg = cv2.imencode(".jpg", image.array)[1].tobytes()
+    images = List.from_bytes([data, image.to_bytes(), jpeg])
+    assert len(images) == 3 and images[0] == images[1] == image
+
+
+def test_digest():
+    image = Image("tests/images/lenna.png")
+    digest = image.digest
+    assert digest == Image("tests/images/lenna.png", lazy=True).digest
+    image.apply(Blur(), in_place=True)
+    assert image.digest != digest
+    assert image.digest == image.compute(in_place=False).digest
+
+
+def test_pyramid():
+    image = Image("tests/images/lenna.png")
+    pyramid = image.pyramid(levels=4)
+    assert [level.height for level in pyramid] == [512, 256, 128, 64]
+    assert pyramid[0] is image
+    assert len(image.pyramid(method="gaussian")) == 10
+    # Cached pyramids aren't pickled
+    assert len(pickle.dumps(image)) < image.array.nbytes * 1.1
+    direct = cv2.resize(image.array, (100, 60), interpolation=cv2.INTER_AREA)
+    assert np.array_equal(image.apply(Resize(width=100, height=60)).array, direct)
+
+    # Pyramid resizes give the same output eagerly (from cached levels), lazily and exported
+    resize = Resize(width=100, height=60, method="pyramid")
+    resized = image.apply(resize)
+    assert resized.array.shape == (60, 100, 3)
+    lazy = Image("tests/images/lenna.png", lazy=True).apply(resize).compute()
+    assert np.array_equal(resized.array, lazy.array)
+    assert np.array_equal(resized.array, Pipeline([resize])(image.array)["image"])
+    assert np.array_equal(
+        resized.array, Pipeline([resize]).export_function()(image.array)
+    )
+    assert abs(resized.array.astype("int") - direct).mean() < 2
+
+
+def test_copy_on_write():
+    image = Image("tests/images/lenna.png")
+    original = image.array
+    assert not original.flags.writeable
+    assert np.shares_memory(Image(original).array, original)
+    array = np.zeros((4, 4, 3), dtype="uint8")
+    owned = Image(array)
+    array[:] = 7
+    assert owned.array.max() == 0 and owned == Image(np.zeros((4, 4, 3), dtype="uint8"))
+    filtered = image.apply(FilterChannels(channels=[0]))
+    assert filtered.array[:, :, 2].max() == 0 and image.array is original
+    copy = image.compute(in_place=False)
+    assert np.shares_memory(copy.array, original)
+
+
+def test_representation():
+    image = Image("tests/images/lenna.png")
+    gray = image.representation("gray")
+    assert gray is image.representation("gray")
+    assert gray is image.apply(GrayScale()).array
+    assert image.representation("float").max() <= 1
+    image.apply(Blur(), in_place=True)
+    assert image.representation("gray") is not gray
+
+    # Only the representations of images are cached, at most cache size per image
+    array = image.array
+    assert representation(array, "gray") is not representation(array, "gray")
+    set_representation_cache_size(1)
+    try:
+        gray = image.representation("gray")
+        image.representation("hsv")
+        assert image.representation("gray") is not gray
+    finally:
+        set_representation_cache_size(4)
+
+
+def test_compressed_storage():
+    image = Image("tests/images/lenna.png")
+    compressed = Image("tests/images/lenna.png", storage="compressed")
+    assert compressed._compressed.nbytes < image.array.nbytes
+    assert compressed.height == image.height and compressed == image
+    set_decoded_cache_size(0)
+    assert np.array_equal(compressed.array, image.array)
+    set_decoded_cache_size(16)
+    assert pickle.loads(pickle.dumps(compressed)) == image
+    blurred = compressed.apply(Blur())
+    assert blurred.storage == "compressed" and blurred == image.apply(Blur())
+    images = List([image], storage="compressed")
+    assert images[0].storage == "compressed" and image.storage == "memory"
+    assert images.apply(Blur())[0].storage == "compressed"
+    assert images[0].set_storage("memory")._compressed is None
+
+    # Compressed images don't cache arrays derived from the pixels
+    compressed.apply(Resize(width=100, height=60, method="pyramid"))
+    compressed.representation("gray")
+    assert set(compressed._cache) <= {"digest"}
+    image.pyramid(levels=3)
+    assert set(image.set_storage("compressed")._cache) <= {"digest"}
+
+
+def test_interop():
+    image = Image("tests/images/lenna.png")
+    assert np.shares_memory(np.asarray(image), image.array)
+    assert np.array(image, dtype="float32").dtype == np.float32
+    assert not np.asarray(image).flags.writeable
+    interfaced = np.asarray(
+        Image(image.array).apply(Crop(rectangle=((0, 0), (10, 20))))
+    )
+    assert interfaced.shape == (20, 10, 3) and not interfaced.flags.writeable
+    exported = np.from_dlpack(image)
+    assert np.array_equal(exported, image.array)
+    # Exported read-only or as a copy, never as a writeable alias
+    assert not exported.flags.writeable or not np.shares_memory(exported, image.array)
+    assert np.shares_memory(np.asarray(image.__buffer__(0)), image.array)
+    data = image.array.tobytes()
+    buffered = Image.from_buffer(data, image.array.shape)
+    assert buffered == image and np.shares_memory(
+        buffered.array, np.frombuffer(data, "uint8")
+    )
+    assert not np.shares_memory(
+        Image.from_buffer(data, (512, 512, 3), copy=True).array, data
+    )
+
+    # Writable buffers/tensors are copied, changing them doesn't change the image
+    data = bytearray(data)
+    buffered = Image.from_buffer(data, image.array.shape)
+    data[:] = bytes(len(data))
+    assert buffered == image
+    tensor = np.zeros((4, 4, 3), dtype="uint8")
+    tensored = Image.from_dlpack(tensor)
+    tensor[:] = 7
+    assert tensored.array.max() == 0
@@ -0,0 +1,233 @@
+import io
+import os
+import pickle
+import threading
+import multiprocessing as mp
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+import numpy as np
+
+from easycv import Image, List
+from easycv.errors.io import ImageDownloadError
+from easycv.io import http
+from easycv.io.cache import URLCache
+from easycv.io.discovery import discover_images, count_images
+from easycv.io.header import read_image_size
+from easycv.io.tiles import TileStore
+from easycv.transforms.perspective import Perspective
+from easycv.transforms.spatial import Crop, Resize
+
+
+def test_read_image_size():
+    image = np.zeros((30, 45, 3), dtype="uint8")
+    for extension in [".png", ".jpg", ".webp", ".bmp"]:
+        encoded = cv2.imencode(extension, image)[1].tobytes()
+        assert read_image_size(io.BytesIO(encoded)) == (30, 45)
+    assert read_image_size(io.BytesIO(b"not an image")) is None
+
+
+def _array_sum(image):
+    return int(image.array.sum())
+
+
+def test_shared_image():
+    image = Image("tests/images/lenna.png")
+    shared = Image("tests/images/lenna.png")
+    shared.pyramid(levels=3)
+    shared.share()
+    assert len(pickle.dumps(shared)) < 1000
+    assert pickle.loads(pickle.dumps(shared)) == image
+    assert not shared.array.flags.writeable
+
+    with ProcessPoolExecutor(1, mp_context=mp.get_context("spawn")) as executor:
+        assert executor.submit(_array_sum, shared).result() == int(image.array.sum())
+
+
+def test_tile_store(tmp_path):
+    image = Image("tests/images/lenna.png")
+    store = TileStore.create(str(tmp_path), image.array, tile_size=128)
+    assert store.levels == 3 and store.level_shape(2) == (128, 128, 3)
+
+    region = Image(store, lazy=True).region(((100, 50), (200, 120)))
+    assert region == image.region(((100, 50), (200, 120)))
+    assert sorted(store._tiles) == [(0, 0, 0), (0, 0, 1)]
+    assert Image(store, lazy=True).region(((0, 0), (64, 64)), level=2).width == 64
+
+    crop = Crop(rectangle=[[300, 10], [400, 90]])
+    assert Image(store, lazy=True).apply(crop).compute() == image.apply(crop)
+    perspective = Perspective(points=[[20, 30], [200, 40], [210, 220], [10, 200]])
+    assert Image(store, lazy=True).apply(perspective).compute() == image.apply(
+        perspective
+    )
+    resize = Resize(width=50, height=40, method="pyramid")
+    resized = Image(store, lazy=True).apply(resize).compute()
+    assert np.array_equal(resized.array, Image(store).apply(resize).array)
+    assert pickle.loads(pickle.dumps(store)).shape == (512, 512, 3)
+
+
+def test_discover_images(tmp_path):
+    image = np.zeros((8, 8, 3), dtype="uint8")
+    for name in ["b.png", "a.jpg", "sub/c.png", "sub/deeper/d.png", "skip/e.png"]:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        cv2.imwrite(str(tmp_path / name), image)
+    (tmp_path / "fake.png").write_bytes(b"not an image")
+    (tmp_path / "notes.txt").write_text("not an image")
+
+    def names(**kwargs):
+        paths = discover_images(str(tmp_path), **kwargs)
+        return [
+            os.path.relpath(path, str(tmp_path)).replace(os.sep, "/") for path in paths
+        ]
+
+    assert names() == ["a.jpg", "b.png", "fake.png"]
+    assert names(magic=True) == ["a.jpg", "b.png"]
+    assert names(recursive=True, exclude=["skip"], include=["*.png"]) == [
+        "b.png",
+        "fake.png",
+        "sub/c.png",
+        "sub/deeper/d.png",
+    ]
+    assert names(recursive=True, max_depth=1, magic=True) == [
+        "a.jpg",
+        "b.png",
+        "skip/e.png",
+        "sub/c.png",
+    ]
+    assert count_images(str(tmp_path), extensions=None) == 4
+
+    # Text starting like a portable bitmap, and a link creating a cycle
+    (tmp_path / "skip/plan.png").write_bytes(b"Plan")
+    (tmp_path / "skip/p1.png").write_bytes(b"P1anned")
+    os.symlink(str(tmp_path), str(tmp_path / "sub/loop"))
+    assert names(recursive=True, include=["skip/*"], magic=True) == ["skip/e.png"]
+    assert count_images(str(tmp_path), recursive=True) == 8
+
+
+def test_http(tmp_path):
+    with open(
+        os.path.join(os.path.dirname(__file__), "images", "lenna.png"), "rb"
+    ) as f:
+        data = f.read()
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(self.path)
+            # The first request of /flaky fails, so it only succeeds if retried
+            flaky = self.path == "/flaky" and requests.count("/flaky") == 1
+            if self.path == "/missing" or flaky:
+                self.send_response(503 if flaky else 404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = "http://127.0.0.1:{}/".format(server.server_address[1])
+    http.configure(pool_size=4, retries=2, backoff=0, timeout=5)
+    try:
+        assert http.fetch(url + "flaky") == data
+        assert requests.count("/flaky") == 2
+        assert http.fetch_all([url + str(i) for i in range(8)]) == [data] * 8
+        try:
+            http.fetch(url + "missing")
+            assert False
+        except ImageDownloadError:
+            pass
+
+        reference = Image(
+            os.path.join(os.path.dirname(__file__), "images", "lenna.png")
+        )
+        assert np.array_equal(Image(url + "lenna").array, reference.array)
+        images = List([url + str(i) for i in range(6)], lazy=True, workers=3)
+        assert len(images) == 6
+        assert all(np.array_equal(image.array, reference.array) for image in images)
+    finally:
+        server.shutdown()
+        server.server_close()
+        http.configure()
+
+
+def test_url_cache(tmp_path):
+    with open(
+        os.path.join(os.path.dirname(__file__), "images", "lenna.png"), "rb"
+    ) as f:
+        data = f.read()
+    statuses = []
+    failing = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if failing:
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if self.headers.get("If-None-Match") == '"v1"':
+                statuses.append(304)
+                self.send_response(304)
+                self.end_headers()
+                return
+            statuses.append(200)
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = "http://127.0.0.1:{}/".format(server.server_address[1])
+    cache = URLCache(str(tmp_path / "cache"), max_size=int(2.5 * len(data)))
+    http.set_cache(cache)
+    http.configure(retries=1, backoff=0, timeout=5)
+    try:
+        assert http.fetch(url + "a") == data
+        assert http.fetch(url + "a") == data
+        assert statuses == [200, 304]
+        assert cache.get(url + "a")[0]["etag"] == '"v1"'
+
+        reference = Image(
+            os.path.join(os.path.dirname(__file__), "images", "lenna.png")
+        )
+        assert np.array_equal(Image(url + "a", lazy=True).array, reference.array)
+
+        # Only the 2 most recently used files fit in the cache
+        http.fetch(url + "b")
+        http.fetch(url + "a")
+        http.fetch(url + "c")
+        assert cache.get(url + "b") is None
+        assert cache.get(url + "a") is not None
+        assert cache.size <= cache.max_size
+        assert not [name for name in os.listdir(cache.path) if name.startswith(".tmp-")]
+
+        # Cached files are used when the server keeps failing
+        failing.append(True)
+        assert http.fetch(url + "a") == data
+        try:
+            http.fetch(url + "d")
+            assert False
+        except ImageDownloadError:
+            pass
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # Cached files are used when the server can't be reached
+    try:
+        assert http.fetch(url + "a") == data
+    finally:
+        http.set_cache(None)
+        http.configure()
@@ -1,11 +1,21 @@
-from easycv import List
+import pytest
+
+from easycv import Image, List
 from easycv.transforms import GrayScale, Blur
 
-testlist = List.random(2)
-lazy_test_list = List.random(2, lazy=True)
+
+# Random lists are downloaded once, and only by the tests that use them
+@pytest.fixture(scope="module")
+def testlist():
+    return List.random(2)
+
+
+@pytest.fixture(scope="module")
+def lazy_test_list():
+    return List.random(2, lazy=True)
 
 
-def test_random():
+def test_random(testlist):
     test_list = testlist.copy()
     assert len(test_list) == 2
 
@@ -15,12 +25,12 @@ def test_start_shutdown():
     List.shutdown()
 
 
-def test_index():
+def test_index(testlist):
     test_list = testlist.copy()
     assert len(test_list[:1]) == 1
 
 
-def test_apply():
+def test_apply(testlist):
     test_list = testlist.copy()
     t = test_list.apply(GrayScale())
     assert len(t) == 2
@@ -29,7 +39,7 @@ def test_apply():
     assert id(t) != id(t2)
 
 
-def test_compute():
+def test_compute(lazy_test_list):
     test_list = lazy_test_list.copy()
     assert not test_list[0].loaded
     test_list.apply(Blur(), in_place=True)
@@ -40,7 +50,7 @@ def test_compute():
     assert len(test_list) == 2
 
 
-def parallel():
+def parallel(testlist, lazy_test_list):
     test_list = testlist.copy()
     t = test_list.apply(GrayScale(), parallel=True)
     assert len(t) == 2
@@ -57,3 +67,16 @@ def parallel():
     assert test_list[0].pending.num_transforms() == 0
     assert len(test_list) == 2
     List.shutdown()
+
+
+def test_folder(tmp_path):
+    image = Image("tests/images/lenna.png")
+    for i in range(4):
+        image.save(str(tmp_path / "{}.png".format(i)))
+    (tmp_path / "notes.txt").write_text("not an image")
+
+    lazy_list = List(str(tmp_path), lazy=True, workers=2, prefetch=2)
+    assert len(lazy_list) == 4 and not any(i.loaded for i in lazy_list._images)
+    assert all(i.loaded and i == image for i in lazy_list)
+    assert not any(i.loaded for i in lazy_list._images)
+    assert len(List(str(tmp_path), workers=2)) == 4
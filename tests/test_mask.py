@@ -0,0 +1,33 @@
+import pickle
+
+import cv2
+import numpy as np
+
+from easycv import Image
+from easycv.mask import BinaryMask
+from easycv.transforms import Mask, Inpaint
+
+
+def test_binary_mask():
+    array = np.zeros((50, 61), dtype="uint8")
+    cv2.rectangle(array, (10, 5), (40, 20), 255, -1)
+    mask = BinaryMask(array)
+    assert np.array_equal(mask.array, array) and mask.nbytes * 7 < array.nbytes
+    assert len(pickle.dumps(mask)) * 4 < len(pickle.dumps(array))
+    assert mask.count() == 31 * 16 and mask.bbox() == ((10, 5), (41, 21))
+    assert BinaryMask(np.zeros((5, 5))).bbox() is None
+
+    other = BinaryMask(np.pad(np.ones((10, 10)), ((30, 10), (30, 21))))
+    assert np.array_equal((mask | other).array, np.maximum(array, other.array))
+    assert (mask & other).count() == 0 and (mask ^ other).count() == mask.count() + 100
+    assert (~mask).count() == 50 * 61 - mask.count() and ~~mask == mask
+    assert mask - mask == BinaryMask(np.zeros((50, 61)))
+
+
+def test_mask_transforms():
+    image = Image("tests/images/lenna.png")
+    array = np.zeros(image.array.shape[:2], dtype="uint8")
+    cv2.circle(array, (250, 250), 60, 255, -1)
+    for transform in (Mask, Inpaint):
+        expected = image.apply(transform(mask=Image(array)))
+        assert image.apply(transform(mask=BinaryMask(array))) == expected
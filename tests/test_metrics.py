@@ -0,0 +1,26 @@
+import numpy as np
+
+from easycv import Image, List
+from easycv.metrics import mse, psnr, ssim
+from easycv.transforms import Blur
+
+
+def test_metrics():
+    image = Image("tests/images/lenna.png").array
+    blurred = Image(image).apply(Blur(size=5)).array
+    assert mse(image, image) == 0 and psnr(image, image) == float("inf")
+    assert np.isclose(
+        mse(image, blurred), ((image.astype(float) - blurred) ** 2).mean()
+    )
+    assert np.isclose(
+        psnr(image, blurred), 10 * np.log10(255 ** 2 / mse(image, blurred))
+    )
+    assert np.isclose(ssim(image, image), 1) and 0 < ssim(image, blurred) < 1
+
+
+def test_list_compare():
+    images = List([Image("tests/images/lenna.png")] * 3)
+    outputs = images.apply(Blur(size=5))
+    scores = images.compare(outputs, metric="ssim")
+    assert scores.shape == (3,) and np.allclose(scores, scores[0])
+    assert np.all(images.compare(images, metric="mse") == 0)
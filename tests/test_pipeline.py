@@ -1,7 +1,12 @@
 import os
+import pickle
 
-from easycv.pipeline import Pipeline
-from easycv.transforms import Blur, Noise
+import cv2
+import pytest
+
+from easycv.errors import UnsupportedSaveError
+from easycv.pipeline import Pipeline, Branch
+from easycv.transforms import Blur, Noise, Sharpness, GrayScale, Resize
 
 
 def test_name():
@@ -51,3 +56,65 @@ def test_save():
     p2 = Pipeline("test.pipe")
     assert p == p2
     os.remove("test.pipe")
+
+
+def not_sharp(sharpen):
+    return not sharpen
+
+
+def test_save_branch():
+    p = Pipeline([Sharpness(), Branch(not_sharp, [Blur()])], name="test")
+    p.save()
+    assert Pipeline("test.pipe") == p
+    os.remove("test.pipe")
+
+    branch = Branch(lambda sharpen: sharpen, [Blur()])
+    p = Pipeline([Blur(), Pipeline([Sharpness(), branch])])
+    with pytest.raises(UnsupportedSaveError):
+        p.save("test.pipe")
+    assert not os.path.exists("test.pipe")
+
+
+def test_branch():
+    image = cv2.imread("tests/images/lenna.png")
+    p = Pipeline(
+        [Sharpness(threshold=0), Branch(lambda sharpen: not sharpen, [Blur()])]
+    )
+    result = p(image)
+    assert result["skipped"] == [1]
+    assert (result["image"] == image).all()
+
+    p = Pipeline(
+        [Sharpness(threshold=1e9), Branch(lambda sharpen: not sharpen, [Blur()])]
+    )
+    result = p(image)
+    assert result["skipped"] == []
+    assert (result["image"] == Blur().apply(image)).all()
+
+    inner = Pipeline(
+        [Sharpness(threshold=0), Branch(lambda sharpen: not sharpen, [Blur()])]
+    )
+    assert Pipeline([Blur(), inner])(image)["skipped"] == [(1, 1)]
+
+    # Outputs of branches aren't forwarded, the last branch uses the first Sharpness
+    p = Pipeline(
+        [
+            Sharpness(threshold=0),
+            Branch(lambda sharpen: sharpen, [Sharpness(threshold=1e9)]),
+            Branch(lambda sharpen: not sharpen, [Blur()]),
+        ]
+    )
+    assert p(image)["skipped"] == [2]
+
+
+def test_export_function():
+    image = cv2.imread("tests/images/lenna.png")
+    p = Pipeline([GrayScale(), Blur(), Resize(width=100, height=80)], name="export")
+    function = p.export_function()
+    assert (function(image) == p(image)["image"]).all()
+    assert pickle.loads(pickle.dumps(function)) is function
+
+    # Exporting again with the same name doesn't replace the module of the first function
+    other = Pipeline([Blur()], name="export").export_function()
+    assert pickle.loads(pickle.dumps(function)) is function
+    assert pickle.loads(pickle.dumps(other)) is other
@@ -0,0 +1,32 @@
+import numpy as np
+
+from easycv import Image
+from easycv.statistics import region_stats
+
+
+def test_region_stats():
+    image = Image("tests/images/lenna.png")
+    rectangles = [[[10, 20], [110, 70]], [[0, 0], [512, 512]], [[500, 500], [600, 600]]]
+    means, variances = image.region_stats(rectangles)
+    assert means.shape == variances.shape == (3, 3)
+    region = image.array[20:70, 10:110].reshape(-1, 3)
+    assert np.allclose(means[0], region.mean(axis=0))
+    assert np.allclose(variances[0], region.var(axis=0))
+    assert np.allclose(means[2], image.array[500:, 500:].reshape(-1, 3).mean(axis=0))
+    assert np.isnan(region_stats(image.array, [[[5, 5], [5, 9]]])[0]).all()
+
+
+def test_histogram():
+    image = Image("tests/images/lenna.png")
+    histogram = image.histogram()
+    assert (
+        histogram is not image.histogram()
+        and histogram.counts is image.histogram().counts
+    )
+    array = image.array
+    assert histogram.median() == np.median(array)
+    assert histogram.percentile(90) == np.percentile(array, 90)
+    assert np.isclose(histogram.mean(), array.mean()) and np.isclose(
+        histogram.std(), array.std()
+    )
+    assert (histogram.min(), histogram.max()) == (array.min(), array.max())